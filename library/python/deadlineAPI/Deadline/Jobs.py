@@ -1,14 +1,39 @@
 from __future__ import annotations
 
+import array
+import bisect
+import codecs
 import copy
+import dataclasses
 import datetime
 import enum
+import functools
 import getpass
+import io
+import itertools
+import json
+import linecache
+import math
+import mmap
 import os
 import re
 import logging
+import struct
+import sys
+import tempfile
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOG = logging.getLogger(__name__)
 
 #########################################
@@ -60,20 +85,23 @@ class JobScheduledType(enum.Enum):
     Custom = 3
 
 
-@dataclass
+# The dependency and path mapping dataclasses are immutable, so that
+# edits replace the items of the (tracked) job lists, e.g. via
+# dataclasses.replace(dependency, Notes="..."), and are part of the change set.
+@dataclass(frozen=True)
 class BaseDependency:
     Notes: str
     IgnoreFrameOffsets: bool
 
 
-@dataclass
+@dataclass(frozen=True)
 class OffsetDependency(BaseDependency):
     OverrideFrameOffsets: bool
     StartOffset: int
     EndOffset: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class JobDependency(OffsetDependency):
     JobID: str
     OverrideResumeOn: bool
@@ -83,19 +111,19 @@ class JobDependency(OffsetDependency):
     ResumeOnPercentageCompleted: bool
     ResumeOnPercentageValue: float
 
-@dataclass
+@dataclass(frozen=True)
 class AssetDependency(OffsetDependency):
     FileName: str
     IsFrameAware: bool
     FrameString: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScriptDependency(OffsetDependency):
     FileName: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class PathMappingRule:
     Path: str
     WindowsPath: str
@@ -107,16 +135,57 @@ class PathMappingRule:
 
 
 class DateTime:
+    """An immutable date time value. It is invalid (disabled),
+    if it is created without arguments or parsed from an invalid value.
+    """
+
+    __slots__ = ("_datetime", "_valid", "_formatted")
+
+    # This is a predefined constant from the WebAPI
+    _disabled = "0001-01-01T00:00:00Z"
+
     def __init__(self, *args, **kwargs) -> None:
-        super().__init__()
-        # This is a predefined constant from the WebAPI
-        self._disabled = "0001-01-01T00:00:00Z"
         if not len(args) and not len(kwargs):
-            self._datetime = None
-            self._valid = False
+            record = None
         else:
-            self._datetime = datetime.datetime(*args, **kwargs)
-            self._valid = True
+            record = datetime.datetime(*args, **kwargs)
+        object.__setattr__(self, "_datetime", record)
+        object.__setattr__(self, "_valid", record is not None)
+        object.__setattr__(self, "_formatted", None)
+
+    @classmethod
+    def _fromRecord(cls, record, formatted=None) -> DateTime:
+        value = object.__new__(cls)
+        object.__setattr__(value, "_datetime", record)
+        object.__setattr__(value, "_valid", record is not None)
+        object.__setattr__(value, "_formatted", formatted)
+        return value
+
+    def __setattr__(self, __name: str, __value: any) -> None:
+        raise AttributeError("'{}' object is immutable".format(type(self).__name__))
+
+    def __delattr__(self, __name: str) -> None:
+        raise AttributeError("'{}' object is immutable".format(type(self).__name__))
+
+    def __copy__(self) -> DateTime:
+        return self
+
+    def __deepcopy__(self, memo) -> DateTime:
+        return self
+
+    def __reduce__(self):
+        return (type(self)._fromRecord, (self._datetime, self._formatted))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DateTime):
+            return NotImplemented
+        return self._datetime == other._datetime
+
+    def __hash__(self) -> int:
+        return hash(self._datetime)
+
+    def __repr__(self) -> str:
+        return "DateTime('{}')".format(self.format())
 
     def valid(self):
         """Check if the time is configured correctly.
@@ -131,40 +200,99 @@ class DateTime:
         Returns:
             datetime.datetime | None: The time record.
         """
-        if self._valid:
-            return self._datetime
-        else:
-            return None
+        return self._datetime
 
-    def parse(self, value: str):
-        """Parse the given time.
+    @classmethod
+    def parse(cls, value: str) -> DateTime:
+        """Parse the given time. The WebAPI's disabled
+        constant resolves to a shared invalid instance.
         Args:
             value (str): A iso formatted time.
+        Returns:
+            DateTime: The time, it is invalid if the value could not be parsed.
         """
+        if value == cls._disabled:
+            return cls._DISABLED
         try:
-            self._datetime = datetime.time.fromisoformat(value)
-            self._valid = True
-        except ValueError:
-            self._valid = False
+            # Python < 3.11 does not support the UTC designator.
+            if value[-1:] == "Z":
+                record = datetime.datetime.fromisoformat(value[:-1] + "+00:00")
+            else:
+                record = datetime.datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return cls._DISABLED
+        # The value is kept as is, so that it round-trips unchanged.
+        return cls._fromRecord(record, value)
 
     def format(self):
         """Format the defined time.
         Returns:
             str: A iso formatted time.
         """
-        if not self._valid:
-            return self._disabled
-        else:
-            return self._datetime.isoformat()
+        formatted = self._formatted
+        if formatted is None:
+            formatted = (
+                self._datetime.isoformat() if self._valid else DateTime._disabled
+            )
+            object.__setattr__(self, "_formatted", formatted)
+        return formatted
+
+
+DateTime._DISABLED = DateTime()
 
 
 class TimeSpan:
+    """An immutable time (of day) value. It is invalid (disabled),
+    if it is created at midnight or parsed from an invalid value.
+    """
+
+    __slots__ = ("_time", "_valid", "_formatted")
+
+    # This is a predefined constant from the WebAPI
+    _disabled = "-10675199.02:48:05.4775808"
+
     def __init__(self, hour=0, minute=0, second=0) -> None:
-        super().__init__()
-        self._time = datetime.time(hour=hour, minute=minute, second=second)
-        # This is a predefined constant from the WebAPI
-        self._disabled = "-10675199.02:48:05.4775808"
-        self._valid = not (hour == 0 and minute == 0 and second == 0)
+        object.__setattr__(
+            self, "_time", datetime.time(hour=hour, minute=minute, second=second)
+        )
+        object.__setattr__(
+            self, "_valid", not (hour == 0 and minute == 0 and second == 0)
+        )
+        object.__setattr__(self, "_formatted", None)
+
+    @classmethod
+    def _fromRecord(cls, record, valid, formatted=None) -> TimeSpan:
+        value = object.__new__(cls)
+        object.__setattr__(value, "_time", record)
+        object.__setattr__(value, "_valid", valid)
+        object.__setattr__(value, "_formatted", formatted)
+        return value
+
+    def __setattr__(self, __name: str, __value: any) -> None:
+        raise AttributeError("'{}' object is immutable".format(type(self).__name__))
+
+    def __delattr__(self, __name: str) -> None:
+        raise AttributeError("'{}' object is immutable".format(type(self).__name__))
+
+    def __copy__(self) -> TimeSpan:
+        return self
+
+    def __deepcopy__(self, memo) -> TimeSpan:
+        return self
+
+    def __reduce__(self):
+        return (type(self)._fromRecord, (self._time, self._valid, self._formatted))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TimeSpan):
+            return NotImplemented
+        return self.record() == other.record()
+
+    def __hash__(self) -> int:
+        return hash(self.record())
+
+    def __repr__(self) -> str:
+        return "TimeSpan('{}')".format(self.format())
 
     def valid(self):
         """Check if the time is configured correctly.
@@ -184,26 +312,595 @@ class TimeSpan:
         else:
             return None
 
-    def parse(self, value: str):
-        """Parse the given time.
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def parse(cls, value: str) -> TimeSpan:
+        """Parse the given time. As the parsed values are immutable,
+        they are cached and shared, the WebAPI's disabled constant
+        resolves to a shared invalid instance.
         Args:
             value (str): A iso formatted time.
+        Returns:
+            TimeSpan: The time, it is invalid if the value could not be parsed.
         """
+        if value == cls._disabled:
+            return cls._DISABLED
         try:
-            self._time = datetime.time.fromisoformat(value)
-            self._valid = True
-        except ValueError:
-            self._valid = False
+            record = datetime.time.fromisoformat(value)
+        except (TypeError, ValueError):
+            return cls._DISABLED
+        return cls._fromRecord(record, True)
 
     def format(self):
         """Format the defined time.
         Returns:
             str: A iso formatted time.
         """
-        if not self._valid:
-            return self._disabled
+        formatted = self._formatted
+        if formatted is None:
+            formatted = self._time.isoformat() if self._valid else TimeSpan._disabled
+            object.__setattr__(self, "_formatted", formatted)
+        return formatted
+
+
+TimeSpan._DISABLED = TimeSpan()
+
+
+class _FrameRunEncoder:
+    """Greedily encode a frame sequence into arithmetic runs.
+    Single frames are consumed one at a time, whole ranges are
+    consumed in constant time.
+    """
+
+    __slots__ = ("_runs", "_start", "_step", "_last", "_count")
+
+    def __init__(self) -> None:
+        self._runs = []
+        self._start = 0
+        self._step = 0
+        self._last = 0
+        self._count = 0
+
+    def push(self, frame: int):
+        """Append a single frame.
+        Args:
+            frame (int): The frame.
+        """
+        count = self._count
+        if count >= 2:
+            if frame - self._last == self._step:
+                self._last = frame
+                self._count = count + 1
+                return
+            self._flush()
+        elif count == 1:
+            # Runs can't have a step of 0, duplicates start a new run.
+            if frame != self._last:
+                self._step = frame - self._last
+                self._last = frame
+                self._count = 2
+                return
+            self._flush()
+        self._start = self._last = frame
+        self._count = 1
+
+    def pushRange(self, frameRange: range):
+        """Append all frames of the given range.
+        Args:
+            frameRange (range): The frame range.
+        """
+        if frameRange:
+            self.pushRun(frameRange.start, frameRange.step, len(frameRange))
+
+    def pushRun(self, frame: int, step: int, count: int):
+        """Append an arithmetic run of frames in constant time.
+        The result is identical to pushing the frames one by one.
+        Args:
+            frame (int): The first frame.
+            step (int): The frame step.
+            count (int): The frame count, must be at least 1.
+        """
+        if self._count >= 2 and frame - self._last == self._step:
+            # The first frame continues the active run.
+            if count == 1 or step == self._step:
+                self._last = frame + (count - 1) * step
+                self._count += count
+                return
+            self._runs.append(range(self._start, frame + self._step, self._step))
+            self._count = 0
+            frame += step
+            count -= 1
+        elif self._count == 1 and frame != self._last:
+            # The first frame defines the pending run's step.
+            self._step = frame - self._last
+            if count == 1 or step == self._step:
+                self._last = frame + (count - 1) * step
+                self._count = count + 1
+                return
+            self._runs.append(range(self._start, frame + self._step, self._step))
+            self._count = 0
+            frame += step
+            count -= 1
+        elif self._count:
+            self._flush()
+        self._start = frame
+        self._last = frame + (count - 1) * step
+        self._step = step
+        self._count = count
+
+    def pushFrames(self, frames):
+        """Append all frames of the given iterable.
+        Args:
+            frames (FrameSet | range | Iterable[int]): The frames, any
+                iterable (generators, arrays, buffers) is consumed in a single pass.
+        """
+        if isinstance(frames, FrameSet):
+            for frameRange in frames._runs:
+                self.pushRange(frameRange)
+        elif isinstance(frames, range):
+            self.pushRange(frames)
         else:
-            return self._time.isoformat()
+            # This is the same logic as in push(), inlined
+            # with local variables as it runs once per frame.
+            runs = self._runs
+            start = self._start
+            step = self._step
+            last = self._last
+            count = self._count
+            for frame in frames:
+                if count >= 2:
+                    if frame - last == step:
+                        last = frame
+                        count += 1
+                        continue
+                    runs.append(range(start, last + step, step))
+                elif count == 1:
+                    if frame != last:
+                        step = frame - last
+                        last = frame
+                        count = 2
+                        continue
+                    runs.append(range(start, start + 1))
+                start = last = frame
+                count = 1
+            self._start = start
+            self._step = step
+            self._last = last
+            self._count = count
+
+    def _flush(self):
+        if self._count == 1:
+            self._runs.append(range(self._start, self._start + 1))
+        elif self._count:
+            self._runs.append(range(self._start, self._last + self._step, self._step))
+        self._count = 0
+
+    def finish(self):
+        """Close the active run.
+        Returns:
+            tuple[range]: The encoded runs.
+        """
+        self._flush()
+        return tuple(self._runs)
+
+
+class FrameSet(Sequence):
+    """An immutable frame list, that stores its frames as
+    arithmetic (start, end, step) runs instead of individual
+    frames, so that long frame ranges never have to be expanded.
+    It behaves like a read-only list (len/iteration/indexing/membership),
+    the frame order as well as duplicate entries are preserved.
+    Frame sets created via fromString() are parsed lazily on first access.
+    """
+
+    __slots__ = ("_runs", "_offsets", "_length", "_source")
+
+    def __init__(self, frames=()) -> None:
+        encoder = _FrameRunEncoder()
+        encoder.pushFrames(frames)
+        self._setRuns(encoder.finish())
+
+    @classmethod
+    def fromRanges(cls, frameRanges) -> FrameSet:
+        """Create a frame set from the given ranges without expanding them.
+        Args:
+            frameRanges (Iterable[range]): The frame ranges.
+        Returns:
+            FrameSet: The frame set.
+        """
+        encoder = _FrameRunEncoder()
+        for frameRange in frameRanges:
+            encoder.pushRange(frameRange)
+        frameSet = cls.__new__(cls)
+        frameSet._setRuns(encoder.finish())
+        return frameSet
+
+    @classmethod
+    def fromString(cls, frameStr: str) -> FrameSet:
+        """Create a frame set from the given frame string, that is only
+        parsed once its frames are accessed. Until then, formatting the
+        frame set returns the frame string as is.
+        Args:
+            frameStr (str): A frame string.
+        Returns:
+            FrameSet: The frame set.
+        """
+        frameSet = cls.__new__(cls)
+        frameSet._source = frameStr
+        return frameSet
+
+    def __getattr__(self, name: str) -> any:
+        # This is only called for unset slots, which is the case
+        # for lazy frame sets that haven't been parsed yet.
+        if name == "_source" or name not in FrameSet.__slots__:
+            raise AttributeError(name)
+        frameSet = FrameList.convertFrameStringToFrameSet(self._source)
+        self._runs = frameSet._runs
+        self._offsets = frameSet._offsets
+        self._length = frameSet._length
+        return getattr(self, name)
+
+    def _setRuns(self, runs: tuple[range]):
+        offsets = []
+        length = 0
+        for run in runs:
+            offsets.append(length)
+            length += len(run)
+        self._runs = runs
+        self._offsets = offsets
+        self._length = length
+        self._source = None
+
+    def iterRanges(self):
+        """Iterate over the frames as ranges. Frame sets that haven't been
+        parsed yet stream their ranges from the frame string instead.
+        Returns:
+            Iterator[range]: The frame ranges.
+        """
+        try:
+            return iter(FrameSet._runs.__get__(self))
+        except AttributeError:
+            return FrameList._iterFrameStringRanges(self._source)
+
+    def runs(self):
+        """Get the frame runs.
+        Returns:
+            list[tuple[int, int, int]]: The (start, end, step) runs, the end is inclusive.
+        """
+        return [(run.start, run[-1], run.step) for run in self._runs]
+
+    def format(self):
+        """Format the frames as a frame string.
+        Returns:
+            str: The frame string.
+        """
+        if self._source is not None:
+            return self._source
+        frameItems = []
+        for run in self._runs:
+            count = len(run)
+            if count == 1:
+                frameItems.append(str(run.start))
+            elif count == 2 or (count == 3 and run.step not in (1, -1)):
+                frameItems.extend([str(f) for f in run])
+            elif run.step in (1, -1):
+                frameItems.append("{}-{}".format(run.start, run[-1]))
+            else:
+                frameItems.append("{}-{}x{}".format(run.start, run[-1], abs(run.step)))
+        return ",".join(frameItems)
+
+    def shift(self, offset: int) -> FrameSet:
+        """Shift all frames by the given offset.
+        Args:
+            offset (int): The frame offset.
+        Returns:
+            FrameSet: The shifted frame set.
+        """
+        frameSet = FrameSet.__new__(FrameSet)
+        frameSet._setRuns(
+            tuple(
+                range(run.start + offset, run.stop + offset, run.step)
+                for run in self._runs
+            )
+        )
+        return frameSet
+
+    def subsample(self, stride: int, offset: int = 0) -> FrameSet:
+        """Get every n-th frame, this is the same as frameSet[offset::stride].
+        Args:
+            stride (int): The stride.
+            offset (int): The index of the first frame.
+        Returns:
+            FrameSet: The subsampled frame set.
+        """
+        if stride < 1:
+            raise ValueError("The stride must be at least 1.")
+        return self[offset::stride]
+
+    def union(self, *others) -> FrameSet:
+        """Get the frames that are in this or any of the other frame lists.
+        Like all set operations, the result is sorted and free of duplicates.
+        Args:
+            others (FrameSet | Iterable[int]): The other frame lists.
+        Returns:
+            FrameSet: The union.
+        """
+        return FrameSet._combine((self,) + others, any)
+
+    def intersection(self, *others) -> FrameSet:
+        """Get the frames that are in this and all of the other frame lists.
+        Args:
+            others (FrameSet | Iterable[int]): The other frame lists.
+        Returns:
+            FrameSet: The intersection.
+        """
+        return FrameSet._combine((self,) + others, all)
+
+    def difference(self, *others) -> FrameSet:
+        """Get the frames that are in this but in none of the other frame lists.
+        Args:
+            others (FrameSet | Iterable[int]): The other frame lists.
+        Returns:
+            FrameSet: The difference.
+        """
+        return FrameSet._combine(
+            (self,) + others, lambda states: states[0] and not any(states[1:])
+        )
+
+    @staticmethod
+    def _combine(frameSets, predicate) -> FrameSet:
+        """Combine the frame sets on their runs, a frame is part of
+        the result if the predicate of its per frame set membership
+        states is True.
+        Args:
+            frameSets (tuple[FrameSet | Iterable[int]]): The frame sets.
+            predicate (callable): The predicate, called with a list of bools.
+        Returns:
+            FrameSet: The sorted result.
+        """
+        # Split the frame range at all run boundaries, within each
+        # interval every run then either covers it or doesn't.
+        events = {}
+        for frameSetIdx, frameSet in enumerate(frameSets):
+            if not isinstance(frameSet, FrameSet):
+                frameSet = FrameSet(frameSet)
+            for run in frameSet._runs:
+                if run.step < 0:
+                    run = run[::-1]
+                events.setdefault(run.start, []).append((frameSetIdx, run, True))
+                events.setdefault(run[-1] + 1, []).append((frameSetIdx, run, False))
+        points = sorted(events)
+        activeRuns = [[] for _ in frameSets]
+        encoder = _FrameRunEncoder()
+        for intervalStart, intervalEnd in zip(points, points[1:]):
+            for frameSetIdx, run, active in events[intervalStart]:
+                if active:
+                    activeRuns[frameSetIdx].append(run)
+                else:
+                    activeRuns[frameSetIdx].remove(run)
+            # Per frame set, the membership is either constant
+            # or periodic (None) within the interval.
+            states = []
+            period = 1
+            for runs in activeRuns:
+                if not runs:
+                    states.append(False)
+                elif any(run.step == 1 for run in runs):
+                    states.append(True)
+                else:
+                    states.append(None)
+                    for run in runs:
+                        period = math.lcm(period, run.step)
+            if period == 1:
+                if predicate(states):
+                    encoder.pushRange(range(intervalStart, intervalEnd))
+                continue
+            # Resolve interleaved stepped runs over one period.
+            intervalLength = intervalEnd - intervalStart
+            patternLength = min(period, intervalLength)
+            pattern = []
+            for offset in range(patternLength):
+                frame = intervalStart + offset
+                frameStates = [
+                    state
+                    if state is not None
+                    else any((frame - run.start) % run.step == 0 for run in runs)
+                    for state, runs in zip(states, activeRuns)
+                ]
+                if predicate(frameStates):
+                    pattern.append(offset)
+            if not pattern:
+                continue
+            spacing = period if len(pattern) == 1 else pattern[1] - pattern[0]
+            if (
+                patternLength < intervalLength
+                and spacing * len(pattern) == period
+                and all(b - a == spacing for a, b in zip(pattern, pattern[1:]))
+            ):
+                encoder.pushRange(range(intervalStart + pattern[0], intervalEnd, spacing))
+                continue
+            patternEncoder = _FrameRunEncoder()
+            patternEncoder.pushFrames(pattern)
+            patternRuns = patternEncoder.finish()
+            for periodStart in range(intervalStart, intervalEnd, period):
+                for run in patternRuns:
+                    if periodStart + run.start >= intervalEnd:
+                        break
+                    encoder.pushRange(
+                        range(
+                            periodStart + run.start,
+                            min(periodStart + run.stop, intervalEnd),
+                            run.step,
+                        )
+                    )
+        frameSet = FrameSet.__new__(FrameSet)
+        frameSet._setRuns(encoder.finish())
+        return frameSet
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._runs)
+
+    def __reversed__(self):
+        return itertools.chain.from_iterable(reversed(run) for run in reversed(self._runs))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(self._length)[index]
+            if indices.step < 0:
+                return FrameSet(self[idx] for idx in indices)
+            frameRanges = []
+            runIdx = max(bisect.bisect_right(self._offsets, indices.start) - 1, 0)
+            for runIdx in range(runIdx, len(self._runs)):
+                offset = self._offsets[runIdx]
+                if offset >= indices.stop:
+                    break
+                # The first sliced index within this run.
+                idx = indices.start
+                if idx < offset:
+                    idx += -(-(offset - idx) // indices.step) * indices.step
+                frameRanges.append(
+                    self._runs[runIdx][
+                        idx - offset : indices.stop - offset : indices.step
+                    ]
+                )
+            return FrameSet.fromRanges(frameRanges)
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError("FrameSet index out of range")
+        runIdx = bisect.bisect_right(self._offsets, index) - 1
+        return self._runs[runIdx][index - self._offsets[runIdx]]
+
+    def __contains__(self, frame) -> bool:
+        if not isinstance(frame, int):
+            return super().__contains__(frame)
+        for run in self._runs:
+            if frame in run:
+                return True
+        return False
+
+    def index(self, frame, start=0, stop=None) -> int:
+        if not isinstance(frame, int) or start != 0 or stop is not None:
+            return super().index(frame, start, stop)
+        for run, offset in zip(self._runs, self._offsets):
+            if frame in run:
+                return offset + run.index(frame)
+        raise ValueError("{} is not in FrameSet".format(frame))
+
+    def count(self, frame) -> int:
+        if not isinstance(frame, int):
+            return super().count(frame)
+        return sum(run.count(frame) for run in self._runs)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FrameSet):
+            if self._source is not None and self._source == other._source:
+                return True
+            # The greedy encoding is canonical, equal frame
+            # sequences always result in equal runs.
+            return self._runs == other._runs
+        if isinstance(other, (list, tuple, range)):
+            return self._length == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._runs)
+
+    def __add__(self, other) -> FrameSet:
+        if not isinstance(other, (FrameSet, list, tuple, range)):
+            return NotImplemented
+        encoder = _FrameRunEncoder()
+        encoder.pushFrames(self)
+        encoder.pushFrames(other)
+        frameSet = FrameSet.__new__(FrameSet)
+        frameSet._setRuns(encoder.finish())
+        return frameSet
+
+    def __radd__(self, other) -> FrameSet:
+        if not isinstance(other, (list, tuple, range)):
+            return NotImplemented
+        return FrameSet(other) + self
+
+    def __repr__(self) -> str:
+        return "FrameSet('{}')".format(self.format())
+
+    def __copy__(self) -> FrameSet:
+        return self
+
+    def __deepcopy__(self, memo) -> FrameSet:
+        return self
+
+    def __reduce__(self):
+        if self._source is not None:
+            return (FrameSet.fromString, (self._source,))
+        return (FrameSet.fromRanges, (self._runs,))
+
+
+class FrameTaskIndex:
+    """Maps between the tasks and frames of a job. Like in Deadline,
+    the frame list is split in order into tasks of framesPerTask frames.
+    All lookups work on the frame runs, so their cost is independent
+    of the frame count (constant for single range frame lists).
+    """
+
+    __slots__ = ("_frames", "_framesPerTask")
+
+    def __init__(self, frames: FrameSet, framesPerTask: int = 1) -> None:
+        self._frames = frames if isinstance(frames, FrameSet) else FrameSet(frames)
+        self._framesPerTask = max(1, framesPerTask)
+
+    def __len__(self) -> int:
+        return self.getTaskCount()
+
+    def getTaskCount(self):
+        """Get the number of tasks.
+        Returns:
+            int: The task count.
+        """
+        return -(-len(self._frames) // self._framesPerTask)
+
+    def getTaskFrames(self, task: int):
+        """Get the frames rendered by the given task.
+        Args:
+            task (int): The task id.
+        Returns:
+            FrameSet: The task's frames.
+        """
+        if task < 0 or task >= self.getTaskCount():
+            raise IndexError("Task {} is out of range.".format(task))
+        frameIdx = task * self._framesPerTask
+        return self._frames[frameIdx : frameIdx + self._framesPerTask]
+
+    def getFrameTask(self, frame: int):
+        """Get the task that renders the given frame. For duplicate
+        frames, the task of the first occurrence is returned.
+        Args:
+            frame (int): The frame.
+        Raises:
+            ValueError: If the frame is not part of the frame list.
+        Returns:
+            int: The task id.
+        """
+        return self._frames.index(frame) // self._framesPerTask
+
+
+# A single pass tokenizer for frame strings, each match is one frame item.
+# Groups: (start, end, step, invalid item)
+_FRAME_ITEM_PATTERN = re.compile(
+    r"""[\s,]*
+    (?:
+        ([-+]?\d+)
+        (?:[-:]([-+]?\d+)(?:(?:x|:|step|by|every)(\d+))?)?
+        (?=[\s,]|$)
+      | ([^\s,]+)
+    )""",
+    re.VERBOSE,
+)
 
 
 class FrameList:
@@ -211,76 +908,20 @@ class FrameList:
     def convertFrameListToFrameString(frameList: list[int]):
         """Convert the frame list into a frame string.
         As per deadline's specification, the frame string may contain duplicate entries.
+        The frames are encoded in a single pass, greedily using the longest
+        arithmetic runs.
         Args:
-            frameList (list[int]): A list of frames.
+            frameList (FrameSet | range | Iterable[int]): The frames.
         Returns:
             str: A frame string.
         """
-        # Expand iterables
-        # Make copy to avoid ptr leaks
-        frameList = list(copy.deepcopy(frameList))
-        # Stringify
-        if len(frameList) == 0:
-            return ""
-        elif len(frameList) == 1:
-            return str(frameList[0])
-        elif len(frameList) == 2:
-            return ",".join([str(f) for f in frameList])
-        frameString = []
-        frameStack = []
-        frameIntervals = set()
-        framePreviousInterval = -1
-        framePrevious = []
-        frameIter = 0
-        for frame in frameList:
-            frameIter += 1
-            if framePrevious:
-                frameIntervals.add(abs(frame - framePrevious[-1]))
-            framePrevious.append(frame)
-            frameStack.append(frame)
-            if frameIter == 1:
-                continue
-            if len(frameIntervals) == 1:
-                framePreviousInterval = list(frameIntervals)[0]
-                if frameIter != len(frameList):
-                    continue
-            if framePreviousInterval != -1:
-                if framePreviousInterval != 1:
-                    if len(frameStack) > 3:
-                        if frameIter != len(frameList):
-                            frameString.append(
-                                "{}-{}x{}".format(
-                                    frameStack[0], frameStack[-2], framePreviousInterval
-                                )
-                            )
-                        else:
-                            frameString.append(
-                                "{}-{}x{}".format(
-                                    frameStack[0], frameStack[-1], framePreviousInterval
-                                )
-                            )
-                    else:
-                        frameString.extend([str(f) for f in frameStack[:-1]])
-                        frameString.append(str(frameStack[-1]))
-                else:
-                    if frameIter != len(frameList):
-                        frameString.append(
-                            "{}-{}".format(frameStack[0], frameStack[-2])
-                        )
-                    else:
-                        frameString.append(
-                            "{}-{}".format(frameStack[0], frameStack[-1])
-                        )
-            else:
-                frameString.extend([str(f) for f in frameStack[:-1]])
-            frameStack = frameStack[-1:]
-            frameIntervals.clear()
-            framePreviousInterval = -1
-        return ",".join(frameString)
+        if not isinstance(frameList, FrameSet):
+            frameList = FrameSet(frameList)
+        return frameList.format()
 
     @staticmethod
     def convertFrameStringToFrameList(frameStr: str):
-        """Convert the frame list into a frame string.
+        """Convert the frame string into a frame list.
         As per deadline's specification, the list may contain duplicate entries.
 
         Args:
@@ -288,45 +929,524 @@ class FrameList:
         Returns:
             list[int]: A list of frames.
         """
-        # Conform
-        frameStr = frameStr.replace("step", "x")
-        frameStr = frameStr.replace("by", "x")
-        frameStr = frameStr.replace("every", "x")
-        frameItems = re.split(",| ", frameStr)
-        frameItems = [i for i in frameItems if i]
-        # Expand
-        frameList = []
-        for frameItem in frameItems:
-            if frameItem.count(":") == 2:
-                frameStart, frameEnd, frameStep = frameItem.split(":")
-                frameList.extend(
-                    range(int(frameStart), int(frameEnd) + 1, int(frameStep))
+        return list(FrameList.convertFrameStringToFrameSet(frameStr))
+
+    @staticmethod
+    def convertFrameStringToFrameSet(frameStr: str, cache: bool = True):
+        """Convert the frame string into a frame set without
+        expanding the frame ranges.
+        As per deadline's specification, the set may contain duplicate entries.
+        Supported items (separated by commas and/or whitespace):
+            "a", "a-b", "a-bxN", "a-b:N", "a-bstepN", "a-bbyN",
+            "a-beveryN", "a:b:N", "a:b". If a > b, the range is reversed
+            and starts at a (e.g. "10-1x2" is 10, 8, 6, 4, 2).
+            Frames may be negative (e.g. "-10--1") or signed (e.g. "+3").
+        Parsed frame sets are kept in a LRU cache keyed by the frame string.
+        As frame sets are immutable, the cached instances are shared, any
+        modification (e.g. frameSet + [1001]) returns a new frame set.
+
+        Args:
+            frameStr (str): A frame string.
+            cache (bool): Use the frame set cache.
+        Returns:
+            FrameSet: The frame set.
+        """
+        if cache:
+            return FrameList._frameSetCache(frameStr)
+        return FrameList._parseFrameString(frameStr)
+
+    @staticmethod
+    def getFrameSetCacheInfo():
+        """Get the frame set cache statistics.
+        Returns:
+            functools._CacheInfo: The (hits, misses, maxsize, currsize) info.
+        """
+        return FrameList._frameSetCache.cache_info()
+
+    @staticmethod
+    def setFrameSetCacheSize(maxSize: int):
+        """Set the maximum entry count of the frame set cache.
+        This clears the cache and its statistics.
+        Args:
+            maxSize (int): The entry count, 0 disables caching.
+        """
+        FrameList._frameSetCache = functools.lru_cache(maxsize=maxSize)(
+            FrameList._parseFrameString
+        )
+
+    @staticmethod
+    def clearFrameSetCache():
+        """Clear the frame set cache and its statistics."""
+        FrameList._frameSetCache.cache_clear()
+
+    @staticmethod
+    def iterFrames(frames):
+        """Iterate over the frames. Frame strings are streamed
+        item by item, so that the frames are never materialized.
+        Args:
+            frames (str | FrameSet | Iterable[int]): A frame string or frames.
+        Returns:
+            Iterator[int]: The frames.
+        """
+        if isinstance(frames, str):
+            return itertools.chain.from_iterable(
+                FrameList._iterFrameStringRanges(frames)
+            )
+        if isinstance(frames, FrameSet):
+            return itertools.chain.from_iterable(frames.iterRanges())
+        return iter(frames)
+
+    @staticmethod
+    def iterTaskFrames(frames, framesPerTask: int = 1):
+        """Iterate over the task chunks of the frames. Like in Deadline,
+        the frames are split in order into tasks of framesPerTask frames.
+        Frame strings are streamed item by item.
+        Args:
+            frames (str | FrameSet | Iterable[int]): A frame string or frames.
+            framesPerTask (int): The frames per task.
+        Returns:
+            Iterator[tuple[int, FrameSet]]: The (task id, task frames) chunks.
+        """
+        framesPerTask = max(1, framesPerTask)
+        if isinstance(frames, str):
+            frameRanges = FrameList._iterFrameStringRanges(frames)
+        elif isinstance(frames, FrameSet):
+            frameRanges = frames.iterRanges()
+        else:
+            frameRanges = (range(frame, frame + 1) for frame in frames)
+        task = 0
+        taskRanges = []
+        taskFrameCount = 0
+        for frameRange in frameRanges:
+            while frameRange:
+                taskRange = frameRange[: framesPerTask - taskFrameCount]
+                frameRange = frameRange[len(taskRange) :]
+                taskFrameCount += len(taskRange)
+                if taskFrameCount < framesPerTask:
+                    taskRanges.append(taskRange)
+                    continue
+                if taskRanges:
+                    taskRanges.append(taskRange)
+                    taskFrames = FrameSet.fromRanges(taskRanges)
+                    taskRanges = []
+                else:
+                    # A single range is a valid run as is.
+                    if len(taskRange) == 1:
+                        taskRange = range(taskRange.start, taskRange.start + 1)
+                    taskFrames = FrameSet.__new__(FrameSet)
+                    taskFrames._setRuns((taskRange,))
+                yield task, taskFrames
+                task += 1
+                taskFrameCount = 0
+        if taskRanges:
+            yield task, FrameSet.fromRanges(taskRanges)
+
+    @staticmethod
+    def _iterFrameStringRanges(frameStr: str):
+        """Iterate over the frame ranges of the frame string item by item,
+        see convertFrameStringToFrameSet for the supported items.
+        Args:
+            frameStr (str): A frame string.
+        Returns:
+            Iterator[range]: The frame ranges.
+        """
+        for match in _FRAME_ITEM_PATTERN.finditer(frameStr):
+            frameStart, frameEnd, frameStep, invalidItem = match.groups()
+            if invalidItem:
+                raise ValueError(
+                    "Invalid frame string item '{}' in '{}'.".format(
+                        invalidItem, frameStr
+                    )
                 )
-            elif frameItem.count("-") == 1 and (
-                frameItem.count(":") == 1 or frameItem.count("x") == 1
-            ):
-                frameRange, frameStep = re.split(":|x", frameItem)
-                frameStart, frameEnd = frameRange.split("-")
-                if frameEnd < frameStart:
-                    frameRange = reversed(
-                        range(int(frameEnd), int(frameStart) + 1, int(frameStep))
+            frame = int(frameStart)
+            if not frameEnd:
+                yield range(frame, frame + 1)
+                continue
+            frameEnd = int(frameEnd)
+            frameStep = int(frameStep) if frameStep else 1
+            if frameStep <= 0:
+                raise ValueError(
+                    "Invalid frame step '{}' in '{}'.".format(frameStep, frameStr)
+                )
+            if frameEnd < frame:
+                yield range(frame, frameEnd - 1, -frameStep)
+            else:
+                yield range(frame, frameEnd + 1, frameStep)
+
+    @staticmethod
+    def _parseFrameString(frameStr: str):
+        """Parse the frame string, see convertFrameStringToFrameSet.
+        Args:
+            frameStr (str): A frame string.
+        Returns:
+            FrameSet: The frame set.
+        """
+        # The greedy run encoding (see _FrameRunEncoder.pushRun) is
+        # inlined here, as this is the hot path when loading jobs.
+        runs = []
+        runStart = runStep = runLast = runCount = 0
+        for frameStart, frameEnd, frameStep, invalidItem in _FRAME_ITEM_PATTERN.findall(
+            frameStr
+        ):
+            if invalidItem:
+                raise ValueError(
+                    "Invalid frame string item '{}' in '{}'.".format(
+                        invalidItem, frameStr
                     )
-                else:
-                    frameRange = range(
-                        int(frameStart), int(frameEnd) + 1, int(frameStep)
+                )
+            frame = int(frameStart)
+            if frameEnd:
+                frameEnd = int(frameEnd)
+                frameStep = int(frameStep) if frameStep else 1
+                if frameStep <= 0:
+                    raise ValueError(
+                        "Invalid frame step '{}' in '{}'.".format(frameStep, frameStr)
                     )
-                frameList.extend(frameRange)
-            elif frameItem.count("-") == 1:
-                frameStart, frameEnd = frameItem.split("-")
-                if frameEnd < frameStart:
-                    frameRange = reversed(range(int(frameEnd), int(frameStart) + 1))
-                else:
-                    frameRange = range(int(frameStart), int(frameEnd) + 1)
-                frameList.extend(frameRange)
+                if frameEnd < frame:
+                    frameStep = -frameStep
+                frameCount = (frameEnd - frame) // frameStep + 1
             else:
-                frameList.append(int(frameItem))
+                frameStep = 1
+                frameCount = 1
+            if runCount >= 2 and frame - runLast == runStep:
+                if frameCount == 1 or frameStep == runStep:
+                    runLast = frame + (frameCount - 1) * frameStep
+                    runCount += frameCount
+                    continue
+                runs.append(range(runStart, frame + runStep, runStep))
+                frame += frameStep
+                frameCount -= 1
+            elif runCount == 1 and frame != runLast:
+                runStep = frame - runLast
+                if frameCount == 1 or frameStep == runStep:
+                    runLast = frame + (frameCount - 1) * frameStep
+                    runCount = frameCount + 1
+                    continue
+                runs.append(range(runStart, frame + runStep, runStep))
+                frame += frameStep
+                frameCount -= 1
+            elif runCount == 1:
+                runs.append(range(runStart, runStart + 1))
+            elif runCount:
+                runs.append(range(runStart, runLast + runStep, runStep))
+            runStart = frame
+            runLast = frame + (frameCount - 1) * frameStep
+            runStep = frameStep
+            runCount = frameCount
+        if runCount == 1:
+            runs.append(range(runStart, runStart + 1))
+        elif runCount:
+            runs.append(range(runStart, runLast + runStep, runStep))
+
+        frameSet = FrameSet.__new__(FrameSet)
+        frameSet._setRuns(tuple(runs))
+        return frameSet
+
+
+    @staticmethod
+    def convertFrameStringsToFrameArrays(frameStrs: list[str]):
+        """Convert multiple frame strings into frame arrays in one batch.
+        If NumPy is available, all frame ranges of all frame strings
+        are expanded with a single vectorized operation, otherwise
+        this falls back to plain frame lists.
+        Args:
+            frameStrs (list[str]): The frame strings.
+        Returns:
+            list[numpy.ndarray] | list[list[int]]: The frame arrays (int64).
+        """
+        frameSets = [FrameList.convertFrameStringToFrameSet(f) for f in frameStrs]
+        if np is None or not frameSets:
+            return [list(frameSet) for frameSet in frameSets]
+        runStarts = []
+        runSteps = []
+        runCounts = []
+        frameCounts = []
+        for frameSet in frameSets:
+            frameCounts.append(frameSet._length)
+            for run in frameSet._runs:
+                runStarts.append(run.start)
+                runSteps.append(run.step)
+                runCounts.append(len(run))
+        runCounts = np.array(runCounts, dtype=np.int64)
+        runOffsets = np.cumsum(runCounts) - runCounts
+        # frame = run start + (frame index - run offset) * run step
+        runIndices = np.repeat(np.arange(len(runCounts)), runCounts)
+        frames = np.arange(runCounts.sum(), dtype=np.int64) - runOffsets[runIndices]
+        frames *= np.array(runSteps, dtype=np.int64)[runIndices]
+        frames += np.array(runStarts, dtype=np.int64)[runIndices]
+        # The arrays are views into the batch array.
+        return np.split(frames, np.cumsum(frameCounts)[:-1])
+
+    @staticmethod
+    def convertFrameArraysToFrameStrings(frameArrays):
+        """Convert multiple frame arrays into frame strings in one batch.
+        If NumPy is available, the frame runs of all arrays are detected
+        vectorized via the frame deltas, otherwise this falls back to the
+        single pass FrameSet encoder. Both give identical results.
+        Args:
+            frameArrays (list[numpy.ndarray] | list[Iterable[int]]): The frame arrays.
+        Returns:
+            list[str]: The frame strings.
+        """
+        if np is None or not frameArrays:
+            return [FrameList.convertFrameListToFrameString(f) for f in frameArrays]
+        frameArrays = [np.asarray(f, dtype=np.int64) for f in frameArrays]
+        frameCounts = [len(f) for f in frameArrays]
+        frames = np.concatenate(frameArrays)
+        frameBounds = np.cumsum(frameCounts)
+        deltas = np.diff(frames)
+        # Delta indices at which the delta differs from the previous one,
+        # runs must also never continue over array boundaries.
+        deltaChanges = np.flatnonzero(deltas[1:] != deltas[:-1]) + 1
+        deltaChanges = np.union1d(
+            deltaChanges, np.concatenate([frameBounds - 1, frameBounds])
+        ).tolist()
+        frameStrs = []
+        changeIdx = 0
+        frameIdx = 0
+        for frameBound in frameBounds.tolist():
+            # Greedily encode the runs, the same way as the _FrameRunEncoder.
+            runs = []
+            while frameIdx < frameBound:
+                frameStart = int(frames[frameIdx])
+                if frameIdx == frameBound - 1 or deltas[frameIdx] == 0:
+                    runs.append(range(frameStart, frameStart + 1))
+                    frameIdx += 1
+                    continue
+                while deltaChanges[changeIdx] <= frameIdx:
+                    changeIdx += 1
+                # The run continues up to the frame at the next delta change.
+                frameEndIdx = deltaChanges[changeIdx]
+                step = int(deltas[frameIdx])
+                runs.append(range(frameStart, int(frames[frameEndIdx]) + step, step))
+                frameIdx = frameEndIdx + 1
+            frameSet = FrameSet.__new__(FrameSet)
+            frameSet._setRuns(tuple(runs))
+            frameStrs.append(frameSet.format())
+        return frameStrs
 
-        return frameList
+
+FrameList.setFrameSetCacheSize(4096)
+
+
+class ChangeType(enum.Enum):
+    Added = 0
+    Removed = 1
+    Modified = 2
+
+
+class TrackedDict(dict):
+    """A dict that records which of its keys were added, removed or
+    modified since the last resetChanges call. Setting a key to an
+    equal value is not a change, removing an added key cancels it out.
+    """
+
+    __slots__ = ("_changes",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._changes = {}
+
+    def _recordSet(self, key, value):
+        if key not in self:
+            change = self._changes.get(key)
+            self._changes[key] = (
+                ChangeType.Modified if change is ChangeType.Removed else ChangeType.Added
+            )
+            return True
+        previous = dict.__getitem__(self, key)
+        if previous is value or previous == value:
+            return False
+        if key not in self._changes:
+            self._changes[key] = ChangeType.Modified
+        return True
+
+    def _recordRemove(self, key):
+        if self._changes.get(key) is ChangeType.Added:
+            del self._changes[key]
+        else:
+            self._changes[key] = ChangeType.Removed
+
+    def __setitem__(self, key, value) -> None:
+        if self._recordSet(key, value):
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._recordRemove(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._recordRemove(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._recordRemove(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other) -> TrackedDict:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        for key in list(self):
+            self._recordRemove(key)
+        super().clear()
+
+    def copy(self) -> TrackedDict:
+        """Copy the dict, the copy starts without changes.
+        Returns:
+            TrackedDict: The copy.
+        """
+        return TrackedDict(self)
+
+    def __reduce__(self):
+        return (TrackedDict._restore, (dict(self), self._changes))
+
+    @staticmethod
+    def _restore(items: dict, changes: dict) -> TrackedDict:
+        trackedDict = TrackedDict(items)
+        trackedDict._changes = changes
+        return trackedDict
+
+    def getChanges(self):
+        """Get the key-level changes.
+        Returns:
+            dict[any, ChangeType]: The change per changed key.
+        """
+        return self._changes
+
+    def hasChanges(self):
+        """Check if the dict was changed.
+        Returns:
+            bool: The state.
+        """
+        return bool(self._changes)
+
+    def resetChanges(self):
+        """Reset the change tracker."""
+        self._changes = {}
+
+
+class TrackedList(list):
+    """A list that records which of its indices were added, removed
+    or modified since the last resetChanges call. The list is
+    snapshotted on its first modification, the changes are
+    computed against that snapshot on demand.
+    """
+
+    __slots__ = ("_snapshot",)
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self._snapshot = None
+
+    def _recordModify(self):
+        if self._snapshot is None:
+            self._snapshot = tuple(self)
+
+    def __setitem__(self, index, value) -> None:
+        self._recordModify()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index) -> None:
+        self._recordModify()
+        super().__delitem__(index)
+
+    def __iadd__(self, other) -> TrackedList:
+        self._recordModify()
+        return super().__iadd__(other)
+
+    def __imul__(self, other) -> TrackedList:
+        self._recordModify()
+        return super().__imul__(other)
+
+    def append(self, value) -> None:
+        self._recordModify()
+        super().append(value)
+
+    def extend(self, values) -> None:
+        self._recordModify()
+        super().extend(values)
+
+    def insert(self, index, value) -> None:
+        self._recordModify()
+        super().insert(index, value)
+
+    def pop(self, *index):
+        self._recordModify()
+        return super().pop(*index)
+
+    def remove(self, value) -> None:
+        self._recordModify()
+        super().remove(value)
+
+    def clear(self) -> None:
+        self._recordModify()
+        super().clear()
+
+    def sort(self, *args, **kwargs) -> None:
+        self._recordModify()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._recordModify()
+        super().reverse()
+
+    def copy(self) -> TrackedList:
+        """Copy the list, the copy starts without changes.
+        Returns:
+            TrackedList: The copy.
+        """
+        return TrackedList(self)
+
+    def __reduce__(self):
+        return (TrackedList._restore, (list(self), self._snapshot))
+
+    @staticmethod
+    def _restore(items: list, snapshot: tuple) -> TrackedList:
+        trackedList = TrackedList(items)
+        trackedList._snapshot = snapshot
+        return trackedList
+
+    def getChanges(self):
+        """Get the index-level changes.
+        Returns:
+            dict[int, ChangeType]: The change per changed index.
+        """
+        changes = {}
+        if self._snapshot is None:
+            return changes
+        snapshotLength = len(self._snapshot)
+        for idx, value in enumerate(self):
+            if idx >= snapshotLength:
+                changes[idx] = ChangeType.Added
+            elif not (value is self._snapshot[idx] or value == self._snapshot[idx]):
+                changes[idx] = ChangeType.Modified
+        for idx in range(len(self), snapshotLength):
+            changes[idx] = ChangeType.Removed
+        return changes
+
+    def hasChanges(self):
+        """Check if the list was changed.
+        Returns:
+            bool: The state.
+        """
+        return self._snapshot is not None and self._snapshot != tuple(self)
+
+    def resetChanges(self):
+        """Reset the change tracker."""
+        self._snapshot = None
 
 
 #########################################
@@ -354,21 +1474,288 @@ def jobPermissionRead(func):
 class JobInternalData(dict):
     """Instead of storing nested dicts, we store the
     configuration state as a flat dict, so that we
-    can easily track the changeset."""
-
-    def __init__(self) -> None:
-        self._changeSet = set()
-
-        self.setupData()
-        self.resetChangeTracker()
-
-    def __getattribute__(self, __name: str) -> any:
-        return super().__getattribute__(__name)
+    can easily track the changeset.
+    The fields are stored in slots, which keeps the per job
+    memory low and makes assigning unknown fields an error."""
+
+    __slots__ = (
+        "_changeSet",
+        "_loadedFields",
+        # Job General
+        "repository",
+        "id",
+        "concurrencyToken",
+        "name",
+        "batchName",
+        "priority",
+        "protected",
+        "userName",
+        "department",
+        "comment",
+        "frames",
+        "framesPerTask",
+        "framesSequential",
+        # Job Environment
+        "environment",
+        "environmentIsolateEnable",
+        "environmentSubmissionIncludeEnable",
+        # Job Info
+        "info",
+        "infoExtra",
+        "infoExtraIndexed",
+        # Job Files
+        "filePathMapping",
+        "fileOutputDirectoryPaths",
+        "fileOutputFileNames",
+        "fileAuxiliarySubmissionFileNames",
+        "fileAuxiliarySubmissionSyncFileEnable",
+        # Job Limits/Groups/Pools/Machines
+        "resourceLimits",
+        "machinePool",
+        "machineSecondaryPool",
+        "machineGroup",
+        "machineLimit",
+        "machineLimitProgress",
+        "machineListedInclude",
+        "machineListedNames",
+        "taskConcurrencyLimit",
+        "taskConcurrencyLimitToNumberOfCpus",
+        # Job State
+        "status",
+        "statusErrorWarningSend",
+        "statusFailureDetectionJobOverrideEnable",
+        "statusFailureDetectionJobErrors",
+        "statusFailureDetectionTaskOverrideEnable",
+        "statusFailureDetectionTaskErrors",
+        "statusFailureDetectionMachineBadIgnore",
+        "statusInterruptable",
+        "statusInterruptablePercentage",
+        "statusInterruptableRemainingTimeThreshold",
+        "statusTimeoutJobMinSeconds",
+        "statusTimeoutPluginInitializeMaxSeconds",
+        "statusTimeoutTaskMinSeconds",
+        "statusTimeoutTaskMaxSeconds",
+        "statusTimeoutScriptEnable",
+        "statusTimeoutAutoEnable",
+        "statusTimeoutFrameBasedEnable",
+        "onJobComplete",
+        "onTaskTimeout",
+        # Job Tasks
+        "taskInfoExtraNameOverrideEnable",
+        "taskInfoExtraNameIndexed",
+        # Job Plugin
+        "plugin",
+        "pluginInfo",
+        "pluginForceReload",
+        "pluginDirectoryCustom",
+        # Job Event Plugins
+        "eventOptIns",
+        "eventSuppress",
+        "eventDirectoryCustom",
+        # Job Pre/Post (Task) Scripts
+        "scriptJobPre",
+        "scriptJobPost",
+        "scriptJobTaskPre",
+        "scriptJobTaskPost",
+        # Job Dependencies
+        "dependencyResumeOnCompleted",
+        "dependencyResumeOnDeleted",
+        "dependencyResumeOnFailed",
+        "dependencyResumePendingPercentageValue",
+        "dependencyFrameEnabled",
+        "dependencyFrameOffsetStart",
+        "dependencyFrameOffsetEnd",
+        "dependencyJobs",
+        "dependencyAssets",
+        "dependencyScripts",
+        # Job Cleanup
+        "cleanupAutomaticOverrideEnable",
+        "cleanupAutomaticType",
+        "cleanupOverrideEnable",
+        "cleanupOverrideDays",
+        # Job Stats
+        "statsJobSubmissionMachine",
+        "statsJobSubmissionDateTime",
+        "statsJobStartedDateTime",
+        "statsJobCompletedDateTime",
+        "statsJobErrors",
+        "statsTasksCount",
+        "statsTasksQueued",
+        "statsTasksRendering",
+        "statsTasksPending",
+        "statsTasksCompleted",
+        "statsTasksSuspended",
+        "statsTasksFailed",
+        # Job Notifications
+        "notificationMethodOverrideEnable",
+        "notificationTargets",
+        "notificationPopupEnable",
+        "notificationEmailEnable",
+        "notificationEmails",
+        "notificationNote",
+        # Job Maintenance
+        "maintenanceJobEnable",
+        "maintenanceJobStartFrame",
+        "maintenanceJobEndFrame",
+        # Job Time Schedule
+        "scheduledType",
+        "scheduledDayInterval",
+        "scheduledDayTimeStart",
+        "scheduledDayTimeEnd",
+        "scheduledDayTimeDisabled",
+        "scheduledDayMondayTimeStart",
+        "scheduledDayMondayTimeEnd",
+        "scheduledDayTuesdayTimeStart",
+        "scheduledDayTuesdayTimeEnd",
+        "scheduledDayWednesdayTimeStart",
+        "scheduledDayWednesdayTimeEnd",
+        "scheduledDayThursdayTimeStart",
+        "scheduledDayThursdayTimeEnd",
+        "scheduledDayFridayTimeStart",
+        "scheduledDayFridayTimeEnd",
+        "scheduledDaySaturdayTimeStart",
+        "scheduledDaySaturdayTimeEnd",
+        "scheduledDaySundayTimeStart",
+        "scheduledDaySundayTimeEnd",
+        # Job Tile Rendering
+        "tileEnable",
+        "tileFrame",
+        "tileOutputFileNames",
+        "tileTilesCount",
+        "tileTilesInX",
+        "tileTilesInY",
+    )
+
+    # The values of these types are shared with the defaults template,
+    # all other values are copied on first access.
+    _IMMUTABLE_TYPES = (
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        enum.Enum,
+        FrameSet,
+        DateTime,
+        TimeSpan,
+    )
+    _SHARED_TYPES = frozenset(
+        (type(None), bool, int, float, str, FrameSet, DateTime, TimeSpan)
+    )
+    # These fields are stored as tracked containers, so that
+    # in-place edits are part of the change set.
+    _TRACKED_FIELDS = {
+        "environment": TrackedDict,
+        "info": TrackedDict,
+        "infoExtra": TrackedDict,
+        "infoExtraIndexed": TrackedDict,
+        "taskInfoExtraNameIndexed": TrackedDict,
+        "pluginInfo": TrackedDict,
+        "filePathMapping": TrackedList,
+        "fileOutputDirectoryPaths": TrackedList,
+        "fileOutputFileNames": TrackedList,
+        "fileAuxiliarySubmissionFileNames": TrackedList,
+        "resourceLimits": TrackedList,
+        "machineListedNames": TrackedList,
+        "eventOptIns": TrackedList,
+        "dependencyJobs": TrackedList,
+        "dependencyAssets": TrackedList,
+        "dependencyScripts": TrackedList,
+        "notificationTargets": TrackedList,
+        "notificationEmails": TrackedList,
+        "tileOutputFileNames": TrackedList,
+    }
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_changeSet", set())
+        # The fields resolve to the job defaults until they are accessed.
+        self._getDefaults()
+
+    def __getattr__(self, __name: str) -> any:
+        # This is only called for unset slots, which resolve to the job defaults.
+        try:
+            value = self._getDefaults()[__name]
+        except KeyError:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(type(self).__name__, __name)
+            ) from None
+        if isinstance(value, (dict, list, set)):
+            value = value.copy()
+        elif not isinstance(value, JobInternalData._IMMUTABLE_TYPES):
+            value = copy.copy(value)
+        object.__setattr__(self, __name, value)
+        return value
 
     def __setattr__(self, __name: str, __value: any) -> None:
-        if hasattr(self, "_changeSet"):
-            self._changeSet.add(__name)
-        return super().__setattr__(__name, __value)
+        trackedType = JobInternalData._TRACKED_FIELDS.get(__name)
+        if trackedType is not None:
+            __value = trackedType(__value)
+        object.__setattr__(self, __name, __value)
+        self._changeSet.add(__name)
+
+    @classmethod
+    def _getDefaults(cls) -> dict:
+        """Get the job defaults template, it is created once per class
+        by running setupData.
+        Returns:
+            dict: The default value per field.
+        """
+        defaults = cls.__dict__.get("_defaults")
+        if defaults is None:
+            data = dict.__new__(cls)
+            object.__setattr__(data, "_changeSet", set())
+            data.setupData()
+            defaults = data.__getstate__()
+            del defaults["_changeSet"]
+            cls._defaults = defaults
+        return defaults
+
+    def __getstate__(self) -> dict:
+        # Only the accessed fields are stored, the others
+        # keep resolving to the job defaults.
+        state = {}
+        for name in JobInternalData.__slots__:
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state
+
+    def clone(self) -> JobInternalData:
+        """Clone the data including its change set. This is equivalent to,
+        but a lot faster than, copy.deepcopy, as it relies on the known
+        field types: Immutable values (including the frozen dataclass
+        items) are shared and the containers are shallow copied.
+        Returns:
+            JobInternalData: The clone.
+        """
+        data = dict.__new__(type(self))
+        object.__setattr__(data, "_changeSet", set(self._changeSet))
+        sharedTypes = JobInternalData._SHARED_TYPES
+        setSlot = object.__setattr__
+        for name, value in self.__getstate__().items():
+            if name == "_changeSet":
+                continue
+            valueType = type(value)
+            if valueType in sharedTypes:
+                pass
+            elif valueType is TrackedDict:
+                changes = value._changes
+                value = TrackedDict(value)
+                value._changes = dict(changes)
+            elif valueType is TrackedList:
+                snapshot = value._snapshot
+                value = TrackedList(value)
+                value._snapshot = snapshot
+            elif not isinstance(value, JobInternalData._IMMUTABLE_TYPES):
+                value = copy.copy(value)
+            setSlot(data, name, value)
+        return data
+
+    def __setstate__(self, state: dict) -> None:
+        # Restoring the state (e.g. via deepcopy) is not a change.
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def setupData(self) -> None:
         """This defines the job defaults."""
@@ -387,13 +1774,13 @@ class JobInternalData(dict):
             "IsSub": True,
             "Purged": False,
             "DataSize": -1,
-            "ConcurrencyToken": None,
             "ExtraElements": None,
         }
 
         # Job General
         self.repository = ""
         self.id = None
+        self.concurrencyToken = None
         self.name = "JobName"
         self.batchName = "JobBatchName"
         self.priority = 0
@@ -401,7 +1788,7 @@ class JobInternalData(dict):
         self.userName = getpass.getuser()
         self.department = "pipeline"
         self.comment = ""
-        self.frames = []
+        self.frames = FrameSet()
         self.framesPerTask = 1
         self.framesSequential = False
         # Job Environment
@@ -534,11 +1921,1149 @@ class JobInternalData(dict):
         self.tileTilesInX = 0
         self.tileTilesInY = 0
 
+    def _iterTrackedContainers(self):
+        """Iterate over the accessed tracked containers.
+        Returns:
+            Iterator[tuple[str, TrackedDict | TrackedList]]: The (field, container) pairs.
+        """
+        for name in JobInternalData._TRACKED_FIELDS:
+            try:
+                yield name, object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+
     def getChangeSet(self):
-        return self._changeSet
+        """Get the changed fields, this includes
+        in-place edits of tracked containers.
+        Returns:
+            set[str]: The changed field names.
+        """
+        changeSet = set(self._changeSet)
+        for name, container in self._iterTrackedContainers():
+            if container.hasChanges():
+                changeSet.add(name)
+        return changeSet
+
+    def getLoadedFields(self):
+        """Get the fields loaded by the last Web API deserialization.
+        The fields missing from partial documents keep their
+        previous (for new jobs their default) value.
+        Returns:
+            frozenset[str] | None: The loaded field names, None if
+                                   the data was not deserialized.
+        """
+        try:
+            return object.__getattribute__(self, "_loadedFields")
+        except AttributeError:
+            return None
+
+    def getChangeSetKeys(self, name: str):
+        """Get the key-level changes of a changed field.
+        Args:
+            name (str): The field name.
+        Returns:
+            dict[any, ChangeType] | None: The change per key (or index for lists),
+                                          None if the field was reassigned as a whole.
+        """
+        if name in self._changeSet or name not in JobInternalData._TRACKED_FIELDS:
+            return None
+        return getattr(self, name).getChanges()
+
+    def iterChangeSet(self):
+        """Iterate over the changed fields and their key-level changes.
+        Returns:
+            Iterator[tuple[str, dict[any, ChangeType] | None]]: The (field name, changes)
+                pairs, see getChangeSetKeys.
+        """
+        for name in self._changeSet:
+            yield name, None
+        for name, container in self._iterTrackedContainers():
+            if name not in self._changeSet and container.hasChanges():
+                yield name, container.getChanges()
 
     def resetChangeTracker(self):
         self._changeSet.clear()
+        for _, container in self._iterTrackedContainers():
+            container.resetChanges()
+
+
+def _internString(value):
+    """Intern the given string, so that all jobs share a single
+    object per distinct value instead of one copy per job.
+    Args:
+        value (str | None): The value.
+    Returns:
+        str | None: The interned value.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _internStrings(values: list) -> list:
+    """Intern the strings of the given list.
+    Args:
+        values (list[str]): The values.
+    Returns:
+        list[str]: The interned values.
+    """
+    return [_internString(value) for value in values]
+
+
+def _internKeys(data: dict) -> dict:
+    """Intern the (string) keys of the given dict.
+    Args:
+        data (dict): The data.
+    Returns:
+        dict: The data with interned keys.
+    """
+    return {_internString(key): value for key, value in data.items()}
+
+
+def _noIntern(value):
+    return value
+
+
+def _getSubmissionEnvironment(data: JobInternalData) -> dict:
+    """Get the environment to serialize. On submission (no job id yet)
+    the system environment is merged in, if it is enabled.
+    Args:
+        data (JobInternalData): The job data.
+    Returns:
+        dict: The environment.
+    """
+    if data.id is None and data.environmentSubmissionIncludeEnable:
+        environment = dict(os.environ)
+        environment.update(data.environment)
+        return environment
+    return data.environment
+
+
+def _writeSubmissionFile(filePath: str, data: dict) -> None:
+    """Write a deadlinecommand submission (job or plugin info) file.
+    The file is written at once, booleans are written as true/false.
+    Args:
+        filePath (str): The file path.
+        data (dict): The submission data.
+    """
+    lines = []
+    for key, value in sorted(data.items()):
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        lines.append("{}={}\n".format(key, value))
+    with open(filePath, "w") as fileObject:
+        fileObject.write("".join(lines))
+
+
+@dataclass(frozen=True)
+class _JobField:
+    """The schema entry of a job field, it maps the field to its
+    Web API key path and command line key and defines their converters.
+    Args:
+        name (str): The JobInternalData field name.
+        webAPIKey (tuple[str] | None): The Web API key path.
+            Indexed fields use a "{}" index placeholder in the last key.
+        webAPIType (str | enum.EnumMeta | type): The Web API converter name
+            (see _JOB_WEBAPI_TYPES), an enum class or a dataclass.
+        webAPIReadOnly (bool): Only deserialize the field.
+        cmdlineKey (str | None): The command line key.
+            Enumerated fields use a "{}" index placeholder.
+        cmdlineType (str): The command line converter name (see _JOB_CMDLINE_TYPES).
+        cmdlineCondition (str | None): The expression (of the field
+            "value" and the job "data") that has to be met to serialize it.
+    """
+
+    name: str
+    webAPIKey: tuple = None
+    webAPIType: object = "value"
+    webAPIReadOnly: bool = False
+    cmdlineKey: str = None
+    cmdlineType: str = "value"
+    cmdlineCondition: str = None
+
+
+_SCHEDULED_ONCE_OR_DAILY = (
+    "data.scheduledType is JobScheduledType.Once"
+    " or data.scheduledType is JobScheduledType.Daily"
+)
+_SCHEDULED_CUSTOM = "data.scheduledType is JobScheduledType.Custom"
+
+# The job field schema, the (de)serializers are generated from it.
+_JOB_FIELD_SCHEMA = (
+    # Job General
+    _JobField("repository", cmdlineKey="NetworkRoot", cmdlineCondition="value"),
+    _JobField("id", ("_id",)),
+    _JobField("concurrencyToken", ("ConcurrencyToken",), "optional", True),
+    _JobField("name", ("Props", "Name"), cmdlineKey="Name"),
+    _JobField("batchName", ("Props", "Batch"), "internString", cmdlineKey="BatchName"),
+    _JobField("priority", ("Props", "Pri"), cmdlineKey="Priority"),
+    _JobField("protected", ("Props", "Protect"), cmdlineKey="Protected"),
+    _JobField("userName", ("Props", "User"), "internString", cmdlineKey="UserName"),
+    _JobField("department", ("Props", "Dept"), "internString", cmdlineKey="Department"),
+    _JobField("comment", ("Props", "Cmmt"), cmdlineKey="Comment"),
+    _JobField(
+        "frames",
+        ("Props", "Frames"),
+        "frames",
+        cmdlineKey="Frames",
+        cmdlineType="frames",
+    ),
+    _JobField("framesPerTask", ("Props", "Chunk"), cmdlineKey="ChunkSize"),
+    _JobField("framesSequential", ("Props", "Seq"), cmdlineKey="Sequential"),
+    # Job Environment
+    _JobField(
+        "environment",
+        ("Props", "Env"),
+        "environment",
+        cmdlineKey="EnvironmentKeyValue{}",
+        cmdlineType="keyValues",
+    ),
+    _JobField(
+        "environmentIsolateEnable",
+        ("Props", "EnvOnly"),
+        cmdlineKey="UseJobEnvironmentOnly",
+    ),
+    _JobField(
+        "environmentSubmissionIncludeEnable",
+        ("Props", "Env"),
+        "submissionEnvironment",
+        cmdlineKey="IncludeEnvironment",
+    ),
+    # Job Info
+    _JobField("info", webAPIType="deprecated"),
+    _JobField(
+        "infoExtra",
+        ("Props", "ExDic"),
+        "internKeys",
+        cmdlineKey="ExtraInfoKeyValue{}",
+        cmdlineType="keyValues",
+    ),
+    _JobField(
+        "infoExtraIndexed",
+        ("Props", "Ex{}"),
+        "indexed",
+        cmdlineKey="ExtraInfo{}",
+        cmdlineType="indexed",
+    ),
+    # Job Files
+    _JobField("filePathMapping", ("Props", "PathMap"), PathMappingRule),
+    _JobField(
+        "fileOutputDirectoryPaths",
+        ("OutDir",),
+        cmdlineKey="OutputDirectory{}",
+        cmdlineType="enumerate",
+    ),
+    _JobField(
+        "fileOutputFileNames",
+        ("OutFile",),
+        cmdlineKey="OutputFilename{}",
+        cmdlineType="enumerate",
+        cmdlineCondition="not data.tileEnable",
+    ),
+    _JobField(
+        "fileAuxiliarySubmissionFileNames",
+        ("Aux",),
+        cmdlineType="auxiliaryFiles",
+    ),
+    _JobField(
+        "fileAuxiliarySubmissionSyncFileEnable",
+        ("Props", "AuxSync"),
+        cmdlineKey="SynchronizeAllAuxiliaryFiles",
+    ),
+    # Job Limits/Groups/Pools/Machines
+    _JobField(
+        "resourceLimits",
+        ("Props", "Limits"),
+        "internStrings",
+        cmdlineKey="LimitGroups",
+        cmdlineType="join",
+    ),
+    _JobField("machinePool", ("Props", "Pool"), "internString", cmdlineKey="Pool"),
+    _JobField(
+        "machineSecondaryPool",
+        ("Props", "SecPool"),
+        "internString",
+        cmdlineKey="SecondaryPool",
+    ),
+    _JobField("machineGroup", ("Props", "Grp"), "internString", cmdlineKey="Group"),
+    _JobField("machineLimit", ("Props", "MachLmt"), cmdlineKey="MachineLimit"),
+    _JobField(
+        "machineLimitProgress",
+        ("Props", "MachLmtProg"),
+        cmdlineKey="MachineLimitProgress",
+    ),
+    _JobField("machineListedInclude", ("Props", "White")),
+    _JobField(
+        "machineListedNames",
+        ("Props", "ListedSlaves"),
+        "internStrings",
+        cmdlineType="listedMachines",
+    ),
+    _JobField("taskConcurrencyLimit", ("Props", "Conc"), cmdlineKey="ConcurrentTasks"),
+    _JobField(
+        "taskConcurrencyLimitToNumberOfCpus",
+        ("Props", "ConcLimt"),
+        cmdlineKey="LimitConcurrentTasksToNumberOfCpus",
+    ),
+    # Job State
+    _JobField(
+        "status",
+        ("Stat",),
+        JobStatus,
+        cmdlineKey="InitialStatus",
+        cmdlineType="enumName",
+    ),
+    _JobField(
+        "statusErrorWarningSend",
+        ("Props", "SndWarn"),
+        cmdlineKey="SendJobErrorWarning",
+    ),
+    _JobField(
+        "statusFailureDetectionJobOverrideEnable",
+        ("Props", "JobFailOvr"),
+        cmdlineKey="OverrideJobFailureDetection",
+    ),
+    _JobField(
+        "statusFailureDetectionJobErrors",
+        ("Props", "JobFailErr"),
+        cmdlineKey="FailureDetectionJobErrors",
+    ),
+    _JobField(
+        "statusFailureDetectionTaskOverrideEnable",
+        ("Props", "TskFailOvr"),
+        cmdlineKey="OverrideTaskFailureDetection",
+    ),
+    _JobField(
+        "statusFailureDetectionTaskErrors",
+        ("Props", "TskFailErr"),
+        cmdlineKey="FailureDetectionTaskErrors",
+    ),
+    _JobField(
+        "statusFailureDetectionMachineBadIgnore",
+        ("Props", "NoBad"),
+        cmdlineKey="IgnoreBadJobDetection",
+    ),
+    _JobField("statusInterruptable", ("Props", "Int"), cmdlineKey="Interruptible"),
+    _JobField(
+        "statusInterruptablePercentage",
+        ("Props", "IntPer"),
+        cmdlineKey="InterruptiblePercentage",
+    ),
+    _JobField(
+        "statusInterruptableRemainingTimeThreshold",
+        ("Props", "RemTmT"),
+        cmdlineKey="RemTimeThreshold",
+    ),
+    _JobField(
+        "statusTimeoutJobMinSeconds",
+        ("Props", "StartTime"),
+        cmdlineKey="StartJobTimeoutSeconds",
+    ),
+    _JobField(
+        "statusTimeoutPluginInitializeMaxSeconds",
+        ("Props", "InitializePluginTime"),
+        cmdlineKey="InitializePluginTimeoutSeconds",
+    ),
+    _JobField(
+        "statusTimeoutTaskMinSeconds",
+        ("Props", "MinTime"),
+        cmdlineKey="MinRenderTimeSeconds",
+    ),
+    _JobField(
+        "statusTimeoutTaskMaxSeconds",
+        ("Props", "MaxTime"),
+        cmdlineKey="TaskTimeoutSeconds",
+    ),
+    _JobField(
+        "statusTimeoutScriptEnable",
+        ("Props", "TimeScrpt"),
+        cmdlineKey="EnableTimeoutsForScriptTasks",
+    ),
+    _JobField(
+        "statusTimeoutAutoEnable",
+        ("Props", "AutoTime"),
+        cmdlineKey="EnableAutoTimeout",
+    ),
+    _JobField(
+        "statusTimeoutFrameBasedEnable",
+        ("Props", "FrameTimeout"),
+        cmdlineKey="EnableFrameTimeouts",
+    ),
+    _JobField(
+        "onJobComplete",
+        ("Props", "OnComp"),
+        JobCompleteAction,
+        cmdlineKey="OnJobComplete",
+        cmdlineType="enumName",
+    ),
+    _JobField(
+        "onTaskTimeout",
+        ("Props", "Timeout"),
+        TaskOnTimeout,
+        cmdlineKey="OnTaskTimeout",
+        cmdlineType="enumValue",
+    ),
+    # Job Tasks
+    _JobField(
+        "taskInfoExtraNameOverrideEnable",
+        ("Props", "OvrTaskEINames"),
+        cmdlineKey="OverrideTaskExtraInfoNames",
+    ),
+    _JobField(
+        "taskInfoExtraNameIndexed",
+        ("Props", "TaskEx{}"),
+        "indexed",
+        cmdlineKey="TaskExtraInfoName{}",
+        cmdlineType="indexed",
+    ),
+    # Job Plugin
+    _JobField("plugin", ("Plug",), "internString", cmdlineKey="Plugin"),
+    _JobField(
+        "pluginInfo",
+        ("Props", "PlugInfo"),
+        "internKeys",
+        cmdlineType="pluginInfo",
+    ),
+    _JobField("pluginForceReload", ("Props", "Reload"), cmdlineKey="ForceReloadPlugin"),
+    _JobField(
+        "pluginDirectoryCustom",
+        ("Props", "PlugDir"),
+        cmdlineKey="CustomPluginDirectory",
+    ),
+    # Job Event Plugins
+    _JobField(
+        "eventOptIns",
+        ("Props", "EventOI"),
+        "internStrings",
+        cmdlineKey="EventOptIns",
+        cmdlineType="join",
+    ),
+    _JobField("eventSuppress", ("Props", "NoEvnt"), cmdlineKey="SuppressEvents"),
+    _JobField("eventDirectoryCustom", ("Props", "EventDir")),
+    # Job Pre/Post (Task) Scripts
+    _JobField("scriptJobPre", ("Props", "PrJobScrp"), cmdlineKey="PreJobScript"),
+    _JobField("scriptJobPost", ("Props", "PoJobScrp"), cmdlineKey="PostJobScript"),
+    _JobField("scriptJobTaskPre", ("Props", "PrTskScrp"), cmdlineKey="PreTaskScript"),
+    _JobField("scriptJobTaskPost", ("Props", "PoTskScrp"), cmdlineKey="PostTaskScript"),
+    # Job Dependencies
+    _JobField(
+        "dependencyResumeOnCompleted",
+        ("Props", "DepComp"),
+        cmdlineKey="ResumeOnCompleteDependencies",
+    ),
+    _JobField(
+        "dependencyResumeOnDeleted",
+        ("Props", "DepDel"),
+        cmdlineKey="ResumeOnDeletedDependencies",
+    ),
+    _JobField(
+        "dependencyResumeOnFailed",
+        ("Props", "DepFail"),
+        cmdlineKey="ResumeOnFailedDependencies",
+    ),
+    _JobField(
+        "dependencyResumePendingPercentageValue",
+        ("Props", "DepPer"),
+        cmdlineKey="JobDependencyPercentage",
+    ),
+    _JobField(
+        "dependencyFrameEnabled",
+        ("Props", "DepFrame"),
+        cmdlineKey="IsFrameDependent",
+    ),
+    _JobField(
+        "dependencyFrameOffsetStart",
+        ("Props", "DepFrameStart"),
+        cmdlineKey="FrameDependencyOffsetStart",
+    ),
+    _JobField(
+        "dependencyFrameOffsetEnd",
+        ("Props", "DepFrameEnd"),
+        cmdlineKey="FrameDependencyOffsetEnd",
+    ),
+    _JobField(
+        "dependencyJobs",
+        ("Props", "Dep"),
+        JobDependency,
+        cmdlineKey="JobDependencies",
+        cmdlineType="joinJobIds",
+        cmdlineCondition="value",
+    ),
+    _JobField(
+        "dependencyAssets",
+        ("Props", "ReqAss"),
+        AssetDependency,
+        cmdlineKey="RequiredAssets",
+        cmdlineType="joinFileNames",
+        cmdlineCondition="value",
+    ),
+    _JobField(
+        "dependencyScripts",
+        ("Props", "ScrDep"),
+        ScriptDependency,
+        cmdlineKey="ScriptDependencies",
+        cmdlineType="joinFileNames",
+        cmdlineCondition="value",
+    ),
+    # Job Cleanup
+    _JobField(
+        "cleanupAutomaticOverrideEnable",
+        ("Props", "OverAutoClean"),
+        cmdlineKey="OverrideAutoJobCleanup",
+    ),
+    _JobField(
+        "cleanupAutomaticType",
+        ("Props", "OverCleanType"),
+        AutoJobCleanupType,
+        cmdlineKey="OverrideJobCleanupType",
+        cmdlineType="enumName",
+    ),
+    _JobField(
+        "cleanupOverrideEnable",
+        ("Props", "OverClean"),
+        cmdlineKey="OverrideJobCleanup",
+    ),
+    _JobField(
+        "cleanupOverrideDays",
+        ("Props", "OverCleanDays"),
+        cmdlineKey="JobCleanupDays",
+    ),
+    # Job Stats
+    _JobField(
+        "statsJobSubmissionMachine",
+        ("Mach",),
+        "internString",
+        cmdlineKey="MachineName",
+        cmdlineCondition="value",
+    ),
+    _JobField("statsJobSubmissionDateTime", ("Date",), "dateTime"),
+    _JobField("statsJobStartedDateTime", ("DateStart",), "dateTime", True),
+    _JobField("statsJobCompletedDateTime", ("DateComp",), "dateTime", True),
+    _JobField("statsJobErrors", ("Errs",), webAPIReadOnly=True),
+    _JobField("statsTasksCount", ("Props", "Tasks"), webAPIReadOnly=True),
+    _JobField("statsTasksQueued", ("QueuedChunks",), webAPIReadOnly=True),
+    _JobField("statsTasksRendering", ("RenderingChunks",), webAPIReadOnly=True),
+    _JobField("statsTasksPending", ("PendingChunks",), webAPIReadOnly=True),
+    _JobField("statsTasksCompleted", ("CompletedChunks",), webAPIReadOnly=True),
+    _JobField("statsTasksSuspended", ("SuspendedChunks",), webAPIReadOnly=True),
+    _JobField("statsTasksFailed", ("FailedChunks",), webAPIReadOnly=True),
+    # Job Notifications
+    _JobField(
+        "notificationMethodOverrideEnable",
+        ("Props", "NotOvr"),
+        cmdlineKey="OverrideNotificationMethod",
+    ),
+    _JobField(
+        "notificationTargets",
+        ("Props", "NotUser"),
+        "internStrings",
+        cmdlineKey="NotificationTargets",
+        cmdlineType="join",
+    ),
+    _JobField(
+        "notificationPopupEnable",
+        ("Props", "SndPopup"),
+        cmdlineKey="PopupNotification",
+    ),
+    _JobField(
+        "notificationEmailEnable",
+        ("Props", "SndEmail"),
+        cmdlineKey="EmailNotification",
+    ),
+    _JobField(
+        "notificationEmails",
+        ("Props", "NotEmail"),
+        cmdlineKey="NotificationEmails",
+        cmdlineType="join",
+    ),
+    _JobField("notificationNote", ("Props", "NotNote"), cmdlineKey="NotificationNote"),
+    # Job Maintenance
+    _JobField("maintenanceJobEnable", ("Main",), cmdlineKey="MaintenanceJob"),
+    _JobField(
+        "maintenanceJobStartFrame",
+        ("MainStart",),
+        cmdlineKey="MaintenanceJobStartFrame",
+    ),
+    _JobField(
+        "maintenanceJobEndFrame",
+        ("MainEnd",),
+        cmdlineKey="MaintenanceJobEndFrame",
+    ),
+    # Job Time Schedule
+    _JobField(
+        "scheduledType",
+        ("Props", "Schd"),
+        JobScheduledType,
+        cmdlineKey="ScheduledType",
+        cmdlineType="scheduledType",
+    ),
+    _JobField(
+        "scheduledDayInterval",
+        ("Props", "SchdDays"),
+        cmdlineKey="ScheduledDays",
+        cmdlineCondition=_SCHEDULED_ONCE_OR_DAILY,
+    ),
+    _JobField(
+        "scheduledDayTimeStart",
+        ("Props", "SchdDate"),
+        "dateTime",
+        cmdlineKey="ScheduledStartDateTime",
+        cmdlineType="dateTime",
+        cmdlineCondition=_SCHEDULED_ONCE_OR_DAILY,
+    ),
+    # TODO HINT ScheduledEndDateTime is NotImplemented by deadlinecommand
+    _JobField("scheduledDayTimeEnd", ("Props", "SchdStop"), "dateTime"),
+    _JobField("scheduledDayTimeDisabled"),
+) + tuple(
+    _JobField(
+        "scheduledDay{}Time{}".format(day, boundary),
+        ("Props", "{}{}".format(day[:3], webAPIBoundary)),
+        "timeSpan",
+        cmdlineKey="Scheduled{}{}Time".format(day, webAPIBoundary),
+        cmdlineType="validTimeSpan",
+        cmdlineCondition=_SCHEDULED_CUSTOM,
+    )
+    for day in (
+        "Monday",
+        "Tuesday",
+        "Wednesday",
+        "Thursday",
+        "Friday",
+        "Saturday",
+        "Sunday",
+    )
+    for boundary, webAPIBoundary in (("Start", "Start"), ("End", "Stop"))
+) + (
+    # Job Tile Rendering
+    _JobField("tileEnable", ("Tile",), cmdlineKey="TileJob"),
+    _JobField(
+        "tileFrame",
+        ("TileFrame",),
+        cmdlineKey="TileJobFrame",
+        cmdlineCondition="data.tileEnable",
+    ),
+    _JobField(
+        "tileOutputFileNames",
+        ("TileFile",),
+        cmdlineKey="OutputFilename{}Tile?",
+        cmdlineType="enumerate",
+        cmdlineCondition="data.tileEnable",
+    ),
+    _JobField(
+        "tileTilesCount",
+        ("TileCount",),
+        cmdlineKey="TileJobTileCount",
+        cmdlineCondition="data.tileEnable",
+    ),
+    _JobField(
+        "tileTilesInX",
+        ("TileX",),
+        cmdlineKey="TileJobTilesInX",
+        cmdlineCondition="data.tileEnable",
+    ),
+    _JobField(
+        "tileTilesInY",
+        ("TileY",),
+        cmdlineKey="TileJobTilesInY",
+        cmdlineCondition="data.tileEnable",
+    ),
+)
+
+# The Web API converters as (deserialize, serialize) expression templates of
+# the "{value}". A None serialize template marks a deserialize only field.
+_JOB_WEBAPI_TYPES = {
+    "value": ("{value}", "{value}"),
+    "optional": ("{value}", None),
+    "internString": ("internString({value})", "{value}"),
+    "internStrings": ("internStrings({value})", "{value}"),
+    "internKeys": ("internKeys({value})", "{value}"),
+    # The frames are only parsed once accessed.
+    "frames": (
+        "FrameSet.fromString({value})",
+        "FrameList.convertFrameListToFrameString({value})",
+    ),
+    "environment": ("internKeys({value})", "_getSubmissionEnvironment(data)"),
+    "submissionEnvironment": ("False", None),
+    "deprecated": ("{{}}", None),
+    "dateTime": ("DateTime.parse({value})", "{value}.format()"),
+    "timeSpan": ("TimeSpan.parse({value})", "{value}.format()"),
+}
+# The serializer templates that differ for complete job documents,
+# which store the job as is instead of preparing its submission.
+_JOB_WEBAPI_DOCUMENT_TYPES = {
+    "optional": "{value}",
+    "environment": "{value}",
+}
+# The marker of keys missing from partial documents.
+_MISSING = object()
+# The number of indexed field keys (e.g. Ex0-Ex9).
+_JOB_WEBAPI_INDEX_COUNT = 10
+# The Web API dataclass keys, if not all dataclass fields are serialized.
+# The other fields are deserialized with a default value.
+_JOB_WEBAPI_DATACLASS_KEYS = {
+    ScriptDependency: ("FileName", "Notes", "IgnoreFrameOffsets"),
+}
+_JOB_WEBAPI_DATACLASS_DEFAULTS = {"bool": False, "int": 0, "float": 0.0, "str": ""}
+# The command line converters as statement templates of the
+# "{key}" and "{value}", they write into the job data, plugin
+# data or auxiliary files.
+_JOB_CMDLINE_TYPES = {
+    "value": "jobData[{key}] = {value}",
+    "join": 'jobData[{key}] = ",".join({value})',
+    "joinJobIds": 'jobData[{key}] = ",".join([item.JobID for item in {value}])',
+    "joinFileNames": 'jobData[{key}] = ",".join([item.FileName for item in {value}])',
+    "enumName": "jobData[{key}] = {value}.name",
+    "enumValue": "jobData[{key}] = {value}.value",
+    "scheduledType": (
+        'jobData[{key}] = "None" if {value} is JobScheduledType.None_ else {value}.name'
+    ),
+    "frames": "jobData[{key}] = FrameList.convertFrameListToFrameString({value})",
+    "dateTime": 'jobData[{key}] = {value}.record().strftime("%d/%m/%Y %H:%M")',
+    "validTimeSpan": "if {value}.valid():\n    jobData[{key}] = {value}.format()",
+    "keyValues": (
+        "for idx, (itemKey, itemValue) in enumerate({value}.items()):\n"
+        '    jobData[{key}] = f"{{itemKey}}={{itemValue}}"'
+    ),
+    "indexed": "for idx, itemValue in {value}.items():\n    jobData[{key}] = itemValue",
+    "enumerate": (
+        "for idx, itemValue in enumerate({value}):\n    jobData[{key}] = itemValue"
+    ),
+    "listedMachines": (
+        'jobData["Allowlist" if data.machineListedInclude else "Denylist"] = (\n'
+        '    ",".join({value})\n'
+        ")"
+    ),
+    "pluginInfo": "pluginData.update({value})",
+    "auxiliaryFiles": "auxFilePaths.extend({value})",
+}
+
+
+class _JobSerializerCompiler(object):
+    """This generates flat (de)serializer functions from the
+    job field schema, they are compiled once on import.
+    """
+
+    fileName = "<Deadline.Jobs serializers>"
+
+    @staticmethod
+    def _getIndexedKeys(field: _JobField):
+        return [
+            field.webAPIKey[:-1] + (field.webAPIKey[-1].format(idx),)
+            for idx in range(_JOB_WEBAPI_INDEX_COUNT)
+        ]
+
+    @staticmethod
+    def _getDataclassKeys(cls) -> tuple:
+        return _JOB_WEBAPI_DATACLASS_KEYS.get(
+            cls, tuple(field.name for field in dataclasses.fields(cls))
+        )
+
+    @staticmethod
+    def _getKeyPathContainer(keyPath: tuple, partial: bool = False):
+        source = "props" if keyPath[0] == "Props" and len(keyPath) == 2 else "doc"
+        keys = keyPath[1:] if source == "props" else keyPath
+        expression = source
+        for key in keys[:-1]:
+            if partial:
+                expression += ".get({!r}, {{}})".format(key)
+            else:
+                expression += "[{!r}]".format(key)
+        return expression, keys[-1]
+
+    @staticmethod
+    def _getKeyPathExpression(keyPath: tuple, optional: bool = False) -> str:
+        container, key = _JobSerializerCompiler._getKeyPathContainer(keyPath)
+        if optional:
+            return "{}.get({!r})".format(container, key)
+        return "{}[{!r}]".format(container, key)
+
+    @staticmethod
+    def _getIndexKeyExpression(key: str) -> str:
+        # The index placeholder is resolved via a f-string.
+        return "f{!r}".format(key.replace("{}", "{idx}"))
+
+    @staticmethod
+    def _getDeserializeExpression(
+        field: _JobField, value: str, partial: bool = False
+    ) -> str:
+        webAPIType = field.webAPIType
+        if isinstance(webAPIType, enum.EnumMeta):
+            return "{}({})".format(webAPIType.__name__, value)
+        if dataclasses.is_dataclass(webAPIType):
+            keys = _JobSerializerCompiler._getDataclassKeys(webAPIType)
+            arguments = []
+            for dataclassField in dataclasses.fields(webAPIType):
+                if dataclassField.name in keys and not partial:
+                    argument = "item[{!r}]".format(dataclassField.name)
+                else:
+                    argument = "item.get({!r}, {!r})".format(
+                        dataclassField.name,
+                        _JOB_WEBAPI_DATACLASS_DEFAULTS[dataclassField.type],
+                    )
+                arguments.append("{}={}".format(dataclassField.name, argument))
+            return "[{}({}) for item in {}]".format(
+                webAPIType.__name__, ", ".join(arguments), value
+            )
+        return _JOB_WEBAPI_TYPES[webAPIType][0].format(value=value)
+
+    @staticmethod
+    def _getSerializeExpression(
+        field: _JobField, value: str, document: bool = False
+    ) -> str:
+        webAPIType = field.webAPIType
+        if isinstance(webAPIType, enum.EnumMeta):
+            return "{}.value".format(value)
+        if dataclasses.is_dataclass(webAPIType):
+            if document:
+                keys = [
+                    dataclassField.name
+                    for dataclassField in dataclasses.fields(webAPIType)
+                ]
+            else:
+                keys = _JobSerializerCompiler._getDataclassKeys(webAPIType)
+            return "[{{{}}} for item in {}]".format(
+                ", ".join("{!r}: item.{}".format(key, key) for key in keys), value
+            )
+        if document and webAPIType in _JOB_WEBAPI_DOCUMENT_TYPES:
+            template = _JOB_WEBAPI_DOCUMENT_TYPES[webAPIType]
+        else:
+            template = _JOB_WEBAPI_TYPES[webAPIType][1]
+        if template is None:
+            return None
+        return template.format(value=value)
+
+    @staticmethod
+    def _isDeserializedConstant(field: _JobField) -> bool:
+        # These fields are reset on deserialization, but not read.
+        return (
+            field.webAPIType in _JOB_WEBAPI_TYPES
+            and "{value}" not in _JOB_WEBAPI_TYPES[field.webAPIType][0]
+        )
+
+    @staticmethod
+    def getDeserializedFields() -> tuple:
+        """Get the fields set by the Web API deserializer.
+        Returns:
+            tuple[str]: The field names.
+        """
+        return tuple(
+            field.name
+            for field in _JOB_FIELD_SCHEMA
+            if field.webAPIKey is not None or field.webAPIType != "value"
+        )
+
+    @staticmethod
+    def generateDeserializeWebAPISource() -> str:
+        """Generate the Web API deserializer source.
+        Returns:
+            str: The source of the _deserializeWebAPI(data, doc,
+                 internString, internStrings, internKeys) function.
+        """
+        lines = [
+            "def _deserializeWebAPI("
+            "data, doc, internString, internStrings, internKeys):",
+            "    props = doc['Props']",
+            "    setSlot = object.__setattr__",
+        ]
+        for field in _JOB_FIELD_SCHEMA:
+            if field.webAPIType == "indexed":
+                # Removed indices are not serialized.
+                lines.append("    indexed = {}")
+                for idx, keyPath in enumerate(
+                    _JobSerializerCompiler._getIndexedKeys(field)
+                ):
+                    container, key = _JobSerializerCompiler._getKeyPathContainer(
+                        keyPath
+                    )
+                    lines.append("    if {!r} in {}:".format(key, container))
+                    lines.append(
+                        "        indexed[{}] = {}[{!r}]".format(idx, container, key)
+                    )
+                value = "indexed"
+            elif field.webAPIKey is not None:
+                value = _JobSerializerCompiler._getDeserializeExpression(
+                    field,
+                    _JobSerializerCompiler._getKeyPathExpression(
+                        field.webAPIKey, optional=field.webAPIType == "optional"
+                    ),
+                )
+            elif field.webAPIType != "value":
+                value = _JobSerializerCompiler._getDeserializeExpression(field, None)
+            else:
+                continue
+            trackedType = JobInternalData._TRACKED_FIELDS.get(field.name)
+            if trackedType is not None:
+                value = "{}({})".format(trackedType.__name__, value)
+            lines.append("    setSlot(data, {!r}, {})".format(field.name, value))
+        lines.append("    data._changeSet.update(_JOB_WEBAPI_DESERIALIZED_FIELDS)")
+        lines.append(
+            "    setSlot(data, '_loadedFields', _JOB_WEBAPI_DESERIALIZED_FIELDS)"
+        )
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def generateDeserializeWebAPIPartialSource() -> str:
+        """Generate the partial Web API deserializer source, it only
+        loads the fields whose keys exist and records their names.
+        The nested dataclass items are deserialized tolerantly as well.
+        Returns:
+            str: The source of the _deserializeWebAPIPartial(data, doc,
+                 internString, internStrings, internKeys) function.
+        """
+        lines = [
+            "def _deserializeWebAPIPartial("
+            "data, doc, internString, internStrings, internKeys):",
+            "    props = doc.get('Props') or {}",
+            "    setSlot = object.__setattr__",
+            "    loaded = []",
+        ]
+        for field in _JOB_FIELD_SCHEMA:
+            if field.webAPIKey is None:
+                continue
+            if _JobSerializerCompiler._isDeserializedConstant(field):
+                continue
+            trackedType = JobInternalData._TRACKED_FIELDS.get(field.name)
+            if field.webAPIType == "indexed":
+                # The loaded indices are merged into the current ones.
+                lines.append("    indexed = {}")
+                for idx, keyPath in enumerate(
+                    _JobSerializerCompiler._getIndexedKeys(field)
+                ):
+                    container, key = _JobSerializerCompiler._getKeyPathContainer(
+                        keyPath, partial=True
+                    )
+                    lines.append("    if {!r} in {}:".format(key, container))
+                    lines.append(
+                        "        indexed[{}] = {}[{!r}]".format(idx, container, key)
+                    )
+                lines.append("    if indexed:")
+                lines.append(
+                    "        setSlot(data, {!r}, {}({{**data.{}, **indexed}}))".format(
+                        field.name, trackedType.__name__, field.name
+                    )
+                )
+                lines.append("        loaded.append({!r})".format(field.name))
+                continue
+            container, key = _JobSerializerCompiler._getKeyPathContainer(
+                field.webAPIKey, partial=True
+            )
+            value = _JobSerializerCompiler._getDeserializeExpression(
+                field, "value", partial=True
+            )
+            if trackedType is not None:
+                value = "{}({})".format(trackedType.__name__, value)
+            lines.append("    value = {}.get({!r}, _MISSING)".format(container, key))
+            lines.append("    if value is not _MISSING:")
+            lines.append("        setSlot(data, {!r}, {})".format(field.name, value))
+            lines.append("        loaded.append({!r})".format(field.name))
+        lines.append("    loaded = frozenset(loaded)")
+        lines.append("    data._changeSet.update(loaded)")
+        lines.append("    setSlot(data, '_loadedFields', loaded)")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _getDictSource(name: str, items: list) -> list:
+        # Building a dict literal is faster than assigning its keys one by one.
+        lines = ["    {} = {{".format(name)]
+        lines.extend("        {!r}: {},".format(key, value) for key, value in items)
+        lines.append("    }")
+        return lines
+
+    @staticmethod
+    def generateSerializeWebAPISource(document: bool = False) -> str:
+        """Generate the Web API serializer source.
+        Args:
+            document (bool): Generate the serializer of the complete job
+                document instead, that includes the read-only fields and
+                that the Web API deserializer restores the job from.
+        Returns:
+            str: The source of the _serializeWebAPI(data)
+                 (or _serializeWebAPIDocument(data)) function.
+        """
+        items = {"props": [], "doc": [("Props", "props")]}
+        statements = []
+        for field in _JOB_FIELD_SCHEMA:
+            if field.webAPIKey is None or (field.webAPIReadOnly and not document):
+                continue
+            value = "data.{}".format(field.name)
+            if field.webAPIType == "indexed":
+                # Removed indices are not serialized.
+                statements.append("    value = {}".format(value))
+                for idx, keyPath in enumerate(
+                    _JobSerializerCompiler._getIndexedKeys(field)
+                ):
+                    statements.append("    if {} in value:".format(idx))
+                    statements.append(
+                        "        {} = value[{}]".format(
+                            _JobSerializerCompiler._getKeyPathExpression(keyPath), idx
+                        )
+                    )
+                continue
+            value = _JobSerializerCompiler._getSerializeExpression(
+                field, value, document=document
+            )
+            if value is None:
+                continue
+            if field.webAPIKey[0] == "Props":
+                items["props"].append((field.webAPIKey[1], value))
+            else:
+                items["doc"].append((field.webAPIKey[0], value))
+        if document:
+            lines = ["def _serializeWebAPIDocument(data):"]
+        else:
+            lines = ["def _serializeWebAPI(data):"]
+        lines.extend(_JobSerializerCompiler._getDictSource("props", items["props"]))
+        lines.extend(_JobSerializerCompiler._getDictSource("doc", items["doc"]))
+        lines.extend(statements)
+        lines.append("    return doc")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def generateSerializeWebAPIFieldsSource() -> str:
+        """Generate the Web API serializers of the single fields,
+        indexed fields are serialized per index instead.
+        Returns:
+            str: The source of the _serializeWebAPIFields dict of
+                 field name to serializer(data) function.
+        """
+        lines = ["_serializeWebAPIFields = {"]
+        for field in _JOB_FIELD_SCHEMA:
+            if field.webAPIKey is None or field.webAPIReadOnly:
+                continue
+            if field.webAPIType == "indexed":
+                continue
+            value = _JobSerializerCompiler._getSerializeExpression(
+                field, "data.{}".format(field.name)
+            )
+            if value is None:
+                continue
+            lines.append("    {!r}: lambda data: {},".format(field.name, value))
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def generateSerializeSubmissionCommandlineSource() -> str:
+        """Generate the deadlinecommand submission data serializer source.
+        Returns:
+            str: The source of the _serializeSubmissionCommandline(data) function.
+        """
+        items = []
+        statements = []
+        condition = None
+        for field in _JOB_FIELD_SCHEMA:
+            if field.cmdlineKey is None and field.cmdlineType == "value":
+                continue
+            template = _JOB_CMDLINE_TYPES[field.cmdlineType]
+            key = field.cmdlineKey
+            if (
+                field.cmdlineCondition is None
+                and key is not None
+                and "{}" not in key
+                and "\n" not in template
+                and template.startswith("jobData[{key}] = ")
+            ):
+                items.append(
+                    (
+                        key,
+                        template[len("jobData[{key}] = ") :].format(
+                            value="data.{}".format(field.name)
+                        ),
+                    )
+                )
+                continue
+            if key is not None:
+                if "{}" in key:
+                    key = _JobSerializerCompiler._getIndexKeyExpression(key)
+                else:
+                    key = repr(key)
+            statement = template.format(key=key, value="value")
+            indent = "    "
+            if field.cmdlineCondition is None:
+                condition = None
+                statements.append("    value = data.{}".format(field.name))
+            elif re.search(r"\bvalue\b", field.cmdlineCondition):
+                condition = None
+                statements.append("    value = data.{}".format(field.name))
+                statements.append("    if {}:".format(field.cmdlineCondition))
+                indent += "    "
+            else:
+                # Consecutive fields with the same job data
+                # condition share a single check.
+                if field.cmdlineCondition != condition:
+                    condition = field.cmdlineCondition
+                    statements.append("    if {}:".format(condition))
+                indent += "    "
+                statements.append("{}value = data.{}".format(indent, field.name))
+            statements.extend(indent + line for line in statement.split("\n"))
+        lines = ["def _serializeSubmissionCommandline(data):"]
+        lines.extend(_JobSerializerCompiler._getDictSource("jobData", items))
+        lines.append("    pluginData = {}")
+        lines.append("    auxFilePaths = []")
+        lines.extend(statements)
+        lines.append("    return jobData, pluginData, auxFilePaths")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def compile() -> dict:
+        """Compile the (de)serializers, their source is registered
+        with linecache, so that tracebacks show the generated code.
+        Returns:
+            dict: The function per name.
+        """
+        source = "\n\n".join(
+            (
+                _JobSerializerCompiler.generateDeserializeWebAPISource(),
+                _JobSerializerCompiler.generateDeserializeWebAPIPartialSource(),
+                _JobSerializerCompiler.generateSerializeWebAPISource(),
+                _JobSerializerCompiler.generateSerializeWebAPISource(document=True),
+                _JobSerializerCompiler.generateSerializeWebAPIFieldsSource(),
+                _JobSerializerCompiler.generateSerializeSubmissionCommandlineSource(),
+            )
+        )
+        fileName = _JobSerializerCompiler.fileName
+        linecache.cache[fileName] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            fileName,
+        )
+        namespace = {}
+        exec(compile(source, fileName, "exec"), globals(), namespace)
+        return namespace
+
+
+# The Web API (key path) keys each job field is deserialized from.
+_JOB_WEBAPI_DOCUMENT_KEYS = {}
+# The Web API (key path) keys each job field is serialized to.
+_JOB_WEBAPI_KEYS = {}
+# The indexed fields, that are serialized to one key per index.
+_JOB_WEBAPI_INDEXED_KEYS = {}
+for _field in _JOB_FIELD_SCHEMA:
+    if _field.webAPIKey is None:
+        _JOB_WEBAPI_DOCUMENT_KEYS[_field.name] = ()
+    elif _field.webAPIType == "indexed":
+        _JOB_WEBAPI_DOCUMENT_KEYS[_field.name] = tuple(
+            _JobSerializerCompiler._getIndexedKeys(_field)
+        )
+        _JOB_WEBAPI_INDEXED_KEYS[_field.name] = _field.webAPIKey[-1]
+    else:
+        _JOB_WEBAPI_DOCUMENT_KEYS[_field.name] = (_field.webAPIKey,)
+    if _field.webAPIReadOnly:
+        _JOB_WEBAPI_KEYS[_field.name] = ()
+    else:
+        _JOB_WEBAPI_KEYS[_field.name] = _JOB_WEBAPI_DOCUMENT_KEYS[_field.name]
+del _field
+
+# The fields set by the (full) Web API deserializer.
+_JOB_WEBAPI_DESERIALIZED_FIELDS = frozenset(
+    _JobSerializerCompiler.getDeserializedFields()
+)
+
+_JOB_SERIALIZERS = _JobSerializerCompiler.compile()
+_deserializeJobWebAPI = _JOB_SERIALIZERS["_deserializeWebAPI"]
+_deserializeJobWebAPIPartial = _JOB_SERIALIZERS["_deserializeWebAPIPartial"]
+_serializeJobWebAPI = _JOB_SERIALIZERS["_serializeWebAPI"]
+_serializeJobWebAPIDocument = _JOB_SERIALIZERS["_serializeWebAPIDocument"]
+_serializeJobWebAPIFields = _JOB_SERIALIZERS["_serializeWebAPIFields"]
+_serializeJobSubmissionCommandline = _JOB_SERIALIZERS["_serializeSubmissionCommandline"]
 
 
 class Job(object):
@@ -559,8 +3084,6 @@ class Job(object):
         return self._data.infoExtraIndexed.get(idx, None)
 
     def _SetJobExtraInfoIndex(self, idx: int, value: str):
-        # Manually tag nested data.
-        self._data._changeSet.add("infoExtraIndexed")
         if value is None:
             self._data.infoExtraIndexed.pop(idx, None)
         else:
@@ -570,8 +3093,6 @@ class Job(object):
         return self._data.taskInfoExtraNameIndexed.get(idx, None)
 
     def _SetJobTaskExtraInfoNameIndex(self, idx: int, value: str):
-        # Manually tag nested data.
-        self._data._changeSet.add("infoExtraIndexed")
         if value is None:
             self._data.taskInfoExtraNameIndexed.pop(idx, None)
         else:
@@ -584,689 +3105,213 @@ class Job(object):
     def getInternalData(self):
         return self._data
 
+    def getFrameDependencyReleasedFrames(
+        self, upstreamFrames, completedFrames, dependency: OffsetDependency = None
+    ):
+        """Get the frames of this job, that are released by the completed
+        frames of an upstream job it is frame dependent on. A frame is
+        released, once all upstream frames in its offset window
+        (frame + start offset to frame + end offset) have completed.
+        Args:
+            upstreamFrames (FrameSet | Iterable[int]): The upstream job's frames.
+            completedFrames (FrameSet | Iterable[int]): The upstream job's completed frames.
+            dependency (OffsetDependency): The dependency, if its frame offsets
+                override or ignore the job's frame dependency offsets.
+        Returns:
+            FrameSet: The released (sorted) frames.
+        """
+        startOffset = self._data.dependencyFrameOffsetStart
+        endOffset = self._data.dependencyFrameOffsetEnd
+        if dependency is not None:
+            if dependency.IgnoreFrameOffsets:
+                startOffset = endOffset = 0
+            elif dependency.OverrideFrameOffsets:
+                startOffset = dependency.StartOffset
+                endOffset = dependency.EndOffset
+        if not isinstance(upstreamFrames, FrameSet):
+            upstreamFrames = FrameSet(upstreamFrames)
+        pendingFrames = upstreamFrames.difference(completedFrames)
+        # Each pending run blocks the frames whose offset window overlaps it.
+        # If the window is at least as wide as the run's step, the windows
+        # of its frames touch and the run dilates to a single range,
+        # otherwise it blocks one shifted copy per offset.
+        windowLength = endOffset - startOffset + 1
+        blockedRanges = []
+        for run in pendingFrames.iterRanges() if windowLength > 0 else ():
+            if len(run) == 1 or run.step <= windowLength:
+                blockedRanges.append(
+                    range(run.start - endOffset, run[-1] - startOffset + 1)
+                )
+            else:
+                blockedRanges.extend(
+                    range(run.start - offset, run.stop - offset, run.step)
+                    for offset in range(startOffset, endOffset + 1)
+                )
+        return self._data.frames.difference(FrameSet.fromRanges(blockedRanges))
+
+    def iterFrames(self):
+        """Iterate over the job's frames without materializing them.
+        Returns:
+            Iterator[int]: The frames.
+        """
+        return FrameList.iterFrames(self._data.frames)
+
+    def iterTaskFrames(self):
+        """Iterate over the job's tasks and their frames,
+        honoring the frames per task.
+        Returns:
+            Iterator[tuple[int, FrameSet]]: The (task id, task frames) chunks.
+        """
+        return FrameList.iterTaskFrames(self._data.frames, self._data.framesPerTask)
+
+    def getTaskIndex(self):
+        """Get the task index, that maps between the job's
+        tasks and frames, honoring the frames per task.
+        Returns:
+            FrameTaskIndex: The task index.
+        """
+        return FrameTaskIndex(self._data.frames, self._data.framesPerTask)
+
     def setInternalData(self, data: JobInternalData):
         self._data = data
 
-    def deserializeWebAPI(self, data: dict) -> Job:
+    def deserializeWebAPI(
+        self,
+        data: dict,
+        intern: bool = True,
+        partial: bool = False,
+        trackChanges: bool = False,
+    ) -> Job:
         """Deserialize this class from the Web API compatible format.
+        Low cardinality strings (user/department/pool/group/plugin/batch
+        names, limits and environment/plugin info keys) are interned, so
+        that many jobs loaded into a long running process share them.
+        The loaded fields are recorded, see JobInternalData.getLoadedFields.
         Args:
             data (dict): A REST API dict.
+            intern (bool): Intern low cardinality strings.
+            partial (bool): Accept partial documents (e.g. of projected
+                queries or older repositories). Missing fields keep their
+                current (for new jobs their default) value.
+            trackChanges (bool): Mark the loaded fields as changed. By default
+                the loaded state starts with a clean change tracker, so that
+                serializeWebAPIDelta only contains the later edits.
         Returns:
             Job: The deserialized job object.
         """
-        # Job General
-        self._data.id = data["_id"]
-        self._data.name = data["Props"]["Name"]
-        self._data.batchName = data["Props"]["Batch"]
-        self._data.priority = data["Props"]["Pri"]
-        self._data.protected = data["Props"]["Protect"]
-        self._data.userName = data["Props"]["User"]
-        self._data.department = data["Props"]["Dept"]
-        self._data.comment = data["Props"]["Cmmt"]
-        self._data.frames = FrameList.convertFrameStringToFrameList(
-            data["Props"]["Frames"]
-        )
-        self._data.framesPerTask = data["Props"]["Chunk"]
-        self._data.framesSequential = data["Props"]["Seq"]
-        # Job Environment
-        self._data.environment = data["Props"]["Env"]
-        self._data.environmentIsolateEnable = data["Props"]["EnvOnly"]
-        self._data.environmentSubmissionIncludeEnable = False
-        # Job Info
-        self._data.info = {}  # TODO HINT Deprecated
-        self._data.infoExtra = data["Props"]["ExDic"]
-        self._data.infoExtraIndexed = {
-            idx: data["Props"]["Ex{}".format(idx)] for idx in range(0, 10)
-        }
-        # Job Files
-        for pathMappingData in data["Props"]["PathMap"]:
-            pathMappingRule = PathMappingRule(
-                Path=pathMappingData["Path"],
-                WindowsPath=pathMappingData["WindowsPath"],
-                LinuxPath=pathMappingData["LinuxPath"],
-                MacPath=pathMappingData["MacPath"],
-                CaseSensitive=pathMappingData["CaseSensitive"],
-                RegularExpression=pathMappingData["RegularExpression"],
-                Region=pathMappingData["Region"],
-            )
-            self._data.filePathMapping.append(pathMappingRule)
-        self._data.fileOutputDirectoryPaths = data["OutDir"]
-        self._data.fileOutputFileNames = data["OutFile"]
-        self._data.fileAuxiliarySubmissionFileNames = data["Aux"]
-        self._data.fileAuxiliarySubmissionSyncFileEnable = data["Props"]["AuxSync"]
-        # Job Limits/Pools/Groups/Machines
-        self._data.resourceLimits = data["Props"]["Limits"]
-        self._data.machinePool = data["Props"]["Pool"]
-        self._data.machineSecondaryPool = data["Props"]["SecPool"]
-        self._data.machineGroup = data["Props"]["Grp"]
-        self._data.machineLimit = data["Props"]["MachLmt"]
-        self._data.machineLimitProgress = data["Props"]["MachLmtProg"]
-        self._data.machineListedInclude = data["Props"]["White"]
-        self._data.machineListedNames = data["Props"]["ListedSlaves"]
-        self._data.taskConcurrencyLimit = data["Props"]["Conc"]
-        self._data.taskConcurrencyLimitToNumberOfCpus = data["Props"]["ConcLimt"]
-        # Job State
-        self._data.status = JobStatus(data["Stat"])
-        self._data.statusErrorWarningSend = data["Props"]["SndWarn"]
-        self._data.statusFailureDetectionJobOverrideEnable = data["Props"]["JobFailOvr"]
-        self._data.statusFailureDetectionJobErrors = data["Props"]["JobFailErr"]
-        self._data.statusFailureDetectionTaskOverrideEnable = data["Props"][
-            "TskFailOvr"
-        ]
-        self._data.statusFailureDetectionTaskErrors = data["Props"]["TskFailErr"]
-        self._data.statusFailureDetectionMachineBadIgnore = data["Props"]["NoBad"]
-        self._data.statusInterruptable = data["Props"]["Int"]
-        self._data.statusInterruptablePercentage = data["Props"]["IntPer"]
-        self._data.statusInterruptableRemainingTimeThreshold = data["Props"]["RemTmT"]
-        self._data.statusTimeoutJobMinSeconds = data["Props"]["StartTime"]
-        self._data.statusTimeoutPluginInitializeMaxSeconds = data["Props"][
-            "InitializePluginTime"
-        ]
-        self._data.statusTimeoutTaskMinSeconds = data["Props"]["MinTime"]
-        self._data.statusTimeoutTaskMaxSeconds = data["Props"]["MaxTime"]
-        self._data.statusTimeoutScriptEnable = data["Props"]["TimeScrpt"]
-        self._data.statusTimeoutAutoEnable = data["Props"]["AutoTime"]
-        self._data.statusTimeoutFrameBasedEnable = data["Props"]["FrameTimeout"]
-        self._data.onJobComplete = JobCompleteAction(data["Props"]["OnComp"])
-        self._data.onTaskTimeout = TaskOnTimeout(data["Props"]["Timeout"])
-        # Job Tasks
-        self._data.taskInfoExtraNameOverrideEnable = data["Props"]["OvrTaskEINames"]
-        self._data.taskInfoExtraNameIndexed = {
-            idx: data["Props"]["TaskEx{}".format(idx)] for idx in range(0, 10)
-        }
-        # Job Plugin
-        self._data.plugin = data["Plug"]
-        self._data.pluginInfo = data["Props"]["PlugInfo"]
-        self._data.pluginForceReload = data["Props"]["Reload"]
-        self._data.pluginDirectoryCustom = data["Props"]["PlugDir"]
-        # Job Event Plugins
-        self._data.eventOptIns = data["Props"]["EventOI"]
-        self._data.eventSuppress = data["Props"]["NoEvnt"]
-        self._data.eventDirectoryCustom = data["Props"]["EventDir"]
-        # Job Pre/Post (Task) Scripts
-        self._data.scriptJobPre = data["Props"]["PrJobScrp"]
-        self._data.scriptJobPost = data["Props"]["PoJobScrp"]
-        self._data.scriptJobTaskPre = data["Props"]["PrTskScrp"]
-        self._data.scriptJobTaskPost = data["Props"]["PoTskScrp"]
-        # Job Dependencies
-        self._data.dependencyResumeOnCompleted = data["Props"]["DepComp"]
-        self._data.dependencyResumeOnDeleted = data["Props"]["DepDel"]
-        self._data.dependencyResumeOnFailed = data["Props"]["DepFail"]
-        self._data.dependencyResumePendingPercentageValue = data["Props"]["DepPer"]
-        self._data.dependencyFrameEnabled = data["Props"]["DepFrame"]
-        self._data.dependencyFrameOffsetStart = data["Props"]["DepFrameStart"]
-        self._data.dependencyFrameOffsetEnd = data["Props"]["DepFrameEnd"]
-        self._data.dependencyJobs = [
-            JobDependency(
-                JobID=d["JobID"],
-                Notes=d["Notes"],
-                IgnoreFrameOffsets=d["IgnoreFrameOffsets"],
-                OverrideFrameOffsets=d["OverrideFrameOffsets"],
-                StartOffset=d["StartOffset"],
-                EndOffset=d["EndOffset"],
-                OverrideResumeOn=d["OverrideResumeOn"],
-                ResumeOnComplete=d["ResumeOnComplete"],
-                ResumeOnDeleted=d["ResumeOnDeleted"],
-                ResumeOnFailed=d["ResumeOnFailed"],
-                ResumeOnPercentageCompleted=d["ResumeOnPercentageCompleted"],
-                ResumeOnPercentageValue=d["ResumeOnPercentageValue"]
-            )
-            for d in data["Props"]["Dep"]
-        ]
-        self._data.dependencyAssets = [
-            AssetDependency(
-                FileName=d["FileName"],
-                Notes=d["Notes"],
-                IgnoreFrameOffsets=d["IgnoreFrameOffsets"],
-                IsFrameAware=d["IsFrameAware"],
-                FrameString=d["FrameString"],
-                OverrideFrameOffsets=d["OverrideFrameOffsets"],
-                StartOffset=d["StartOffset"],
-                EndOffset=d["EndOffset"],
-            )
-            for d in data["Props"]["ReqAss"]
-        ]
-        self._data.dependencyScripts = [
-            ScriptDependency(
-                FileName=s["FileName"],
-                Notes=s["Notes"],
-                IgnoreFrameOffsets=s["IgnoreFrameOffsets"],
-            )
-            for s in data["Props"]["ScrDep"]
-        ]
-        # Job Cleanup
-        self._data.cleanupAutomaticOverrideEnable = data["Props"]["OverAutoClean"]
-        self._data.cleanupAutomaticType = AutoJobCleanupType(
-            data["Props"]["OverCleanType"]
-        )
-        self._data.cleanupOverrideEnable = data["Props"]["OverClean"]
-        self._data.cleanupOverrideDays = data["Props"]["OverCleanDays"]
-        # Job Stats
-        self._data.statsJobSubmissionMachine = data["Mach"]
-        self._data.statsJobSubmissionDateTime.parse(data["Date"])
-        self._data.statsJobStartedDateTime.parse(data["DateStart"])
-        self._data.statsJobCompletedDateTime.parse(data["DateComp"])
-        self._data.statsJobErrors = data["Errs"]
-        self._data.statsTasksCount = data["Props"]["Tasks"]
-        self._data.statsTasksQueued = data["QueuedChunks"]
-        self._data.statsTasksRendering = data["RenderingChunks"]
-        self._data.statsTasksPending = data["PendingChunks"]
-        self._data.statsTasksCompleted = data["CompletedChunks"]
-        self._data.statsTasksSuspended = data["SuspendedChunks"]
-        self._data.statsTasksFailed = data["FailedChunks"]
-        # Job Notifications
-        self._data.notificationMethodOverrideEnable = data["Props"]["NotOvr"]
-        self._data.notificationTargets = data["Props"]["NotUser"]
-        self._data.notificationPopupEnable = data["Props"]["SndPopup"]
-        self._data.notificationEmailEnable = data["Props"]["SndEmail"]
-        self._data.notificationEmails = data["Props"]["NotEmail"]
-        self._data.notificationNote = data["Props"]["NotNote"]
-        # Job Maintenance
-        self._data.maintenanceJobEnable = data["Main"]
-        self._data.maintenanceJobStartFrame = data["MainStart"]
-        self._data.maintenanceJobEndFrame = data["MainEnd"]
-        # Job Time Schedule
-        self._data.scheduledType = JobScheduledType(data["Props"]["Schd"])
-        self._data.scheduledDayInterval = data["Props"]["SchdDays"]
-        self._data.scheduledDayTimeStart.parse(data["Props"]["SchdDate"])
-        self._data.scheduledDayTimeEnd.parse(data["Props"]["SchdStop"])
-        self._data.scheduledDayMondayTimeStart.parse(data["Props"]["MonStart"])
-        self._data.scheduledDayMondayTimeStart.parse(data["Props"]["MonStop"])
-        self._data.scheduledDayTuesdayTimeStart.parse(data["Props"]["TueStart"])
-        self._data.scheduledDayTuesdayTimeEnd.parse(data["Props"]["TueStop"])
-        self._data.scheduledDayWednesdayTimeStart.parse(data["Props"]["WedStart"])
-        self._data.scheduledDayWednesdayTimeEnd.parse(data["Props"]["WedStop"])
-        self._data.scheduledDayThursdayTimeStart.parse(data["Props"]["ThuStart"])
-        self._data.scheduledDayThursdayTimeEnd.parse(data["Props"]["ThuStop"])
-        self._data.scheduledDayFridayTimeStart.parse(data["Props"]["FriStart"])
-        self._data.scheduledDayFridayTimeEnd.parse(data["Props"]["FriStop"])
-        self._data.scheduledDaySaturdayTimeStart.parse(data["Props"]["SatStart"])
-        self._data.scheduledDaySaturdayTimeEnd.parse(data["Props"]["SatStop"])
-        self._data.scheduledDaySundayTimeStart.parse(data["Props"]["SunStart"])
-        self._data.scheduledDaySundayTimeEnd.parse(data["Props"]["SunStop"])
-        # Job Tile Rendering
-        self._data.tileEnable = data["Tile"]
-        self._data.tileFrame = data["TileFrame"]
-        self._data.tileOutputFileNames = data["TileFile"]
-        self._data.tileTilesCount = data["TileCount"]
-        self._data.tileTilesInX = data["TileX"]
-        self._data.tileTilesInY = data["TileY"]
-
+        deserialize = _deserializeJobWebAPIPartial if partial else _deserializeJobWebAPI
+        if intern:
+            deserialize(self._data, data, _internString, _internStrings, _internKeys)
+        else:
+            deserialize(self._data, data, _noIntern, _noIntern, _noIntern)
+        if not trackChanges:
+            self._data.resetChangeTracker()
         return self
 
     def serializeWebAPI(self) -> dict:
         """Serialize this class to the Web API compatible format.
         Returns:
-            dict: The serialized job object.
-        """
-        data = {"Props": {}}
-        # Job General
-        data["_id"] = self._data.id
-        data["Props"]["Name"] = self._data.name
-        data["Props"]["Batch"] = self._data.batchName
-        data["Props"]["Pri"] = self._data.priority
-        data["Props"]["Protect"] = self._data.protected
-        data["Props"]["User"] = self._data.userName
-        data["Props"]["Dept"] = self._data.department
-        data["Props"]["Cmmt"] = self._data.comment
-        data["Props"]["Frames"] = FrameList.convertFrameListToFrameString(
-            self._data.frames
-        )
-        data["Props"]["Chunk"] = self._data.framesPerTask
-        data["Props"]["Seq"] = self._data.framesSequential
-        # Job Environment
-        data["Props"]["Env"] = self._data.environment
-        data["Props"]["EnvOnly"] = self._data.environmentIsolateEnable
-        if self._data.id is None:
-            # On submission env merge
-            if self._data.environmentSubmissionIncludeEnable:
-                systemEnv = copy.deepcopy(os.environ.items())
-                systemEnv.update(copy.deepcopy(self._data.environment))
-                data["Props"]["Env"] = systemEnv
-        # Job Info
-        # data[""] = self._data.info # TODO HINT Deprecated
-        data["Props"]["ExDic"] = self._data.infoExtra
-        for key, value in self._data.infoExtraIndexed.items():
-            data["Props"]["Ex{}".format(key)] = value
-        # Job Files
-        data["Props"]["PathMap"] = []
-        for pathMappingRule in self._data.filePathMapping:
-            data["Props"]["PathMap"].append(
-                {
-                    "Path": pathMappingRule.Path,
-                    "WindowsPath": pathMappingRule.WindowsPath,
-                    "LinuxPath": pathMappingRule.LinuxPath,
-                    "MacPath": pathMappingRule.MacPath,
-                    "CaseSensitive": pathMappingRule.CaseSensitive,
-                    "RegularExpression": pathMappingRule.RegularExpression,
-                    "Region": pathMappingRule.Region,
-                }
-            )
-        data["OutDir"] = self._data.fileOutputDirectoryPaths
-        data["OutFile"] = self._data.fileOutputFileNames
-        data["Aux"] = self._data.fileAuxiliarySubmissionFileNames
-        data["Props"]["AuxSync"] = self._data.fileAuxiliarySubmissionSyncFileEnable
-        # Job Limits/Groups/Pools/Machines
-        data["Props"]["Limits"] = self._data.resourceLimits
-        data["Props"]["Pool"] = self._data.machinePool
-        data["Props"]["SecPool"] = self._data.machineSecondaryPool
-        data["Props"]["Grp"] = self._data.machineGroup
-        data["Props"]["MachLmt"] = self._data.machineLimit
-        data["Props"]["MachLmtProg"] = self._data.machineLimitProgress
-        data["Props"]["White"] = self._data.machineListedInclude
-        data["Props"]["ListedSlaves"] = self._data.machineListedNames
-        data["Props"]["Conc"] = self._data.taskConcurrencyLimit
-        data["Props"]["ConcLimt"] = self._data.taskConcurrencyLimitToNumberOfCpus
-        # Job State
-        data["Stat"] = self._data.status.value
-        data["Props"]["SndWarn"] = self._data.statusErrorWarningSend
-        data["Props"]["JobFailOvr"] = self._data.statusFailureDetectionJobOverrideEnable
-        data["Props"]["JobFailErr"] = self._data.statusFailureDetectionJobErrors
-        data["Props"][
-            "TskFailOvr"
-        ] = self._data.statusFailureDetectionTaskOverrideEnable
-        data["Props"]["TskFailErr"] = self._data.statusFailureDetectionTaskErrors
-        data["Props"]["NoBad"] = self._data.statusFailureDetectionMachineBadIgnore
-        data["Props"]["Int"] = self._data.statusInterruptable
-        data["Props"]["IntPer"] = self._data.statusInterruptablePercentage
-        data["Props"]["RemTmT"] = self._data.statusInterruptableRemainingTimeThreshold
-        data["Props"]["StartTime"] = self._data.statusTimeoutJobMinSeconds
-        data["Props"][
-            "InitializePluginTime"
-        ] = self._data.statusTimeoutPluginInitializeMaxSeconds
-        data["Props"]["MinTime"] = self._data.statusTimeoutTaskMinSeconds
-        data["Props"]["MaxTime"] = self._data.statusTimeoutTaskMaxSeconds
-        data["Props"]["TimeScrpt"] = self._data.statusTimeoutScriptEnable
-        data["Props"]["AutoTime"] = self._data.statusTimeoutAutoEnable
-        data["Props"]["FrameTimeout"] = self._data.statusTimeoutFrameBasedEnable
-        data["Props"]["OnComp"] = self._data.onJobComplete.value
-        data["Props"]["Timeout"] = self._data.onTaskTimeout.value
-        # Job Tasks
-        data["Props"]["OvrTaskEINames"] = self._data.taskInfoExtraNameOverrideEnable
-        for idx in range(0, 10):
-            data["Props"]["TaskEx{}".format(idx)] = self._data.taskInfoExtraNameIndexed[
-                idx
-            ]
-        # Job Plugin
-        data["Plug"] = self._data.plugin
-        data["Props"]["PlugInfo"] = self._data.pluginInfo
-        data["Props"]["Reload"] = self._data.pluginForceReload
-        data["Props"]["PlugDir"] = self._data.pluginDirectoryCustom
-        # Job Event Plugins
-        data["Props"]["EventOI"] = self._data.eventOptIns
-        data["Props"]["NoEvnt"] = self._data.eventSuppress
-        data["Props"]["EventDir"] = self._data.eventDirectoryCustom
-        # Job Pre/Post (Task) Scripts
-        data["Props"]["PrJobScrp"] = self._data.scriptJobPre
-        data["Props"]["PoJobScrp"] = self._data.scriptJobPost
-        data["Props"]["PrTskScrp"] = self._data.scriptJobTaskPre
-        data["Props"]["PoTskScrp"] = self._data.scriptJobTaskPost
-        # Job Dependencies
-        data["Props"]["DepComp"] = self._data.dependencyResumeOnCompleted
-        data["Props"]["DepDel"] = self._data.dependencyResumeOnDeleted
-        data["Props"]["DepFail"] = self._data.dependencyResumeOnFailed
-        data["Props"]["DepPer"] = self._data.dependencyResumePendingPercentageValue
-        data["Props"]["DepFrame"] = self._data.dependencyFrameEnabled
-        data["Props"]["DepFrameStart"] = self._data.dependencyFrameOffsetStart
-        data["Props"]["DepFrameEnd"] = self._data.dependencyFrameOffsetEnd
-        data["Props"]["Dep"] = []
-        for jobDependency in self._data.dependencyJobs:
-            data["Props"]["Dep"].append(
-                {
-                    "JobID": jobDependency.JobID,
-                    "Notes": jobDependency.Notes,
-                    "IgnoreFrameOffsets": jobDependency.IgnoreFrameOffsets,
-                    "OverrideFrameOffsets": jobDependency.OverrideFrameOffsets,
-                    "StartOffset": jobDependency.StartOffset,
-                    "EndOffset": jobDependency.EndOffset,
-                    "OverrideResumeOn": jobDependency.OverrideResumeOn,
-                    "ResumeOnComplete": jobDependency.ResumeOnComplete,
-                    "ResumeOnDeleted": jobDependency.ResumeOnDeleted,
-                    "ResumeOnFailed": jobDependency.ResumeOnFailed,
-                    "ResumeOnPercentageCompleted": jobDependency.ResumeOnPercentageCompleted,
-                    "ResumeOnPercentageValue": jobDependency.ResumeOnPercentageValue,
-                }
-            )
-        
-        data["Props"]["ReqAss"] = []
-        for assetDependency in self._data.dependencyAssets:
-            data["Props"]["ReqAss"].append(
-                {
-                    "FileName": assetDependency.FileName,
-                    "Notes": assetDependency.Notes,
-                    "IgnoreFrameOffsets": assetDependency.IgnoreFrameOffsets,
-                    "IsFrameAware": assetDependency.IsFrameAware,
-                    "FrameString": assetDependency.FrameString,
-                    "OverrideFrameOffsets": assetDependency.OverrideFrameOffsets,
-                    "StartOffset": assetDependency.StartOffset,
-                    "EndOffset": assetDependency.EndOffset,
-                }
-            )
-        data["Props"]["ScrDep"] = []
-        for scriptDependency in self._data.dependencyScripts:
-            data["Props"]["ScrDep"].append(
-                {
-                    "FileName": scriptDependency.FileName,
-                    "Notes": scriptDependency.Notes,
-                    "IgnoreFrameOffsets": scriptDependency.IgnoreFrameOffsets,
-                }
-            )
-        # Job Cleanup
-        data["Props"]["OverAutoClean"] = self._data.cleanupAutomaticOverrideEnable
-        data["Props"]["OverCleanType"] = self._data.cleanupAutomaticType.value
-        data["Props"]["OverClean"] = self._data.cleanupOverrideEnable
-        data["Props"]["OverCleanDays"] = self._data.cleanupOverrideDays
-        # Job Stats
-        data["Mach"] = self._data.statsJobSubmissionMachine
-        data["Date"] = self._data.statsJobSubmissionDateTime.format()
-        # data["DateStart"] = self._data.statsJobStartedDateTime.format()
-        # data["DateComp"] = self._data.statsJobCompletedDateTime.format()
-        # data["Errs"] = self._data.statsJobErrors
-        # data["Props"]["Tasks"] = self._data.statsTasksCount
-        # data["QueuedChunks"] = self._data.statsTasksQueued
-        # data["RenderingChunks"] = self._data.statsTasksRendering
-        # data["PendingChunks"] = self._data.statsTasksPending
-        # data["CompletedChunks"] = self._data.statsTasksCompleted
-        # data["SuspendedChunks"] = self._data.statsTasksSuspended
-        # data["FailedChunks"] = self._data.statsTasksFailed
-        # Job Notifications
-        data["Props"]["NotOvr"] = self._data.notificationMethodOverrideEnable
-        data["Props"]["NotUser"] = self._data.notificationTargets
-        data["Props"]["SndPopup"] = self._data.notificationPopupEnable
-        data["Props"]["SndEmail"] = self._data.notificationEmailEnable
-        data["Props"]["NotEmail"] = self._data.notificationEmails
-        data["Props"]["NotNote"] = self._data.notificationNote
-        # Job Maintenance
-        data["Main"] = self._data.maintenanceJobEnable
-        data["MainStart"] = self._data.maintenanceJobStartFrame
-        data["MainEnd"] = self._data.maintenanceJobEndFrame
-        # Job Time Schedule
-        data["Props"]["Schd"] = self._data.scheduledType.value
-        data["Props"]["SchdDays"] = self._data.scheduledDayInterval
-        data["Props"]["SchdDate"] = self._data.scheduledDayTimeStart.format()
-        data["Props"]["SchdStop"] = self._data.scheduledDayTimeEnd.format()
-        data["Props"]["MonStart"] = self._data.scheduledDayMondayTimeStart.format()
-        data["Props"]["MonStop"] = self._data.scheduledDayMondayTimeStart.format()
-        data["Props"]["TueStart"] = self._data.scheduledDayTuesdayTimeStart.format()
-        data["Props"]["TueStop"] = self._data.scheduledDayTuesdayTimeEnd.format()
-        data["Props"]["WedStart"] = self._data.scheduledDayWednesdayTimeStart.format()
-        data["Props"]["WedStop"] = self._data.scheduledDayWednesdayTimeEnd.format()
-        data["Props"]["ThuStart"] = self._data.scheduledDayThursdayTimeStart.format()
-        data["Props"]["ThuStop"] = self._data.scheduledDayThursdayTimeEnd.format()
-        data["Props"]["FriStart"] = self._data.scheduledDayFridayTimeStart.format()
-        data["Props"]["FriStop"] = self._data.scheduledDayFridayTimeEnd.format()
-        data["Props"]["SatStart"] = self._data.scheduledDaySaturdayTimeStart.format()
-        data["Props"]["SatStop"] = self._data.scheduledDaySaturdayTimeEnd.format()
-        data["Props"]["SunStart"] = self._data.scheduledDaySundayTimeStart.format()
-        data["Props"]["SunStop"] = self._data.scheduledDaySundayTimeEnd.format()
-        # Job Tile Rendering
-        data["Tile"] = self._data.tileEnable
-        data["TileFrame"] = self._data.tileFrame
-        data["TileCount"] = self._data.tileTilesCount
-        data["TileFile"] = self._data.tileOutputFileNames
-        data["TileX"] = self._data.tileTilesInX
-        data["TileY"] = self._data.tileTilesInY
-
-        return data
-
-    def serializeSubmissionCommandlineDictionaries(self):
-        """Serialize this class to the deadlinecommand submission
-        file compatible data format.
-        Returns:
-            dict: The job data.
-            dict: The plugin data.
-            list[str]: The list of auxiliary file paths.
-        """
-        jobData = {}
-        pluginData = {}
-        auxFilePaths = []
-        # Job General
-        if self._data.repository:
-            jobData["NetworkRoot"] = self._data.repository
-        jobData["Name"] = self._data.name
-        jobData["BatchName"] = self._data.batchName
-        jobData["Priority"] = self._data.priority
-        jobData["Protected"] = self._data.protected
-        jobData["UserName"] = self._data.userName
-        jobData["Department"] = self._data.department
-        jobData["Comment"] = self._data.comment
-        jobData["Frames"] = FrameList.convertFrameListToFrameString(self._data.frames)
-        jobData["ChunkSize"] = self._data.framesPerTask
-        jobData["Sequential"] = self._data.framesSequential
-        # Job Environment
-        env_idx = -1
-        for key, value in self._data.environment.items():
-            env_idx += 1
-            jobData["EnvironmentKeyValue{}".format(env_idx)] = "{}={}".format(
-                key, value
-            )
-        jobData["UseJobEnvironmentOnly"] = self._data.environmentIsolateEnable
-        jobData["IncludeEnvironment"] = self._data.environmentSubmissionIncludeEnable
-        # Job Info
-        # job_data[""] = self._data.info # TODO HINT Deprecated
-        extra_info_idx = -1
-        for key, value in self._data.infoExtra.items():
-            extra_info_idx += 1
-            jobData["ExtraInfoKeyValue{}".format(extra_info_idx)] = "{}={}".format(
-                key, value
-            )
-        for key, value in self._data.infoExtraIndexed.items():
-            jobData["ExtraInfo{}".format(key)] = value
-        # Job Files
-        for idx, output_directory in enumerate(self._data.fileOutputDirectoryPaths):
-            jobData["OutputDirectory{}".format(idx)] = output_directory
-        if not self._data.tileEnable:
-            for idx, output_file_name in enumerate(self._data.fileOutputFileNames):
-                jobData["OutputFilename{}".format(idx)] = output_file_name
-        for auxSubmissionFileName in self._data.fileAuxiliarySubmissionFileNames:
-            auxFilePaths.append(auxSubmissionFileName)
-        jobData["SynchronizeAllAuxiliaryFiles"] = (
-            self._data.fileAuxiliarySubmissionSyncFileEnable
-        )
-        # Job Limits/Groups/Pools/Machines
-        jobData["LimitGroups"] = ",".join(self._data.resourceLimits)
-        jobData["Pool"] = self._data.machinePool
-        jobData["SecondaryPool"] = self._data.machineSecondaryPool
-        jobData["Group"] = self._data.machineGroup
-        jobData["MachineLimit"] = self._data.machineLimit
-        jobData["MachineLimitProgress"] = self._data.machineLimitProgress
-        if self._data.machineListedInclude:
-            jobData["Allowlist"] = ",".join(self._data.machineListedNames)
-        else:
-            jobData["Denylist"] = ",".join(self._data.machineListedNames)
-        jobData["ConcurrentTasks"] = self._data.taskConcurrencyLimit
-        jobData["LimitConcurrentTasksToNumberOfCpus"] = (
-            self._data.taskConcurrencyLimitToNumberOfCpus
-        )
-        # Job State
-        jobData["InitialStatus"] = self._data.status.name
-        jobData["SendJobErrorWarning"] = self._data.statusErrorWarningSend
-        jobData["OverrideJobFailureDetection"] = (
-            self._data.statusFailureDetectionJobOverrideEnable
-        )
-        jobData["FailureDetectionJobErrors"] = (
-            self._data.statusFailureDetectionJobErrors
-        )
-        jobData["OverrideTaskFailureDetection"] = (
-            self._data.statusFailureDetectionTaskOverrideEnable
-        )
-        jobData["FailureDetectionTaskErrors"] = (
-            self._data.statusFailureDetectionTaskErrors
-        )
-        jobData["IgnoreBadJobDetection"] = (
-            self._data.statusFailureDetectionMachineBadIgnore
-        )
-
-        jobData["Interruptible"] = self._data.statusInterruptable
-        jobData["InterruptiblePercentage"] = self._data.statusInterruptablePercentage
-        jobData["RemTimeThreshold"] = (
-            self._data.statusInterruptableRemainingTimeThreshold
-        )
-        jobData["StartJobTimeoutSeconds"] = self._data.statusTimeoutJobMinSeconds
-        jobData["InitializePluginTimeoutSeconds"] = (
-            self._data.statusTimeoutPluginInitializeMaxSeconds
-        )
-        jobData["MinRenderTimeSeconds"] = self._data.statusTimeoutTaskMinSeconds
-        jobData["TaskTimeoutSeconds"] = self._data.statusTimeoutTaskMaxSeconds
-        jobData["EnableTimeoutsForScriptTasks"] = self._data.statusTimeoutScriptEnable
-        jobData["EnableAutoTimeout"] = self._data.statusTimeoutAutoEnable
-        jobData["EnableFrameTimeouts"] = self._data.statusTimeoutFrameBasedEnable
-        jobData["OnJobComplete"] = self._data.onJobComplete.name
-        jobData["OnTaskTimeout"] = self._data.onTaskTimeout.value
-        # Job Tasks
-        jobData["OverrideTaskExtraInfoNames"] = (
-            self._data.taskInfoExtraNameOverrideEnable
-        )
-        for key, value in self._data.taskInfoExtraNameIndexed.items():
-            jobData["TaskExtraInfoName{}".format(key)] = value
-        # Job Plugin
-        jobData["Plugin"] = self._data.plugin
-        for key, value in self._data.pluginInfo.items():
-            pluginData[key] = value
-        jobData["ForceReloadPlugin"] = self._data.pluginForceReload
-        jobData["CustomPluginDirectory"] = self._data.pluginDirectoryCustom
-        # Job Event Plugins
-        jobData["EventOptIns"] = ",".join(self._data.eventOptIns)
-        jobData["SuppressEvents"] = self._data.eventSuppress
-        # data["Props"]["EventDir"] = self._data.custom_event_plugin_directory # TODO HINT NotImplemented
-        # Job Pre/Post (Task) Scripts
-        jobData["PreJobScript"] = self._data.scriptJobPre
-        jobData["PostJobScript"] = self._data.scriptJobPost
-        jobData["PreTaskScript"] = self._data.scriptJobTaskPre
-        jobData["PostTaskScript"] = self._data.scriptJobTaskPost
-        # Job Dependencies
-        jobData["ResumeOnCompleteDependencies"] = (
-            self._data.dependencyResumeOnCompleted
-        )
-        jobData["ResumeOnDeletedDependencies"] = self._data.dependencyResumeOnDeleted
-        jobData["ResumeOnFailedDependencies"] = self._data.dependencyResumeOnFailed
-        jobData["JobDependencyPercentage"] = (
-            self._data.dependencyResumePendingPercentageValue
-        )
-        jobData["IsFrameDependent"] = self._data.dependencyFrameEnabled
-        jobData["FrameDependencyOffsetStart"] = self._data.dependencyFrameOffsetStart
-        jobData["FrameDependencyOffsetEnd"] = self._data.dependencyFrameOffsetEnd
-        if self._data.dependencyJobs:
-            jobData["JobDependencies"] = ",".join([
-                jobDependency.JobID for jobDependency in self._data.dependencyJobs]
-            )
-        if self._data.dependencyAssets:
-            jobData["RequiredAssets"] = ",".join([
-                assetDependency.FileName for assetDependency in self._data.dependencyAssets]
-            )
-        if self._data.dependencyScripts:
-            jobData["ScriptDependencies"] = ",".join(
-                [scriptDependency.FileName for scriptDependency in self._data.dependencyScripts]
-            )
-        # Job Cleanup
-        jobData["OverrideAutoJobCleanup"] = self._data.cleanupAutomaticOverrideEnable
-        jobData["OverrideJobCleanupType"] = self._data.cleanupAutomaticType.name
-        jobData["OverrideJobCleanup"] = self._data.cleanupOverrideEnable
-        jobData["JobCleanupDays"] = self._data.cleanupOverrideDays
-        # Job Stats
-        if self._data.statsJobSubmissionMachine:
-            jobData["MachineName"] = self._data.statsJobSubmissionMachine
-        # Job Notifications
-        jobData["OverrideNotificationMethod"] = (
-            self._data.notificationMethodOverrideEnable
-        )
-        jobData["NotificationTargets"] = ",".join(self._data.notificationTargets)
-        jobData["PopupNotification"] = self._data.notificationPopupEnable
-        jobData["EmailNotification"] = self._data.notificationEmailEnable
-        jobData["NotificationEmails"] = ",".join(self._data.notificationEmails)
-        jobData["NotificationNote"] = self._data.notificationNote
-        # Job Maintenance
-        jobData["MaintenanceJob"] = self._data.maintenanceJobEnable
-        jobData["MaintenanceJobStartFrame"] = self._data.maintenanceJobStartFrame
-        jobData["MaintenanceJobEndFrame"] = self._data.maintenanceJobEndFrame
-        # Job Time Schedule
-        scheduled_type = self._data.scheduledType.name
-        scheduled_type = scheduled_type if scheduled_type != "None_" else "None"
-        jobData["ScheduledType"] = scheduled_type
-        if self._data.scheduledType != JobScheduledType.None_:
-            if self._data.scheduledType in [
-                JobScheduledType.Once,
-                JobScheduledType.Daily,
-            ]:
-                jobData["ScheduledDays"] = self._data.scheduledDayInterval
-                jobData["ScheduledStartDateTime"] = (
-                    self._data.scheduledDayTimeStart.record().strftime("%d/%m/%Y %H:%M")
-                )
-                # # TODO HINT NotImplemented by deadlinecommand
-                # if self._data.scheduledDayTimeEnd.valid():
-                #     job_data["ScheduledEndDateTime"] = self._data.scheduledDayTimeEnd.record().strftime("%d/%m/%Y %H:%M")
-            if self._data.scheduledType == JobScheduledType.Custom:
-                if self._data.scheduledDayMondayTimeStart.valid():
-                    jobData["ScheduledMondayStartTime"] = (
-                        self._data.scheduledDayMondayTimeStart.format()
-                    )
-                if self._data.scheduledDayMondayTimeEnd.valid():
-                    jobData["ScheduledMondayStopTime"] = (
-                        self._data.scheduledDayMondayTimeEnd.format()
-                    )
-                if self._data.scheduledDayTuesdayTimeStart.valid():
-                    jobData["ScheduledTuesdayStartTime"] = (
-                        self._data.scheduledDayTuesdayTimeStart.format()
-                    )
-                if self._data.scheduledDayTuesdayTimeEnd.valid():
-                    jobData["ScheduledTuesdayStopTime"] = (
-                        self._data.scheduledDayTuesdayTimeEnd.format()
-                    )
-                if self._data.scheduledDayWednesdayTimeStart.valid():
-                    jobData["ScheduledWednesdayStartTime"] = (
-                        self._data.scheduledDayWednesdayTimeStart.format()
-                    )
-                if self._data.scheduledDayWednesdayTimeEnd.valid():
-                    jobData["ScheduledWednesdayStopTime"] = (
-                        self._data.scheduledDayWednesdayTimeEnd.format()
-                    )
-                if self._data.scheduledDayThursdayTimeStart.valid():
-                    jobData["ScheduledThursdayStartTime"] = (
-                        self._data.scheduledDayThursdayTimeStart.format()
-                    )
-                if self._data.scheduledDayThursdayTimeEnd.valid():
-                    jobData["ScheduledThursdayStopTime"] = (
-                        self._data.scheduledDayThursdayTimeEnd.format()
-                    )
-                if self._data.scheduledDayFridayTimeStart.valid():
-                    jobData["ScheduledFridayStartTime"] = (
-                        self._data.scheduledDayFridayTimeStart.format()
-                    )
-                if self._data.scheduledDayFridayTimeEnd.valid():
-                    jobData["ScheduledFridayStopTime"] = (
-                        self._data.scheduledDayFridayTimeEnd.format()
-                    )
-                if self._data.scheduledDaySaturdayTimeStart.valid():
-                    jobData["ScheduledSaturdayStartTime"] = (
-                        self._data.scheduledDaySaturdayTimeStart.format()
-                    )
-                if self._data.scheduledDaySaturdayTimeEnd.valid():
-                    jobData["ScheduledSaturdayStopTime"] = (
-                        self._data.scheduledDaySaturdayTimeEnd.format()
-                    )
-                if self._data.scheduledDaySundayTimeStart.valid():
-                    jobData["ScheduledSundayStartTime"] = (
-                        self._data.scheduledDaySundayTimeStart.format()
-                    )
-                if self._data.scheduledDaySundayTimeEnd.valid():
-                    jobData["ScheduledSundayStopTime"] = (
-                        self._data.scheduledDaySundayTimeEnd.format()
-                    )
-        # Job Tile Rendering
-        jobData["TileJob"] = self._data.tileEnable
-        if self._data.tileEnable:
-            jobData["TileJobFrame"] = self._data.tileFrame
-            jobData["TileJobTileCount"] = self._data.tileTilesCount
-            jobData["TileJobTilesInX"] = self._data.tileTilesInX
-            jobData["TileJobTilesInY"] = self._data.tileTilesInY
-            output_tile_idx = -1
-            for output_tile_file_name in self._data.tileOutputFileNames:
-                output_tile_idx += 1
-                jobData["OutputFilename{}Tile?".format(output_tile_idx)] = (
-                    output_tile_file_name
-                )
+            dict: The serialized job object.
+        """
+        return _serializeJobWebAPI(self._data)
+
+    def serializeWebAPIDocument(self) -> dict:
+        """Serialize this class to a complete Web API job document.
+        Unlike serializeWebAPI, it includes the read-only fields (e.g.
+        the job statistics) and does not merge in the system environment,
+        so that deserializeWebAPI restores the job from it.
+        Returns:
+            dict: The job document.
+        """
+        return _serializeJobWebAPIDocument(self._data)
+
+    def serializeJSON(self, codec: JSONCodec | str = None) -> bytes:
+        """Serialize this class to a single line JSON job document,
+        see serializeWebAPIDocument.
+        Args:
+            codec (JSONCodec | str | None): The codec (name), defaults to
+                the fastest available one.
+        Returns:
+            bytes: The utf-8 encoded JSON.
+        """
+        return JSONCodec.get(codec).dumps(_serializeJobWebAPIDocument(self._data))
+
+    def deserializeJSON(
+        self,
+        data: bytes | str,
+        codec: JSONCodec | str = None,
+        intern: bool = True,
+        partial: bool = False,
+        trackChanges: bool = False,
+    ) -> Job:
+        """Deserialize this class from a JSON job document.
+        Args:
+            data (bytes | str): The (utf-8 encoded) JSON.
+            codec (JSONCodec | str | None): The codec (name), defaults to
+                the fastest available one.
+            intern (bool): Intern low cardinality strings.
+            partial (bool): Accept partial documents, see deserializeWebAPI.
+            trackChanges (bool): Mark the loaded fields as changed,
+                see deserializeWebAPI.
+        Returns:
+            Job: The deserialized job object.
+        """
+        return self.deserializeWebAPI(
+            JSONCodec.get(codec).loads(data),
+            intern=intern,
+            partial=partial,
+            trackChanges=trackChanges,
+        )
+
+    def serializeWebAPIDelta(self) -> dict:
+        """Serialize only the changed fields (see JobInternalData.getChangeSet)
+        to the Web API compatible format. The result always contains the
+        job id and the concurrency token, so that it can be used for
+        minimal updates of existing jobs. Removed indexed entries (e.g.
+        JobExtraInfo0 = None) are serialized as cleared ("") values.
+        Deserialized jobs start with a clean change tracker (unless they
+        are deserialized with trackChanges=True).
+        Returns:
+            dict: The partial serialized job object.
+        """
+        data = {
+            "_id": self._data.id,
+            "ConcurrencyToken": self._data.concurrencyToken,
+            "Props": {},
+        }
+        for name, changes in self._data.iterChangeSet():
+            if name in _JOB_WEBAPI_INDEXED_KEYS:
+                values = getattr(self._data, name)
+                key = _JOB_WEBAPI_INDEXED_KEYS[name]
+                if changes is None:
+                    changes = dict.fromkeys(range(_JOB_WEBAPI_INDEX_COUNT))
+                for idx, change in changes.items():
+                    if change is ChangeType.Removed or idx not in values:
+                        data["Props"][key.format(idx)] = ""
+                    else:
+                        data["Props"][key.format(idx)] = values[idx]
+                continue
+            serialize = _serializeJobWebAPIFields.get(name)
+            if serialize is None:
+                continue
+            for keyPath in _JOB_WEBAPI_KEYS[name]:
+                target = data
+                for key in keyPath[:-1]:
+                    target = target.setdefault(key, {})
+                target[keyPath[-1]] = serialize(self._data)
+        if not data["Props"]:
+            del data["Props"]
+        return data
 
-        return jobData, pluginData, auxFilePaths
+    def serializeSubmissionCommandlineDictionaries(self):
+        """Serialize this class to the deadlinecommand submission
+        file compatible data format.
+        Returns:
+            dict: The job data.
+            dict: The plugin data.
+            list[str]: The list of auxiliary file paths.
+        """
+        return _serializeJobSubmissionCommandline(self._data)
 
     def serializeSubmissionCommandlineFiles(
         self, jobFilePath: str, pluginFilePath: str
@@ -1285,35 +3330,39 @@ class Job(object):
 
         """
         jobData, pluginData, auxFilePaths = self.serializeSubmissionCommandlineDictionaries()
-
-        # Write job submission file
-        with open(jobFilePath, "w") as job_file:
-            for key, value in sorted(jobData.items()):
-                if isinstance(value, bool):
-                    value = "true" if value else "false"
-                job_file.write("{}={}\n".format(key, value))
-
-        # Write plugin submission file
-        with open(pluginFilePath, "w") as plugin_file:
-            for key, value in sorted(pluginData.items()):
-                if isinstance(bool, value):
-                    value = "true" if value else "false"
-                plugin_file.write("{}={}\n".format(key, value))
-
+        _writeSubmissionFile(jobFilePath, jobData)
+        _writeSubmissionFile(pluginFilePath, pluginData)
         return jobFilePath, pluginFilePath, auxFilePaths
 
     def duplicateJob(self):
+        """Duplicate the job, including its change set.
+        Returns:
+            Job: The duplicated job.
+        """
         job = Job()
-        job.setInternalData(copy.deepcopy(self.getInternalData()))
+        job.setInternalData(self._data.clone())
         return job
     
-    def applyChangeSet(self, job: Job):
+    def applyChangeSet(self, job: Job | JobDiff):
         """Apply the given job change set to the current job.
         Args:
-            job (Job): A modified job.
+            job (Job | JobDiff): A modified job or a job diff.
         """
-        for attrName in job._data.getChangeSet():
-            setattr(self._data, attrName, getattr(job._data, attrName))
+        if isinstance(job, JobDiff):
+            changeSet = job.iterChangeSet()
+        else:
+            changeSet = job._data.iterChangeSet()
+        for attrName, changes in changeSet:
+            value = getattr(job._data, attrName)
+            if changes is None or not isinstance(value, dict):
+                setattr(self._data, attrName, value)
+                continue
+            container = getattr(self._data, attrName)
+            for key, change in changes.items():
+                if change is ChangeType.Removed:
+                    container.pop(key, None)
+                else:
+                    container[key] = value[key]
 
     #########################################
     # Deadline Scripting API
@@ -1324,6 +3373,7 @@ class Job(object):
     #   JobRepository -> Added Property
     #   JobFrames -> Add property setter
     #   JobFramesList -> Add property setter
+    #                 -> Returns a read-only FrameSet
     #   JobFramesPerTask -> Add property setter
     #   JobPathMapping -> Added Property
     #   JobOutputDirectories -> Add property setter
@@ -1491,22 +3541,22 @@ class Job(object):
     @JobFrames.setter
     @jobPermissionSubmit
     def JobFrames(self, value: str):
-        self._data.frames = FrameList.convertFrameStringToFrameList(value)
+        self._data.frames = FrameList.convertFrameStringToFrameSet(value)
 
     @property
     def JobFramesList(self):
         """The job's frame list as an array.
         Args:
-            value (list[int]): The frame list array.
+            value (Iterable[int]): The frame list array.
         Returns:
-            str: The frame list array.
+            FrameSet: The (read-only) frame list array.
         """
         return self._data.frames
 
     @JobFramesList.setter
     @jobPermissionSubmit
     def JobFramesList(self, value):
-        self._data.frames = value
+        self._data.frames = FrameSet(value)
 
     @property
     def JobFramesPerTask(self):
@@ -1561,8 +3611,6 @@ class Job(object):
             key (str): The env variable name.
             value (str): The env variable value.
         """
-        # Manually tag nested data.
-        self._data._changeSet.add("environment")
         self._data.environment[key] = value
 
     def DeleteJobEnvironmentKey(self, key: str):
@@ -1570,8 +3618,6 @@ class Job(object):
         Args:
             key (str): The env variable name.
         """
-        # Manually tag nested data.
-        self._data._changeSet.add("environment")
         self._data.environment.pop(key, None)
 
     @property
@@ -1655,8 +3701,6 @@ class Job(object):
             key (str): The key name.
             value (str): The value.
         """
-        # Manually tag nested data.
-        self._data._changeSet.add("infoExtra")
         self._data.infoExtra[key] = value
 
     def DeleteJobExtraInfoKey(self, key: str):
@@ -1664,8 +3708,6 @@ class Job(object):
         Args:
             key (str): The key name.
         """
-        # Manually tag nested data.
-        self._data._changeSet.add("infoExtra")
         self._data.infoExtra.pop(key, None)
 
     @property
@@ -2510,8 +4552,6 @@ class Job(object):
             key (str):
             value (str):
         """
-        # Manually tag nested data.
-        self._data._changeSet.add("pluginInfo")
         self._data.pluginInfo[key] = value
 
     @property
@@ -2930,7 +4970,7 @@ class Job(object):
         # When the job is not on the farm, calculate the
         # task count.
         if self._data.statsTasksCount == -1:
-            return len(self.JobFramesList)
+            return self.getTaskIndex().getTaskCount()
         return self._data.statsTasksCount
 
     @property
@@ -3440,3 +5480,1343 @@ class Job(object):
             int: The number of tiles in y.
         """
         raise DeprecationWarning
+
+
+class JobDiff(object):
+    """A field-level diff from a reference job to a job. Like the change
+    set of a job, it can be applied via Job.applyChangeSet, which makes
+    the reference job (or a duplicate of it) match the job.
+    Fields are compared by identity first, so shared values (e.g. cached
+    frame sets) and fields that both jobs still have at their defaults
+    are skipped without being compared or materialized.
+    """
+
+    def __init__(self, referenceJob: Job, job: Job, fields=None) -> None:
+        self._data = job._data
+        if job is referenceJob:
+            self._changes = {}
+        else:
+            self._changes = JobDiff._diffData(
+                JobDiff._getFieldValues(referenceJob._data, fields), job._data
+            )
+
+    @staticmethod
+    def diffMany(referenceJob: Job, jobs, fields=None):
+        """Diff many jobs against a single reference job.
+        Args:
+            referenceJob (Job): The reference job.
+            jobs (Iterable[Job]): The jobs.
+            fields (Iterable[str] | None): The fields to compare, defaults to all fields.
+        Returns:
+            list[JobDiff]: The diff per job.
+        """
+        referenceValues = JobDiff._getFieldValues(referenceJob._data, fields)
+        diffs = []
+        for job in jobs:
+            diff = JobDiff.__new__(JobDiff)
+            diff._data = job._data
+            if job is referenceJob:
+                diff._changes = {}
+            else:
+                diff._changes = JobDiff._diffData(referenceValues, job._data)
+            diffs.append(diff)
+        return diffs
+
+    @staticmethod
+    def _getFieldValues(data: JobInternalData, fields=None):
+        """Get the field values of the reference job data, resolving unset
+        fields to their defaults without materializing them.
+        Args:
+            data (JobInternalData): The reference job data.
+            fields (Iterable[str] | None): The fields, defaults to all fields.
+        Returns:
+            list[tuple[str, member_descriptor, any]]: The (field name, slot, value) per field.
+        """
+        defaults = type(data)._getDefaults()
+        fieldValues = []
+        for name in defaults if fields is None else fields:
+            slot = JobInternalData.__dict__[name]
+            try:
+                value = slot.__get__(data)
+            except AttributeError:
+                value = defaults[name]
+            fieldValues.append((name, slot, value))
+        return fieldValues
+
+    @staticmethod
+    def _diffData(referenceValues: list, data: JobInternalData):
+        """Diff the job data against the reference field values.
+        Args:
+            referenceValues (list): The reference field values, see _getFieldValues.
+            data (JobInternalData): The job data.
+        Returns:
+            dict[str, dict | None]: The key-level changes (or None) per changed field.
+        """
+        defaults = type(data)._getDefaults()
+        changes = {}
+        for name, slot, referenceValue in referenceValues:
+            try:
+                value = slot.__get__(data)
+            except AttributeError:
+                value = defaults[name]
+            if value is referenceValue:
+                continue
+            valueType = type(value)
+            if valueType is TrackedDict or valueType is TrackedList:
+                if value == referenceValue:
+                    continue
+                changes[name] = JobDiff._diffContainer(referenceValue, value)
+            elif not value == referenceValue:
+                changes[name] = None
+        return changes
+
+    @staticmethod
+    def _diffContainer(referenceContainer, container):
+        """Diff the container against the reference container.
+        Args:
+            referenceContainer (dict | list): The reference container.
+            container (dict | list): The container.
+        Returns:
+            dict[any, ChangeType]: The change per key (or index for lists).
+        """
+        changes = {}
+        if isinstance(container, dict):
+            for key, value in container.items():
+                if key not in referenceContainer:
+                    changes[key] = ChangeType.Added
+                else:
+                    referenceValue = referenceContainer[key]
+                    if not (referenceValue is value or referenceValue == value):
+                        changes[key] = ChangeType.Modified
+            for key in referenceContainer:
+                if key not in container:
+                    changes[key] = ChangeType.Removed
+            return changes
+        referenceLength = len(referenceContainer)
+        for idx, value in enumerate(container):
+            if idx >= referenceLength:
+                changes[idx] = ChangeType.Added
+            else:
+                referenceValue = referenceContainer[idx]
+                if not (referenceValue is value or referenceValue == value):
+                    changes[idx] = ChangeType.Modified
+        for idx in range(len(container), referenceLength):
+            changes[idx] = ChangeType.Removed
+        return changes
+
+    def __bool__(self) -> bool:
+        return bool(self._changes)
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def __repr__(self) -> str:
+        return "JobDiff({})".format(sorted(self._changes))
+
+    def getChangeSet(self):
+        """Get the changed fields.
+        Returns:
+            set[str]: The changed field names.
+        """
+        return set(self._changes)
+
+    def getChangeSetKeys(self, name: str):
+        """Get the key-level changes of a changed field.
+        Args:
+            name (str): The field name.
+        Returns:
+            dict[any, ChangeType] | None: The change per key (or index for lists),
+                                          None if the field differs as a whole.
+        """
+        return self._changes.get(name)
+
+    def iterChangeSet(self):
+        """Iterate over the changed fields and their key-level changes.
+        Returns:
+            Iterator[tuple[str, dict[any, ChangeType] | None]]: The (field name, changes)
+                pairs, see getChangeSetKeys.
+        """
+        return iter(self._changes.items())
+
+    def getValue(self, name: str):
+        """Get the job's value of the given field.
+        Args:
+            name (str): The field name.
+        Returns:
+            any: The value.
+        """
+        return getattr(self._data, name)
+
+
+def _dumpsJSON(data) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _dumpsOrJSON(data) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """A JSON codec of the job JSON (-lines) serialization. The job
+    documents only contain JSON-native types, the enum, dataclass and
+    DateTime/TimeSpan fields are converted by the generated serializers.
+    Args:
+        name (str): The codec name.
+        dumps (callable): Serialize a job document to a single line
+            of utf-8 encoded JSON (bytes).
+        loads (callable): Deserialize a job document from (utf-8 encoded) JSON.
+    """
+
+    name: str
+    dumps: Callable[[dict], bytes]
+    loads: Callable[[bytes | str], dict]
+
+    @staticmethod
+    def get(codec: JSONCodec | str = None) -> JSONCodec:
+        """Get a codec.
+        Args:
+            codec (JSONCodec | str | None): The codec or its name ("json"
+                or "orjson"), defaults to orjson if it is installed.
+        Returns:
+            JSONCodec: The codec.
+        """
+        if codec is None:
+            return _JSON_CODECS["orjson" if orjson is not None else "json"]
+        if isinstance(codec, JSONCodec):
+            return codec
+        if codec not in _JSON_CODECS:
+            raise ValueError(
+                "The JSON codec '{}' is not available, available codecs: {}".format(
+                    codec, ", ".join(sorted(_JSON_CODECS))
+                )
+            )
+        return _JSON_CODECS[codec]
+
+
+_JSON_CODECS = {"json": JSONCodec("json", _dumpsJSON, json.loads)}
+if orjson is not None:
+    _JSON_CODECS["orjson"] = JSONCodec("orjson", _dumpsOrJSON, orjson.loads)
+
+
+# The JSON whitespace, see json.decoder.WHITESPACE.
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DELIMITERS = frozenset(" \t\n\r,]")
+_JSON_DECODER = json.JSONDecoder()
+# The (non-number) tokens, which may be split at the end of the unparsed text.
+_JSON_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+_JSON_TRUNCATED_ESCAPE = re.compile(r"u[0-9a-fA-F]{0,4}(?:\\(?:u[0-9a-fA-F]{0,4})?)?\Z")
+
+
+class _JSONStreamParser(object):
+    """An incremental parser of a JSON array or of JSON-lines (whitespace
+    separated JSON values). It reads the text in chunks and only keeps
+    the unparsed text in memory, which is at most a single value (and
+    the chunk it ends in).
+    Args:
+        fileObject (io.IOBase): The text or (utf-8 encoded) binary file object.
+        chunkSize (int): The read size in characters (or bytes).
+    """
+
+    def __init__(self, fileObject, chunkSize: int) -> None:
+        if isinstance(fileObject, io.TextIOBase):
+            self._decoder = None
+        else:
+            self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._fileObject = fileObject
+        self._chunkSize = chunkSize
+        self._buffer = ""
+        self._idx = 0
+        self._eof = False
+
+    def __iter__(self):
+        char = self._peek()
+        if char != "[":
+            while char:
+                yield self._decode()
+                char = self._peek()
+            return
+        self._idx += 1
+        char = self._peek()
+        if char == "]":
+            self._idx += 1
+        else:
+            while True:
+                yield self._decode()
+                char = self._peek()
+                if char == "]":
+                    self._idx += 1
+                    break
+                if char != ",":
+                    raise json.JSONDecodeError(
+                        "Expecting ',' delimiter", self._buffer, self._idx
+                    )
+                self._idx += 1
+                self._peek()
+        if self._peek():
+            raise json.JSONDecodeError("Extra data", self._buffer, self._idx)
+
+    def _read(self, size: int) -> bool:
+        """Append the next text to the unparsed text.
+        Args:
+            size (int): The read size.
+        Returns:
+            bool: If text was read, False at the end of the file.
+        """
+        if self._eof:
+            return False
+        text = ""
+        while not text:
+            data = self._fileObject.read(size)
+            if self._decoder is None:
+                text = data
+            else:
+                text = self._decoder.decode(data, not data)
+            if not data:
+                break
+        if not text:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._idx :] + text
+        self._idx = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip the whitespace and get the next character.
+        Returns:
+            str: The next character, an empty string at the end of the file.
+        """
+        while True:
+            self._idx = _JSON_WHITESPACE.match(self._buffer, self._idx).end()
+            if self._idx < len(self._buffer):
+                return self._buffer[self._idx]
+            if not self._read(self._chunkSize):
+                return ""
+
+    def _decode(self):
+        """Decode the next value, reading more text until it is complete.
+        The read size grows with the value, so that parsing
+        a value larger than the chunk size stays linear.
+        Returns:
+            any: The decoded value.
+        """
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._idx)
+            except json.JSONDecodeError as error:
+                # Only incomplete values are read further, so that invalid
+                # values fail without reading the rest of the file.
+                if self._isTruncated(error) and self._read(
+                    max(self._chunkSize, len(self._buffer) - self._idx)
+                ):
+                    continue
+                raise
+            # Numbers are only complete if they are followed by a delimiter,
+            # e.g. "2." may be the start of "2.5".
+            if (
+                isinstance(value, (dict, list, str))
+                or (end < len(self._buffer) and self._buffer[end] in _JSON_DELIMITERS)
+                or not self._read(self._chunkSize)
+            ):
+                self._idx = end
+                return value
+
+    def _isTruncated(self, error: json.JSONDecodeError) -> bool:
+        """Check if a decode error is caused by the end of the unparsed
+        text, i.e. if the value may be completed by reading more text.
+        Args:
+            error (json.JSONDecodeError): The decode error.
+        Returns:
+            bool: The state.
+        """
+        if error.pos >= len(self._buffer):
+            return True
+        if error.msg.startswith("Unterminated string"):
+            return True
+        rest = self._buffer[error.pos :]
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            return _JSON_TRUNCATED_ESCAPE.match(rest) is not None
+        if error.msg == "Expecting value":
+            return any(literal.startswith(rest) for literal in _JSON_LITERALS)
+        return False
+
+
+class JobList(object):
+    """Bulk (de)serialization of many jobs, e.g. of archived
+    Jobs.GetJobs() Web API responses.
+    """
+
+    # The default read size of the streaming loaders.
+    CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def getWebAPIProjection(fields) -> dict:
+        """Get the Web API document keys the given fields are deserialized from.
+        Args:
+            fields (Iterable[str]): The JobInternalData field names.
+        Returns:
+            dict: The nested document keys, None marks the projected values.
+        """
+        projection = {}
+        for name in fields:
+            keyPaths = _JOB_WEBAPI_DOCUMENT_KEYS.get(name)
+            if not keyPaths:
+                raise ValueError(
+                    "The job field '{}' is not deserialized from the Web API.".format(
+                        name
+                    )
+                )
+            for keyPath in keyPaths:
+                container = projection
+                for key in keyPath[:-1]:
+                    container = container.setdefault(key, {})
+                container[keyPath[-1]] = None
+        return projection
+
+    @staticmethod
+    def projectWebAPI(document: dict, projection: dict) -> dict:
+        """Project a Web API job document, like a projected database query.
+        Args:
+            document (dict): The job document.
+            projection (dict): The document keys, see getWebAPIProjection.
+        Returns:
+            dict: The partial job document.
+        """
+        projected = {}
+        for key, subProjection in projection.items():
+            if key not in document:
+                continue
+            value = document[key]
+            if subProjection is None:
+                projected[key] = value
+            elif isinstance(value, dict):
+                projected[key] = JobList.projectWebAPI(value, subProjection)
+        return projected
+
+    @staticmethod
+    def iterWebAPIDocuments(fileObject, chunkSize: int = None):
+        """Incrementally parse the job documents of a JSON array
+        (e.g. a Jobs.GetJobs() response) or of a JSON-lines stream.
+        Args:
+            fileObject (io.IOBase): The text or (utf-8 encoded) binary file
+                object, e.g. of open() or gzip.open().
+            chunkSize (int | None): The read size, defaults to CHUNK_SIZE.
+        Returns:
+            Iterator[dict]: The job documents.
+        """
+        return iter(_JSONStreamParser(fileObject, chunkSize or JobList.CHUNK_SIZE))
+
+    @staticmethod
+    def iterDeserializeWebAPI(
+        source,
+        fields=None,
+        partial: bool = False,
+        intern: bool = True,
+        chunkSize: int = None,
+        trackChanges: bool = False,
+    ):
+        """Incrementally deserialize the jobs of a JSON array or JSON-lines
+        file. Only a single job document is parsed at a time, so the memory
+        stays bounded by the jobs kept by the caller, regardless of the file size.
+        Args:
+            source (str | os.PathLike | io.IOBase): The file path or file object.
+            fields (Iterable[str] | None): Only deserialize the given
+                JobInternalData fields, the other fields keep their defaults.
+            partial (bool): Accept partial documents, see Job.deserializeWebAPI.
+                This is implied by fields.
+            intern (bool): Intern low cardinality strings.
+            chunkSize (int | None): The read size, defaults to CHUNK_SIZE.
+            trackChanges (bool): Mark the loaded fields as changed,
+                see Job.deserializeWebAPI.
+        Returns:
+            Iterator[Job]: The jobs.
+        """
+        projection = None
+        if fields is not None:
+            projection = JobList.getWebAPIProjection(fields)
+            partial = True
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "r", encoding="utf-8-sig") as fileObject:
+                yield from JobList._iterDeserializeWebAPI(
+                    fileObject, projection, partial, intern, chunkSize, trackChanges
+                )
+        else:
+            yield from JobList._iterDeserializeWebAPI(
+                source, projection, partial, intern, chunkSize, trackChanges
+            )
+
+    @staticmethod
+    def _iterDeserializeWebAPI(
+        fileObject, projection, partial, intern, chunkSize, trackChanges
+    ):
+        for document in JobList.iterWebAPIDocuments(fileObject, chunkSize):
+            if projection is not None:
+                document = JobList.projectWebAPI(document, projection)
+            yield Job().deserializeWebAPI(
+                document, intern=intern, partial=partial, trackChanges=trackChanges
+            )
+
+    @staticmethod
+    def serializeSubmissionCommandlineFiles(
+        jobs, directory: str = None, dependent: bool = False
+    ):
+        """Serialize the jobs to the deadlinecommand submission files of a
+        single multi-job submission. Per job a job and a plugin info file
+        is written, as well as an argument file (one argument per line)
+        for "deadlinecommand <argument file>".
+        Args:
+            jobs (Iterable[Job]): The jobs.
+            directory (str | None): The directory, defaults to a new
+                temporary directory. The caller is responsible for removing it.
+            dependent (bool): Make each job depend on the previous job.
+        Returns:
+            str: The argument file path.
+            list[str]: The deadlinecommand arguments.
+        """
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="deadline_submission_")
+        arguments = ["-SubmitMultipleJobs"]
+        if dependent:
+            arguments.append("-dependent")
+        for idx, job in enumerate(jobs):
+            jobFilePath = os.path.join(directory, "job_{}_info.job".format(idx))
+            pluginFilePath = os.path.join(
+                directory, "job_{}_plugin_info.job".format(idx)
+            )
+            jobData, pluginData, auxFilePaths = _serializeJobSubmissionCommandline(
+                job._data
+            )
+            _writeSubmissionFile(jobFilePath, jobData)
+            _writeSubmissionFile(pluginFilePath, pluginData)
+            arguments.append("-job")
+            arguments.append(jobFilePath)
+            arguments.append(pluginFilePath)
+            arguments.extend(auxFilePaths)
+        argumentFilePath = os.path.join(directory, "submission_arguments.txt")
+        with open(argumentFilePath, "w") as argumentFile:
+            argumentFile.write("".join("{}\n".format(arg) for arg in arguments))
+        return argumentFilePath, arguments
+
+    @staticmethod
+    def writeJSONLines(jobs, target, codec: JSONCodec | str = None) -> int:
+        """Write the jobs as JSON-lines, one complete job document
+        (see Job.serializeWebAPIDocument) per line.
+        Args:
+            jobs (Iterable[Job]): The jobs.
+            target (str | os.PathLike | io.BufferedIOBase): The file path
+                or binary file object.
+            codec (JSONCodec | str | None): The codec (name), defaults to
+                the fastest available one.
+        Returns:
+            int: The written job count.
+        """
+        dumps = JSONCodec.get(codec).dumps
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, "wb") as fileObject:
+                return JobList._writeJSONLines(jobs, fileObject, dumps)
+        return JobList._writeJSONLines(jobs, target, dumps)
+
+    @staticmethod
+    def _writeJSONLines(jobs, fileObject, dumps) -> int:
+        write = fileObject.write
+        jobCount = 0
+        for job in jobs:
+            write(dumps(_serializeJobWebAPIDocument(job._data)) + b"\n")
+            jobCount += 1
+        return jobCount
+
+    @staticmethod
+    def iterReadJSONLines(
+        source,
+        codec: JSONCodec | str = None,
+        fields=None,
+        partial: bool = False,
+        intern: bool = True,
+        trackChanges: bool = False,
+    ):
+        """Read the jobs of a JSON-lines file, e.g. of writeJSONLines.
+        The lines are decoded one at a time by the codec, so this is
+        faster than the generic streaming parser of iterDeserializeWebAPI.
+        Args:
+            source (str | os.PathLike | io.IOBase): The file path or file object.
+            codec (JSONCodec | str | None): The codec (name), defaults to
+                the fastest available one.
+            fields (Iterable[str] | None): Only deserialize the given
+                JobInternalData fields, the other fields keep their defaults.
+            partial (bool): Accept partial documents, see Job.deserializeWebAPI.
+                This is implied by fields.
+            intern (bool): Intern low cardinality strings.
+            trackChanges (bool): Mark the loaded fields as changed,
+                see Job.deserializeWebAPI.
+        Returns:
+            Iterator[Job]: The jobs.
+        """
+        loads = JSONCodec.get(codec).loads
+        projection = None
+        if fields is not None:
+            projection = JobList.getWebAPIProjection(fields)
+            partial = True
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as fileObject:
+                yield from JobList._iterReadJSONLines(
+                    fileObject, loads, projection, partial, intern, trackChanges
+                )
+        else:
+            yield from JobList._iterReadJSONLines(
+                source, loads, projection, partial, intern, trackChanges
+            )
+
+    @staticmethod
+    def _iterReadJSONLines(
+        fileObject, loads, projection, partial, intern, trackChanges
+    ):
+        for line in fileObject:
+            if not line or line.isspace():
+                continue
+            document = loads(line)
+            if projection is not None:
+                document = JobList.projectWebAPI(document, projection)
+            yield Job().deserializeWebAPI(
+                document, intern=intern, partial=partial, trackChanges=trackChanges
+            )
+
+
+# The binary job snapshot format, all integers are little-endian:
+#   header   The magic, version, job/key/value counts and section offsets.
+#   keys     The JSON list of the Web API document key paths.
+#   rows     The uint32 value index per job and key path.
+#   offsets  The uint64 value data offsets (value count + 1).
+#   values   The JSON encoded values, each distinct value is stored once.
+_SNAPSHOT_MAGIC = b"DLJOBSNP"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<8sIIIIQQQQ")
+# The value index of keys missing from a job document.
+_SNAPSHOT_MISSING = 0xFFFFFFFF
+# The decoded values that can be shared by the deserialized jobs.
+_SNAPSHOT_SHARED_TYPES = (str, int, float, bool, type(None))
+
+
+class JobSnapshot(object):
+    """A read-only binary snapshot of many jobs, that is opened via mmap.
+    Each job is a row of value indices, one per Web API document key path
+    (the fixed field schema), into a table of distinct JSON values (which
+    doubles as the string table), so recurring values like user, pool and
+    status names, as well as unchanged defaults, are only stored once.
+    Opening a snapshot only reads its header and key paths, the jobs are
+    deserialized on access and each access returns a new Job.
+    Args:
+        filePath (str | os.PathLike): The snapshot file path.
+        codec (JSONCodec | str | None): The codec (name) the values are
+            decoded with, defaults to the fastest available one.
+    """
+
+    def __init__(self, filePath, codec: JSONCodec | str = None) -> None:
+        if sys.byteorder != "little":
+            raise NotImplementedError("Job snapshots require a little-endian system.")
+        self._loads = JSONCodec.get(codec).loads
+        self._rows = None
+        self._offsets = None
+        with open(filePath, "rb") as fileObject:
+            # Empty files can not be mapped.
+            if os.fstat(fileObject.fileno()).st_size < _SNAPSHOT_HEADER.size:
+                raise ValueError("The job snapshot is truncated.")
+            self._mmap = mmap.mmap(fileObject.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open()
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        (
+            magic,
+            version,
+            self._jobCount,
+            self._keyCount,
+            valueCount,
+            keysOffset,
+            rowsOffset,
+            offsetsOffset,
+            valuesOffset,
+        ) = _SNAPSHOT_HEADER.unpack_from(self._mmap)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("The file is not a job snapshot.")
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError(
+                "The job snapshot version {} is not supported.".format(version)
+            )
+        # Partially written or copied files are detected by their sections
+        # exceeding the file, instead of failing on access.
+        rowsEnd = rowsOffset + self._jobCount * self._keyCount * 4
+        offsetsEnd = offsetsOffset + (valueCount + 1) * 8
+        if not (
+            _SNAPSHOT_HEADER.size <= keysOffset <= rowsOffset
+            and rowsEnd <= offsetsOffset
+            and offsetsEnd <= valuesOffset <= len(self._mmap)
+        ):
+            raise ValueError("The job snapshot is truncated.")
+        self._keyPaths = [
+            tuple(keyPath)
+            for keyPath in json.loads(self._mmap[keysOffset:rowsOffset].rstrip(b"\0"))
+        ]
+        view = memoryview(self._mmap)
+        self._rows = view[rowsOffset:rowsEnd].cast("I")
+        self._offsets = view[offsetsOffset:offsetsEnd].cast("Q")
+        view.release()
+        if valuesOffset + self._offsets[valueCount] > len(self._mmap):
+            raise ValueError("The job snapshot is truncated.")
+        if len(self._keyPaths) != self._keyCount:
+            raise ValueError("The job snapshot is corrupt.")
+        self._valuesOffset = valuesOffset
+        self._values = {}
+        self._slots = {keyPath: slot for slot, keyPath in enumerate(self._keyPaths)}
+        self._slotKeys = [(keyPath[:-1], keyPath[-1]) for keyPath in self._keyPaths]
+        self._parentPaths = sorted(
+            {keyPath[:-1] for keyPath in self._keyPaths if len(keyPath) > 1}, key=len
+        )
+        # Documents of snapshots written by other versions may lack keys.
+        self._partial = not set(self._keyPaths).issuperset(_getSnapshotKeyPaths())
+
+    def __enter__(self) -> JobSnapshot:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._jobCount
+
+    def __getitem__(self, idx: int) -> Job:
+        return self.getJob(idx)
+
+    def __iter__(self):
+        for idx in range(self._jobCount):
+            yield self.getJob(idx)
+
+    def close(self) -> None:
+        """Close the snapshot, the jobs deserialized so far stay valid."""
+        for view in (self._rows, self._offsets):
+            if view is not None:
+                view.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def _checkOpen(self) -> None:
+        if self._mmap.closed:
+            raise ValueError("The job snapshot is closed.")
+
+    def _getValue(self, valueIdx: int):
+        value = self._values.get(valueIdx, _MISSING)
+        if value is _MISSING:
+            valuesOffset = self._valuesOffset
+            value = self._loads(
+                self._mmap[
+                    valuesOffset
+                    + self._offsets[valueIdx] : valuesOffset
+                    + self._offsets[valueIdx + 1]
+                ]
+            )
+            # Containers are decoded per access, as jobs may modify them.
+            if type(value) in _SNAPSHOT_SHARED_TYPES:
+                self._values[valueIdx] = value
+        return value
+
+    def _getSlots(self, fields=None) -> list:
+        if fields is None:
+            return range(self._keyCount)
+        slots = []
+        for name in fields:
+            if not _JOB_WEBAPI_DOCUMENT_KEYS.get(name):
+                raise ValueError(
+                    "The job field '{}' is not deserialized from the Web API.".format(
+                        name
+                    )
+                )
+            for keyPath in _JOB_WEBAPI_DOCUMENT_KEYS[name]:
+                if keyPath in self._slots:
+                    slots.append(self._slots[keyPath])
+        return slots
+
+    def getDocument(self, idx: int, fields=None) -> dict:
+        """Get the Web API document of a job.
+        Args:
+            idx (int): The job index.
+            fields (Iterable[str] | None): Only get the document keys of
+                the given JobInternalData fields.
+        Returns:
+            dict: The (partial) job document.
+        """
+        self._checkOpen()
+        if idx < 0:
+            idx += self._jobCount
+        if not 0 <= idx < self._jobCount:
+            raise IndexError("JobSnapshot index out of range")
+        row = self._rows[idx * self._keyCount : (idx + 1) * self._keyCount].tolist()
+        document = {}
+        containers = {(): document}
+        for parentPath in self._parentPaths:
+            containers[parentPath] = containers[parentPath[:-1]].setdefault(
+                parentPath[-1], {}
+            )
+        slotKeys = self._slotKeys
+        values = self._values
+        for slot in self._getSlots(fields):
+            valueIdx = row[slot]
+            if valueIdx == _SNAPSHOT_MISSING:
+                continue
+            value = values.get(valueIdx, _MISSING)
+            if value is _MISSING:
+                value = self._getValue(valueIdx)
+            parentPath, key = slotKeys[slot]
+            containers[parentPath][key] = value
+        return document
+
+    def getJob(
+        self, idx: int, fields=None, intern: bool = True, trackChanges: bool = False
+    ) -> Job:
+        """Deserialize a job.
+        Args:
+            idx (int): The job index.
+            fields (Iterable[str] | None): Only deserialize the given
+                JobInternalData fields, the other fields keep their defaults.
+            intern (bool): Intern low cardinality strings.
+            trackChanges (bool): Mark the loaded fields as changed,
+                see Job.deserializeWebAPI.
+        Returns:
+            Job: The job.
+        """
+        return Job().deserializeWebAPI(
+            self.getDocument(idx, fields),
+            intern=intern,
+            partial=self._partial or fields is not None,
+            trackChanges=trackChanges,
+        )
+
+    def getWebAPIValues(self, name: str) -> list:
+        """Get the Web API values of a field of all jobs, without
+        deserializing the jobs (e.g. the status values of JobStatus).
+        Args:
+            name (str): The JobInternalData field name, indexed fields
+                are not supported.
+        Returns:
+            list: The value per job, None if it is missing.
+        """
+        keyPaths = _JOB_WEBAPI_DOCUMENT_KEYS.get(name)
+        if not keyPaths or len(keyPaths) != 1:
+            raise ValueError(
+                "The job field '{}' has no single Web API key.".format(name)
+            )
+        self._checkOpen()
+        slot = self._slots.get(keyPaths[0])
+        if slot is None:
+            return [None] * self._jobCount
+        getValue = self._getValue
+        return [
+            None if valueIdx == _SNAPSHOT_MISSING else getValue(valueIdx)
+            for valueIdx in self._rows[slot :: self._keyCount].tolist()
+        ]
+
+    @staticmethod
+    def write(jobs, filePath, codec: JSONCodec | str = None) -> int:
+        """Write a snapshot of the jobs. The snapshot is written next to
+        the file path first and then moved into place, so that readers
+        never open a partially written snapshot.
+        Args:
+            jobs (Iterable[Job]): The jobs.
+            filePath (str | os.PathLike): The snapshot file path.
+            codec (JSONCodec | str | None): The codec (name) the values are
+                encoded with, defaults to the fastest available one.
+        Returns:
+            int: The written job count.
+        """
+        if sys.byteorder != "little":
+            raise NotImplementedError("Job snapshots require a little-endian system.")
+        dumps = JSONCodec.get(codec).dumps
+        keyPaths = _getSnapshotKeyPaths()
+        keyCount = len(keyPaths)
+        slotTree = {}
+        for slot, keyPath in enumerate(keyPaths):
+            container = slotTree
+            for key in keyPath[:-1]:
+                container = container.setdefault(key, {})
+            container[keyPath[-1]] = slot
+        rows = array.array("I")
+        valueIndices = {}
+        encodedIndices = {}
+        encodedValues = []
+
+        def getValueIdx(value) -> int:
+            # Distinct values are looked up by value first and by their
+            # encoding second (e.g. for containers), True and 1 differ.
+            hashable = not isinstance(value, (dict, list))
+            if hashable:
+                valueIdx = valueIndices.get((type(value), value))
+                if valueIdx is not None:
+                    return valueIdx
+            encoded = dumps(value)
+            valueIdx = encodedIndices.get(encoded)
+            if valueIdx is None:
+                valueIdx = encodedIndices[encoded] = len(encodedValues)
+                encodedValues.append(encoded)
+            if hashable:
+                valueIndices[(type(value), value)] = valueIdx
+            return valueIdx
+
+        def fillRow(row: list, container: dict, slots: dict) -> None:
+            for key, value in container.items():
+                slot = slots.get(key)
+                if type(slot) is dict:
+                    if isinstance(value, dict):
+                        fillRow(row, value, slot)
+                elif slot is not None:
+                    row[slot] = getValueIdx(value)
+
+        jobCount = 0
+        for job in jobs:
+            row = [_SNAPSHOT_MISSING] * keyCount
+            fillRow(row, _serializeJobWebAPIDocument(job._data), slotTree)
+            rows.extend(row)
+            jobCount += 1
+        offsets = array.array("Q", [0])
+        offset = 0
+        for encoded in encodedValues:
+            offset += len(encoded)
+            offsets.append(offset)
+
+        keys = json.dumps(keyPaths, separators=(",", ":")).encode("utf-8")
+        keysOffset = _SNAPSHOT_HEADER.size
+        rowsOffset = _getSnapshotAlignedOffset(keysOffset + len(keys))
+        offsetsOffset = _getSnapshotAlignedOffset(rowsOffset + len(rows) * 4)
+        valuesOffset = offsetsOffset + len(offsets) * 8
+        tempFilePath = "{}.{}.tmp".format(os.fspath(filePath), os.getpid())
+        try:
+            with open(tempFilePath, "wb") as fileObject:
+                fileObject.write(
+                    _SNAPSHOT_HEADER.pack(
+                        _SNAPSHOT_MAGIC,
+                        _SNAPSHOT_VERSION,
+                        jobCount,
+                        keyCount,
+                        len(encodedValues),
+                        keysOffset,
+                        rowsOffset,
+                        offsetsOffset,
+                        valuesOffset,
+                    )
+                )
+                fileObject.write(keys)
+                fileObject.write(b"\0" * (rowsOffset - keysOffset - len(keys)))
+                rows.tofile(fileObject)
+                fileObject.write(b"\0" * (offsetsOffset - rowsOffset - len(rows) * 4))
+                offsets.tofile(fileObject)
+                fileObject.writelines(encodedValues)
+            os.replace(tempFilePath, filePath)
+        finally:
+            if os.path.exists(tempFilePath):
+                os.remove(tempFilePath)
+        return jobCount
+
+
+def _getSnapshotAlignedOffset(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+@functools.lru_cache(maxsize=None)
+def _getSnapshotKeyPaths() -> tuple:
+    """Get the Web API document key paths of the job snapshot rows.
+    Returns:
+        tuple[tuple[str]]: The key paths in schema order.
+    """
+    keyPaths = {}
+    for field in _JOB_FIELD_SCHEMA:
+        for keyPath in _JOB_WEBAPI_DOCUMENT_KEYS[field.name]:
+            keyPaths[keyPath] = None
+    return tuple(keyPaths)
+
+
+# The NumPy types of the numeric job table columns.
+_JOB_TABLE_DTYPES = {"bool": bool, "int": "int64", "float": "float64"}
+
+
+def _getJobTableKind(name: str) -> str:
+    """Get the column kind of a job field, see JobTable.
+    Args:
+        name (str): The JobInternalData field name.
+    Returns:
+        str: The column kind ("bool", "int", "float", "category" or "dateTime").
+    """
+    default = JobInternalData._getDefaults().get(name, _MISSING)
+    if default is _MISSING:
+        raise ValueError("The job field '{}' does not exist.".format(name))
+    defaultType = type(default)
+    if defaultType is bool:
+        return "bool"
+    if defaultType is int:
+        return "int"
+    if defaultType is float:
+        return "float"
+    if default is None or defaultType is str or isinstance(default, enum.Enum):
+        return "category"
+    if defaultType is DateTime:
+        return "dateTime"
+    raise ValueError(
+        "The job field '{}' ({}) can not be a table column.".format(
+            name, defaultType.__name__
+        )
+    )
+
+
+def _getDateTime64(value: DateTime):
+    """Convert a date time to a NumPy date time, aware
+    times are converted to naive UTC times.
+    Args:
+        value (DateTime): The date time.
+    Returns:
+        numpy.datetime64: The date time, NaT if it is invalid.
+    """
+    record = value.record()
+    if record is None:
+        return np.datetime64("NaT", "us")
+    if record.tzinfo is not None:
+        record = record.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(record, "us")
+
+
+class JobTable(object):
+    """A columnar (NumPy) table of jobs for vectorized analytics, e.g.
+    the queued tasks per pool or the jobs per user above a priority:
+        table = JobTable.fromJobs(jobs)
+        table.groupBy("machinePool", {"statsTasksQueued": "sum"})
+        table.filter(table.getColumn("priority") > 50).groupBy("userName")
+    The columns are named after the JobInternalData fields. Numeric and
+    boolean fields are stored as int64/float64/bool arrays, DateTime fields
+    as datetime64[us] arrays (NaT if invalid) and string and enum fields
+    are categorical, as int32 codes into their distinct values.
+    Each row references its job in the source (a list of jobs or
+    a JobSnapshot), so that selected rows round-trip to their jobs.
+    This requires NumPy.
+    """
+
+    # The default columns.
+    DEFAULT_FIELDS = (
+        "id",
+        "name",
+        "batchName",
+        "userName",
+        "department",
+        "machinePool",
+        "machineSecondaryPool",
+        "machineGroup",
+        "plugin",
+        "status",
+        "priority",
+        "statsJobSubmissionDateTime",
+        "statsJobErrors",
+        "statsTasksCount",
+        "statsTasksQueued",
+        "statsTasksRendering",
+        "statsTasksPending",
+        "statsTasksCompleted",
+        "statsTasksSuspended",
+        "statsTasksFailed",
+    )
+    # The group-by aggregation functions.
+    AGGREGATIONS = ("sum", "mean", "min", "max")
+
+    def __init__(self, source, rows, columns: dict, categories: dict) -> None:
+        self._source = source
+        self._rows = rows
+        self._columns = columns
+        self._categories = categories
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return "JobTable({} rows, {})".format(len(self), list(self._columns))
+
+    @staticmethod
+    def _requireNumPy() -> None:
+        if np is None:
+            raise ImportError("JobTable requires NumPy.")
+
+    @staticmethod
+    def _factorize(values: list, convert=None):
+        """Categorical-encode the values.
+        Args:
+            values (list): The values.
+            convert (callable | None): Convert the distinct values.
+        Returns:
+            numpy.ndarray: The int32 codes.
+            numpy.ndarray: The (converted) distinct values (object array).
+        """
+        codeByValue = {}
+        codes = np.fromiter(
+            (codeByValue.setdefault(value, len(codeByValue)) for value in values),
+            dtype=np.int32,
+            count=len(values),
+        )
+        categories = np.empty(len(codeByValue), dtype=object)
+        if convert is None:
+            categories[:] = list(codeByValue)
+        else:
+            categories[:] = [convert(value) for value in codeByValue]
+        return codes, categories
+
+    @staticmethod
+    def _fromValues(source, fieldValues, convert=None) -> JobTable:
+        columns = {}
+        categories = {}
+        for name, values in fieldValues:
+            kind = _getJobTableKind(name)
+            fieldConvert = convert(name) if convert is not None else None
+            if kind == "category":
+                columns[name], categories[name] = JobTable._factorize(
+                    values, fieldConvert
+                )
+            elif kind == "dateTime":
+                # Date times are converted once per distinct value.
+                codes, times = JobTable._factorize(values, fieldConvert)
+                columns[name] = np.array(
+                    [_getDateTime64(time) for time in times], dtype="datetime64[us]"
+                )[codes]
+            else:
+                if fieldConvert is not None:
+                    values = [fieldConvert(value) for value in values]
+                columns[name] = np.array(values, dtype=_JOB_TABLE_DTYPES[kind])
+        return JobTable(source, np.arange(len(source)), columns, categories)
+
+    @staticmethod
+    def fromJobs(jobs, fields=None) -> JobTable:
+        """Create a table of jobs.
+        Args:
+            jobs (Iterable[Job]): The jobs.
+            fields (Iterable[str] | None): The JobInternalData fields
+                (columns), defaults to DEFAULT_FIELDS.
+        Returns:
+            JobTable: The table.
+        """
+        JobTable._requireNumPy()
+        jobs = list(jobs)
+        return JobTable._fromValues(
+            jobs,
+            (
+                (name, [getattr(job._data, name) for job in jobs])
+                for name in (fields or JobTable.DEFAULT_FIELDS)
+            ),
+        )
+
+    @staticmethod
+    def fromSnapshot(snapshot: JobSnapshot, fields=None) -> JobTable:
+        """Create a table of the jobs of a snapshot. The columns are read
+        directly from the snapshot, without deserializing any job.
+        Args:
+            snapshot (JobSnapshot): The snapshot.
+            fields (Iterable[str] | None): The JobInternalData fields
+                (columns), defaults to DEFAULT_FIELDS.
+        Returns:
+            JobTable: The table.
+        """
+        JobTable._requireNumPy()
+        defaults = JobInternalData._getDefaults()
+        schema = {field.name: field for field in _JOB_FIELD_SCHEMA}
+
+        def getConvert(name: str):
+            field = schema[name]
+            if isinstance(field.webAPIType, enum.EnumMeta):
+                fromWebAPI = field.webAPIType
+            elif field.webAPIType == "dateTime":
+                fromWebAPI = DateTime.parse
+            else:
+                fromWebAPI = None
+            default = defaults[name]
+
+            # Missing values keep the default, like in partial documents.
+            def convert(value):
+                if value is None:
+                    return default
+                return value if fromWebAPI is None else fromWebAPI(value)
+
+            return convert
+
+        return JobTable._fromValues(
+            snapshot,
+            (
+                (name, snapshot.getWebAPIValues(name))
+                for name in (fields or JobTable.DEFAULT_FIELDS)
+            ),
+            getConvert,
+        )
+
+    def getFields(self) -> list:
+        """Get the column names.
+        Returns:
+            list[str]: The JobInternalData field names.
+        """
+        return list(self._columns)
+
+    def getColumn(self, name: str):
+        """Get the values of a column, categorical columns are decoded.
+        Args:
+            name (str): The column name.
+        Returns:
+            numpy.ndarray: The values.
+        """
+        if name in self._categories:
+            return self._categories[name][self._columns[name]]
+        return self._columns[name]
+
+    def getCodes(self, name: str):
+        """Get the codes of a categorical column.
+        Args:
+            name (str): The column name.
+        Returns:
+            numpy.ndarray: The int32 codes, see getCategories.
+        """
+        return self._columns[name]
+
+    def getCategories(self, name: str):
+        """Get the distinct values of a categorical column.
+        Args:
+            name (str): The column name.
+        Returns:
+            numpy.ndarray: The values (object array), indexed by the codes.
+        """
+        return self._categories[name]
+
+    def isIn(self, name: str, values):
+        """Get the rows whose column value is one of the given values.
+        Categorical columns are compared via their codes.
+        Args:
+            name (str): The column name.
+            values (Iterable): The values.
+        Returns:
+            numpy.ndarray: The boolean row mask.
+        """
+        column = self._columns[name]
+        if name in self._categories:
+            values = set(values)
+            codes = [
+                code
+                for code, category in enumerate(self._categories[name])
+                if category in values
+            ]
+            return np.isin(column, codes)
+        return np.isin(column, list(values))
+
+    def filter(self, rows) -> JobTable:
+        """Select rows.
+        Args:
+            rows (numpy.ndarray): The boolean row mask or the row indices.
+        Returns:
+            JobTable: The table of the selected rows.
+        """
+        return JobTable(
+            self._source,
+            self._rows[rows],
+            {name: column[rows] for name, column in self._columns.items()},
+            self._categories,
+        )
+
+    def groupBy(self, by, aggregations: dict = None) -> dict:
+        """Group the rows by the values of one or more columns and aggregate
+        other columns per group. The groups are ordered by their first row.
+        Args:
+            by (str | Iterable[str]): The column names to group by.
+            aggregations (dict[str, str] | None): The aggregation function
+                per numeric column name, see AGGREGATIONS. Date time columns
+                only support min and max.
+        Returns:
+            dict[str, numpy.ndarray]: The group values per grouped column,
+                the row count per group ("count") and the aggregated values
+                per aggregated column.
+        """
+        by = (by,) if isinstance(by, str) else tuple(by)
+        aggregations = aggregations or {}
+        for name, function in aggregations.items():
+            if function not in JobTable.AGGREGATIONS:
+                raise ValueError(
+                    "The aggregation '{}' is not one of {}.".format(
+                        function, ", ".join(JobTable.AGGREGATIONS)
+                    )
+                )
+            if name in self._categories:
+                raise ValueError(
+                    "The categorical column '{}' can not be aggregated.".format(name)
+                )
+            if self._columns[name].dtype.kind == "M" and function in ("sum", "mean"):
+                raise ValueError(
+                    "The date time column '{}' can only be aggregated "
+                    "via min or max, not via {}.".format(name, function)
+                )
+        keyValues = []
+        keyInverses = []
+        for name in by:
+            column = self._columns[name]
+            values, inverse = np.unique(column, return_inverse=True)
+            if name in self._categories:
+                values = self._categories[name][values]
+            keyValues.append(values)
+            keyInverses.append(inverse.ravel())
+        if len(by) == 1:
+            groupKeys = keyInverses[0]
+        else:
+            groupKeys = np.ravel_multi_index(
+                keyInverses, [len(values) for values in keyValues]
+            )
+        groups, firstRows, groupIds = np.unique(
+            groupKeys, return_index=True, return_inverse=True
+        )
+        # Renumber the groups in the order of their first row.
+        groupOrder = np.argsort(firstRows, kind="stable")
+        groupRanks = np.empty_like(groupOrder)
+        groupRanks[groupOrder] = np.arange(len(groupOrder))
+        groupIds = groupRanks[groupIds.ravel()]
+        groups = groups[groupOrder]
+
+        result = {}
+        if len(by) == 1:
+            keyIndices = (groups,)
+        else:
+            keyIndices = np.unravel_index(groups, [len(values) for values in keyValues])
+        for name, values, indices in zip(by, keyValues, keyIndices):
+            result[name] = values[indices]
+        counts = np.bincount(groupIds, minlength=len(groups))
+        result["count"] = counts
+        if not len(groups):
+            for name in aggregations:
+                result[name] = self._columns[name][:0]
+            return result
+        rowOrder = np.argsort(groupIds, kind="stable")
+        groupStarts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        for name, function in aggregations.items():
+            column = self._columns[name][rowOrder]
+            if column.dtype == bool and function in ("sum", "mean"):
+                column = column.astype(np.int64)
+            if function == "sum":
+                result[name] = np.add.reduceat(column, groupStarts)
+            elif function == "mean":
+                result[name] = np.add.reduceat(column, groupStarts) / counts
+            elif function == "min":
+                # Invalid (NaN/NaT) values are ignored.
+                result[name] = np.fmin.reduceat(column, groupStarts)
+            else:
+                result[name] = np.fmax.reduceat(column, groupStarts)
+        return result
+
+    def getJob(self, row: int) -> Job:
+        """Get the job of a row.
+        Args:
+            row (int): The row index.
+        Returns:
+            Job: The job, for tables of a snapshot it is deserialized on access.
+        """
+        return self._source[int(self._rows[row])]
+
+    def getJobs(self) -> list:
+        """Get the jobs of all rows.
+        Returns:
+            list[Job]: The jobs, for tables of a snapshot they are deserialized.
+        """
+        source = self._source
+        return [source[row] for row in self._rows.tolist()]
@@ -0,0 +1,11 @@
+"""
+The Deadline API tests, run them via:
+    python -m pytest library/python/deadlineAPI/tests
+"""
+
+import os
+import sys
+
+_DEADLINE_API_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _DEADLINE_API_ROOT not in sys.path:
+    sys.path.insert(0, _DEADLINE_API_ROOT)
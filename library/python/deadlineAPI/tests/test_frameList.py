@@ -0,0 +1,115 @@
+"""
+Tests of the frame string parser and encoder of FrameList.
+"""
+
+import pytest
+
+from Deadline.Jobs import FrameList, FrameSet
+
+
+@pytest.mark.parametrize(
+    "frameStr, frames",
+    [
+        ("", []),
+        (" , ", []),
+        ("5", [5]),
+        ("+3", [3]),
+        ("1,3 5", [1, 3, 5]),
+        ("1, 2,,3  4", [1, 2, 3, 4]),
+        ("1-5", [1, 2, 3, 4, 5]),
+        ("9-10", [9, 10]),
+        ("1-10x3", [1, 4, 7, 10]),
+        ("1-10:3", [1, 4, 7, 10]),
+        ("1-10step3", [1, 4, 7, 10]),
+        ("1-10by3", [1, 4, 7, 10]),
+        ("1-10every3", [1, 4, 7, 10]),
+        ("1:10:3", [1, 4, 7, 10]),
+        ("1:4", [1, 2, 3, 4]),
+        ("1-9x20", [1]),
+        # Reversed ranges start at the first written frame.
+        ("5-1", [5, 4, 3, 2, 1]),
+        ("10-1x2", [10, 8, 6, 4, 2]),
+        ("10-2x3", [10, 7, 4]),
+        ("10:1:4", [10, 6, 2]),
+        # Negative and signed frames.
+        ("-5", [-5]),
+        ("-3-2", [-3, -2, -1, 0, 1, 2]),
+        ("-10--7", [-10, -9, -8, -7]),
+        ("-2--6x2", [-2, -4, -6]),
+        ("1-+3", [1, 2, 3]),
+        # Duplicates and the item order are preserved.
+        ("1-3,2,1-3", [1, 2, 3, 2, 1, 2, 3]),
+        ("10,1-3", [10, 1, 2, 3]),
+        ("1-5x2,7-11x2", [1, 3, 5, 7, 9, 11]),
+        ("1,2,3,10-20x5", [1, 2, 3, 10, 15, 20]),
+    ],
+)
+def test_parse(frameStr, frames):
+    assert FrameList.convertFrameStringToFrameList(frameStr) == frames
+    assert list(FrameList.convertFrameStringToFrameSet(frameStr, cache=False)) == frames
+    # Frame sets that haven't been parsed yet stream their ranges instead.
+    frameRanges = FrameSet.fromString(frameStr).iterRanges()
+    assert [frame for frameRange in frameRanges for frame in frameRange] == frames
+
+
+@pytest.mark.parametrize(
+    "frameStr",
+    ["a", "1-", "1--", "1-5x", "1-5y2", "1+3", "1-5x-2", "1:5:2:1", "1,two,3", "1.5"],
+)
+def test_parseInvalidItems(frameStr):
+    with pytest.raises(ValueError, match="Invalid frame string item"):
+        FrameList.convertFrameStringToFrameList(frameStr)
+    with pytest.raises(ValueError, match="Invalid frame string item"):
+        list(FrameSet.fromString(frameStr).iterRanges())
+
+
+@pytest.mark.parametrize("frameStr", ["1-10x0", "1:10:0", "10-1step0"])
+def test_parseZeroStep(frameStr):
+    with pytest.raises(ValueError, match="Invalid frame step"):
+        FrameList.convertFrameStringToFrameList(frameStr)
+    with pytest.raises(ValueError, match="Invalid frame step"):
+        list(FrameSet.fromString(frameStr).iterRanges())
+
+
+@pytest.mark.parametrize(
+    "frames, frameStr",
+    [
+        ([], ""),
+        ([7], "7"),
+        ([1, 2], "1,2"),
+        ([1, 3, 5], "1,3,5"),
+        ([1, 2, 3, 4, 5], "1-5"),
+        ([5, 4, 3, 2, 1], "5-1"),
+        ([1, 3, 5, 7, 9], "1-9x2"),
+        ([20, 15, 10, 5, 0], "20-0x5"),
+        ([-4, -2, 0, 2], "-4-2x2"),
+        ([1, 2, 3, 10, 20, 30, 40], "1-3,10-40x10"),
+        ([1, 2, 3, 2, 1], "1-3,2,1"),
+        (range(1001, 2001), "1001-2000"),
+        (range(100, 0, -3), "100-1x3"),
+        ((frame * 2 for frame in range(5)), "0-8x2"),
+    ],
+)
+def test_encode(frames, frameStr):
+    assert FrameList.convertFrameListToFrameString(frames) == frameStr
+
+
+@pytest.mark.parametrize(
+    "frames",
+    [
+        [1, 2, 3, 5, 7, 9, 10, 10, 11, 30, 20, 10],
+        [-5, -3, -1, 0, 1, 2, 100, 50, 0, -50],
+        list(range(1, 1000, 7)) + list(range(2000, 1000, -3)) + [1, 1, 1],
+        list(range(10, 0, -1)) + list(range(1, 10)),
+    ],
+)
+def test_encodeRoundTrip(frames):
+    for source in (frames, iter(frames), FrameSet(frames)):
+        frameStr = FrameList.convertFrameListToFrameString(source)
+        assert FrameList.convertFrameStringToFrameList(frameStr) == frames
+
+
+def test_encodeRangeRoundTrip():
+    for frameRange in (range(0), range(5, 6), range(1, 100, 4), range(50, -50, -7)):
+        frameStr = FrameList.convertFrameListToFrameString(frameRange)
+        assert FrameList.convertFrameStringToFrameList(frameStr) == list(frameRange)
@@ -0,0 +1,166 @@
+"""
+Tests of the FrameSet algebra and the frame dependency release helper.
+"""
+
+import random
+
+import pytest
+
+from Deadline.Jobs import FrameSet, Job, JobDependency
+
+
+def createRandomFrameSet(rng):
+    """Create a frame set of random (stepped, descending and overlapping) runs."""
+    frameRanges = []
+    for _ in range(rng.randint(0, 4)):
+        start = rng.randint(-20, 60)
+        step = rng.choice([1, 1, 2, 3, 5, -1, -2])
+        frameRanges.append(range(start, start + step * rng.randint(1, 25), step))
+    return FrameSet.fromRanges(frameRanges)
+
+
+def iterRandomFrameSets(count=500):
+    rng = random.Random(1)
+    for _ in range(count):
+        yield rng, createRandomFrameSet(rng), createRandomFrameSet(rng)
+
+
+def test_union():
+    for _, frameSet, other in iterRandomFrameSets():
+        assert list(frameSet.union(other)) == sorted(set(frameSet) | set(other))
+
+
+def test_intersection():
+    for _, frameSet, other in iterRandomFrameSets():
+        assert list(frameSet.intersection(other)) == sorted(set(frameSet) & set(other))
+
+
+def test_difference():
+    for _, frameSet, other in iterRandomFrameSets():
+        assert list(frameSet.difference(other)) == sorted(set(frameSet) - set(other))
+
+
+def test_multipleOperands():
+    for rng, frameSet, other in iterRandomFrameSets(100):
+        third = createRandomFrameSet(rng)
+        frames, otherFrames, thirdFrames = set(frameSet), set(other), set(third)
+        assert list(frameSet.union(other, third)) == sorted(
+            frames | otherFrames | thirdFrames
+        )
+        assert list(frameSet.intersection(other, list(third))) == sorted(
+            frames & otherFrames & thirdFrames
+        )
+        assert list(frameSet.difference(other, third)) == sorted(
+            frames - otherFrames - thirdFrames
+        )
+
+
+def test_shift():
+    for rng, frameSet, _ in iterRandomFrameSets(100):
+        offset = rng.randint(-50, 50)
+        assert list(frameSet.shift(offset)) == [frame + offset for frame in frameSet]
+
+
+def test_subsample():
+    for rng, frameSet, _ in iterRandomFrameSets(100):
+        stride = rng.randint(1, 6)
+        offset = rng.randint(0, 4)
+        subsampled = frameSet.subsample(stride, offset)
+        assert list(subsampled) == list(frameSet)[offset::stride]
+    with pytest.raises(ValueError):
+        FrameSet(range(10)).subsample(0)
+
+
+def test_largeRangesStayCompact():
+    frameSet = FrameSet.fromRanges([range(1, 2000001)])
+    evenFrames = FrameSet.fromRanges([range(2, 2000001, 2)])
+    assert frameSet.difference(evenFrames).runs() == [(1, 1999999, 2)]
+    assert frameSet.intersection(evenFrames.shift(1)).runs() == [(3, 1999999, 2)]
+
+
+def createFrameDependentJob(frames, startOffset, endOffset):
+    job = Job()
+    job.JobFrames = frames
+    job.JobFrameDependencyOffsetStart = startOffset
+    job.JobFrameDependencyOffsetEnd = endOffset
+    return job
+
+
+def createDependency(ignore=False, override=False, startOffset=0, endOffset=0):
+    return JobDependency(
+        Notes="",
+        IgnoreFrameOffsets=ignore,
+        OverrideFrameOffsets=override,
+        StartOffset=startOffset,
+        EndOffset=endOffset,
+        JobID="5f0000000000000000000001",
+        OverrideResumeOn=False,
+        ResumeOnComplete=True,
+        ResumeOnDeleted=False,
+        ResumeOnFailed=False,
+        ResumeOnPercentageCompleted=False,
+        ResumeOnPercentageValue=100.0,
+    )
+
+
+def getReleasedFrames(frames, upstreamFrames, completedFrames, startOffset, endOffset):
+    """Get the released frames by checking the offset window of each frame."""
+    pendingFrames = set(upstreamFrames) - set(completedFrames)
+    return sorted(
+        frame
+        for frame in set(frames)
+        if not any(
+            frame + offset in pendingFrames
+            for offset in range(startOffset, endOffset + 1)
+        )
+    )
+
+
+def test_releasedFrames():
+    rng = random.Random(2)
+    for _, frameSet, upstreamFrames in iterRandomFrameSets(1000):
+        completedFrames = [frame for frame in upstreamFrames if rng.random() < 0.6]
+        startOffset = rng.randint(-6, 6)
+        endOffset = rng.randint(-6, 8)
+        job = createFrameDependentJob(frameSet.format() or "0", startOffset, endOffset)
+        frames = job.getInternalData().frames
+        assert list(
+            job.getFrameDependencyReleasedFrames(upstreamFrames, completedFrames)
+        ) == getReleasedFrames(
+            frames, upstreamFrames, completedFrames, startOffset, endOffset
+        ), (frameSet.format(), upstreamFrames.format(), startOffset, endOffset)
+
+
+def test_releasedFramesWithinOffsets():
+    job = createFrameDependentJob("1-10", -1, 1)
+    released = job.getFrameDependencyReleasedFrames(range(1, 11), [1, 2, 3, 4, 5, 9])
+    assert list(released) == [1, 2, 3, 4]
+
+
+def test_releasedFramesDependencyOffsets():
+    job = createFrameDependentJob("1-10", -1, 1)
+    completedFrames = [1, 2, 3, 4, 5, 9]
+    ignored = job.getFrameDependencyReleasedFrames(
+        range(1, 11), completedFrames, createDependency(ignore=True, startOffset=-5)
+    )
+    assert list(ignored) == [1, 2, 3, 4, 5, 9]
+    overridden = job.getFrameDependencyReleasedFrames(
+        range(1, 11),
+        completedFrames,
+        createDependency(override=True, startOffset=0, endOffset=2),
+    )
+    assert list(overridden) == [1, 2, 3]
+    notOverridden = job.getFrameDependencyReleasedFrames(
+        range(1, 11), completedFrames, createDependency(startOffset=0, endOffset=2)
+    )
+    assert list(notOverridden) == [1, 2, 3, 4]
+
+
+def test_releasedFramesOfLargeWindows():
+    job = createFrameDependentJob("1-2000000", -1000, 1000)
+    upstreamFrames = FrameSet.fromRanges([range(1, 2000001)])
+    completedFrames = FrameSet.fromRanges(
+        [range(1, 1000001), range(1000002, 2000001, 2)]
+    )
+    released = job.getFrameDependencyReleasedFrames(upstreamFrames, completedFrames)
+    assert released.runs() == [(1, 999000, 1)]
@@ -0,0 +1,192 @@
+"""
+Tests of the job change tracking, the TrackedDict/TrackedList containers
+and the change set of JobInternalData.
+"""
+
+import dataclasses
+
+import pytest
+
+from Deadline.Jobs import (
+    ChangeType,
+    Job,
+    PathMappingRule,
+    TrackedDict,
+    TrackedList,
+)
+
+
+def createTrackedDict():
+    trackedDict = TrackedDict({"a": 1, "b": 2})
+    trackedDict.resetChanges()
+    return trackedDict
+
+
+def createTrackedList():
+    trackedList = TrackedList(["a", "b", "c"])
+    trackedList.resetChanges()
+    return trackedList
+
+
+def createPathMappingRule(path):
+    return PathMappingRule(
+        Path=path,
+        WindowsPath="",
+        LinuxPath="",
+        MacPath="",
+        CaseSensitive=False,
+        RegularExpression=False,
+        Region="",
+    )
+
+
+def createLoadedData():
+    """Create loaded job data with dependencies and path mappings."""
+    job = Job()
+    job.getInternalData().id = "5f0000000000000000000001"
+    job.SetJobDependencyIDs(["5f0000000000000000000002", "5f0000000000000000000003"])
+    job.JobPathMapping = [createPathMappingRule("/a"), createPathMappingRule("/b")]
+    job.SetJobEnvironmentKeyValue("SHOT", "010")
+    return Job().deserializeWebAPI(job.serializeWebAPIDocument()).getInternalData()
+
+
+def test_trackedDictSetItem():
+    trackedDict = createTrackedDict()
+    trackedDict["a"] = 1
+    assert not trackedDict.hasChanges()
+    trackedDict["a"] = 3
+    trackedDict["c"] = 4
+    assert trackedDict.getChanges() == {"a": ChangeType.Modified, "c": ChangeType.Added}
+
+
+def test_trackedDictSetDefault():
+    trackedDict = createTrackedDict()
+    assert trackedDict.setdefault("a", 5) == 1
+    assert not trackedDict.hasChanges()
+    assert trackedDict.setdefault("c", 5) == 5
+    assert trackedDict.getChanges() == {"c": ChangeType.Added}
+
+
+def test_trackedDictPop():
+    trackedDict = createTrackedDict()
+    assert trackedDict.pop("a") == 1
+    assert trackedDict.pop("missing", None) is None
+    assert trackedDict.getChanges() == {"a": ChangeType.Removed}
+    trackedDict["a"] = 1
+    assert trackedDict.getChanges() == {"a": ChangeType.Modified}
+
+
+def test_trackedDictAddedThenRemoved():
+    trackedDict = createTrackedDict()
+    trackedDict["c"] = 3
+    del trackedDict["c"]
+    assert not trackedDict.hasChanges()
+
+
+def test_trackedDictClear():
+    trackedDict = createTrackedDict()
+    trackedDict["c"] = 3
+    trackedDict.clear()
+    assert trackedDict == {}
+    assert trackedDict.getChanges() == {"a": ChangeType.Removed, "b": ChangeType.Removed}
+
+
+def test_trackedDictInPlaceOr():
+    trackedDict = createTrackedDict()
+    trackedDict |= {"a": 1, "b": 5, "c": 6}
+    assert type(trackedDict) is TrackedDict
+    assert trackedDict.getChanges() == {"b": ChangeType.Modified, "c": ChangeType.Added}
+
+
+def test_trackedListAppendAndPop():
+    trackedList = createTrackedList()
+    trackedList.append("d")
+    assert trackedList.getChanges() == {3: ChangeType.Added}
+    trackedList.pop()
+    assert not trackedList.hasChanges()
+    trackedList.pop()
+    assert trackedList.getChanges() == {2: ChangeType.Removed}
+
+
+def test_trackedListInsertShiftsIndices():
+    trackedList = createTrackedList()
+    trackedList.insert(1, "x")
+    assert trackedList == ["a", "x", "b", "c"]
+    assert trackedList.getChanges() == {
+        1: ChangeType.Modified,
+        2: ChangeType.Modified,
+        3: ChangeType.Added,
+    }
+
+
+def test_trackedListSetItem():
+    trackedList = createTrackedList()
+    trackedList[0] = "a"
+    assert not trackedList.hasChanges()
+    trackedList[2] = "z"
+    assert trackedList.getChanges() == {2: ChangeType.Modified}
+
+
+def test_trackedListClearAndInPlaceAdd():
+    trackedList = createTrackedList()
+    trackedList.clear()
+    trackedList += ["a"]
+    assert type(trackedList) is TrackedList
+    assert trackedList.getChanges() == {1: ChangeType.Removed, 2: ChangeType.Removed}
+
+
+def test_inPlaceEditsAreTracked():
+    data = createLoadedData()
+    assert data.getChangeSet() == set()
+    data.environment["SHOT"] = "020"
+    data.machineListedNames.append("render01")
+    assert data.getChangeSet() == {"environment", "machineListedNames"}
+    assert data.getChangeSetKeys("environment") == {"SHOT": ChangeType.Modified}
+    assert data.getChangeSetKeys("machineListedNames") == {0: ChangeType.Added}
+
+
+def test_rebindingAField():
+    data = createLoadedData()
+    data.environment = {"SHOT": "030"}
+    assert isinstance(data.environment, TrackedDict)
+    assert data.getChangeSet() == {"environment"}
+    assert data.getChangeSetKeys("environment") is None
+    data.resetChangeTracker()
+    data.environment["SHOT"] = "040"
+    assert data.getChangeSetKeys("environment") == {"SHOT": ChangeType.Modified}
+
+
+@pytest.mark.parametrize(
+    "name, key", [("dependencyJobs", "Notes"), ("filePathMapping", "LinuxPath")]
+)
+def test_dataclassItemsAreImmutable(name, key):
+    data = createLoadedData()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(getattr(data, name)[0], key, "x")
+    assert data.getChangeSet() == set()
+
+
+def test_replacedDependencyIsTracked():
+    data = createLoadedData()
+    data.dependencyJobs[1] = dataclasses.replace(data.dependencyJobs[1], Notes="x")
+    assert data.getChangeSet() == {"dependencyJobs"}
+    assert data.getChangeSetKeys("dependencyJobs") == {1: ChangeType.Modified}
+    job = Job()
+    job.setInternalData(data)
+    delta = job.serializeWebAPIDelta()
+    assert [item["Notes"] for item in delta["Props"]["Dep"]] == ["", "x"]
+
+
+def test_replacedPathMappingIsApplied():
+    data = createLoadedData()
+    data.filePathMapping[0] = dataclasses.replace(
+        data.filePathMapping[0], LinuxPath="/mnt/a"
+    )
+    original = createLoadedData()
+    job = Job()
+    job.setInternalData(original)
+    modifiedJob = Job()
+    modifiedJob.setInternalData(data)
+    job.applyChangeSet(modifiedJob)
+    assert original.filePathMapping[0].LinuxPath == "/mnt/a"
+    assert original.filePathMapping[1].LinuxPath == ""
@@ -0,0 +1,123 @@
+"""
+Tests of JobInternalData.clone (Job.duplicateJob) against copy.deepcopy.
+"""
+
+import copy
+import dataclasses
+
+import pytest
+
+from Deadline.Jobs import (
+    Job,
+    JobInternalData,
+    PathMappingRule,
+    TrackedDict,
+    TrackedList,
+)
+
+
+def createLoadedJob(idx):
+    """Create a job loaded from a Web API document and edit it,
+    so that it has both reassigned fields and in-place edits.
+    """
+    job = Job()
+    job.JobName = "shot{:04d}_render".format(idx)
+    job.JobFrames = "1001-1100x2,1200"
+    job.JobExtraInfo0 = "shot{:04d}".format(idx)
+    job.SetJobDependencyIDs(["{:024x}".format(idx + 1), "{:024x}".format(idx + 2)])
+    job.JobPathMapping = [
+        PathMappingRule(
+            Path="/mnt/projects",
+            WindowsPath="P:",
+            LinuxPath="/mnt/projects",
+            MacPath="/Volumes/projects",
+            CaseSensitive=True,
+            RegularExpression=False,
+            Region="",
+        )
+    ]
+    for envIdx in range(5):
+        job.SetJobEnvironmentKeyValue("KEY_{}".format(envIdx), str(envIdx))
+    job.SetJobPluginInfoKeyValue("SceneFile", "/mnt/projects/shot.usd")
+    job.JobOutputDirectories = ["/mnt/projects/render"]
+    job.getInternalData().id = "{:024x}".format(idx)
+    job = Job().deserializeWebAPI(job.serializeWebAPIDocument())
+    job.JobPriority = 75
+    job.SetJobEnvironmentKeyValue("KEY_0", "changed")
+    job.SetJobEnvironmentKeyValue("RESUBMIT", "1")
+    job.getInternalData().machineListedNames.append("render01")
+    job.getInternalData().infoExtraIndexed.pop(0)
+    return job.getInternalData()
+
+
+def getSlots(data):
+    slots = {}
+    for name in JobInternalData.__slots__:
+        try:
+            slots[name] = object.__getattribute__(data, name)
+        except AttributeError:
+            pass
+    return slots
+
+
+@pytest.mark.parametrize("idx", range(3))
+def test_cloneEqualsDeepcopy(idx):
+    data = createLoadedJob(idx)
+    clone = data.clone()
+    deepcopy = copy.deepcopy(data)
+    cloneSlots = getSlots(clone)
+    deepcopySlots = getSlots(deepcopy)
+    assert cloneSlots.keys() == deepcopySlots.keys()
+    for name, value in deepcopySlots.items():
+        assert type(cloneSlots[name]) is type(value), name
+        assert cloneSlots[name] == value, name
+        if isinstance(value, (TrackedDict, TrackedList)):
+            assert cloneSlots[name].getChanges() == value.getChanges(), name
+    for name in JobInternalData.__slots__:
+        if not name.startswith("_"):
+            assert getattr(clone, name) == getattr(deepcopy, name), name
+
+
+def test_cloneChangeSet():
+    data = createLoadedJob(0)
+    clone = data.clone()
+    deepcopy = copy.deepcopy(data)
+    assert clone.getChangeSet() == deepcopy.getChangeSet() == data.getChangeSet()
+    assert data.getChangeSet() == {
+        "priority",
+        "environment",
+        "machineListedNames",
+        "infoExtraIndexed",
+    }
+    for name in data.getChangeSet():
+        assert clone.getChangeSetKeys(name) == deepcopy.getChangeSetKeys(name)
+    original = Job()
+    original.setInternalData(data)
+    duplicate = Job()
+    duplicate.setInternalData(clone)
+    assert duplicate.serializeWebAPIDelta() == original.serializeWebAPIDelta()
+
+
+def test_cloneIsIndependent():
+    data = createLoadedJob(0)
+    expected = copy.deepcopy(data)
+    expectedChangeSet = data.getChangeSet()
+    clone = data.clone()
+    clone.priority = 10
+    clone.environment["KEY_1"] = "clone"
+    clone.environment.pop("KEY_2")
+    clone.pluginInfo.clear()
+    clone.infoExtraIndexed[5] = "clone"
+    clone.machineListedNames.append("render02")
+    clone.fileOutputDirectoryPaths[0] = "/mnt/clone"
+    clone.dependencyJobs[0] = dataclasses.replace(clone.dependencyJobs[0], Notes="x")
+    clone.dependencyJobs.pop()
+    clone.filePathMapping[0] = dataclasses.replace(
+        clone.filePathMapping[0], LinuxPath="/mnt/clone"
+    )
+    clone.resetChangeTracker()
+    for name, value in getSlots(expected).items():
+        assert getattr(data, name) == value, name
+    assert data.getChangeSet() == expectedChangeSet
+    for name in expectedChangeSet:
+        assert data.getChangeSetKeys(name) == expected.getChangeSetKeys(name), name
@@ -0,0 +1,102 @@
+"""
+Tests of the incremental JSON parsing of JobList.iterWebAPIDocuments.
+"""
+
+import io
+import json
+
+import pytest
+
+from Deadline.Jobs import JobList
+
+DOCUMENTS = [
+    {"_id": "a", "Props": {"Name": "shot010 é漢 \U0001f3ac", "Pri": 50}},
+    {"_id": "b", "Props": {"Name": "tab\t \"quoted\" \\u", "Env": {}}},
+    [],
+    {},
+    "text",
+    -12,
+    1.5e-3,
+    12345678901234567890,
+    True,
+    False,
+    None,
+]
+
+
+class CountingReader(io.BytesIO):
+    """A binary file object that counts the bytes read."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytesRead = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytesRead += len(data)
+        return data
+
+
+def iterDocuments(text, chunkSize, binary):
+    if binary:
+        fileObject = io.BytesIO(text.encode("utf-8"))
+    else:
+        fileObject = io.StringIO(text)
+    return list(JobList.iterWebAPIDocuments(fileObject, chunkSize))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize(
+    "text",
+    [
+        json.dumps(DOCUMENTS),
+        json.dumps(DOCUMENTS, indent=2, ensure_ascii=False),
+        "\n".join(json.dumps(document) for document in DOCUMENTS) + "\n",
+        "\r\n".join(json.dumps(document, ensure_ascii=False) for document in DOCUMENTS),
+    ],
+    ids=["array", "arrayIndented", "jsonLines", "jsonLinesUnicode"],
+)
+def test_chunkSizes(text, binary):
+    maxChunkSize = max(len(json.dumps(document)) for document in DOCUMENTS) + 2
+    for chunkSize in range(1, maxChunkSize + 1):
+        assert iterDocuments(text, chunkSize, binary) == DOCUMENTS, chunkSize
+
+
+@pytest.mark.parametrize("text", ["[1234, -5.25e+10, 7]", "1234 -5.25e+10\n7"])
+def test_numbersSplitAcrossChunks(text):
+    for chunkSize in range(1, len(text) + 1):
+        assert iterDocuments(text, chunkSize, False) == [1234, -5.25e10, 7], chunkSize
+
+
+@pytest.mark.parametrize("text", ["", " \n", "[]", " [ ] "])
+def test_empty(text):
+    for chunkSize in (1, 2, 1024):
+        assert iterDocuments(text, chunkSize, False) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[1, 2",
+        "[1 2]",
+        '[{"a": 1}]]',
+        '{"a": 1',
+        '{"a": tru}',
+        '"\\ud83d\\ude0',
+        '{"a": "b\x01"}',
+    ],
+)
+def test_invalid(text):
+    for chunkSize in (1, 3, 1024):
+        with pytest.raises(json.JSONDecodeError):
+            iterDocuments(text, chunkSize, False)
+
+
+def test_syntaxErrorFailsEarly():
+    document = json.dumps({"_id": "a", "Props": {"Name": "x" * 100}})
+    invalid = document.replace('"Props":', '"Props"')
+    data = "[{}, {}]".format(invalid, ", ".join([document] * 10000)).encode("utf-8")
+    fileObject = CountingReader(data)
+    with pytest.raises(json.JSONDecodeError):
+        list(JobList.iterWebAPIDocuments(fileObject, 64))
+    assert fileObject.bytesRead <= 4 * 64
@@ -0,0 +1,125 @@
+"""
+Tests of the binary JobSnapshot format.
+"""
+
+import pytest
+
+from Deadline import Jobs
+from Deadline.Jobs import Job, JobSnapshot, JobStatus
+
+
+def createJobs(count=5):
+    jobs = []
+    for idx in range(count):
+        job = Job()
+        job.JobName = "shot{:04d}_render".format(idx)
+        job.JobUserName = "artist{}".format(idx % 2)
+        job.JobPriority = 10 * idx
+        job.JobFrames = "1-{}".format(idx + 1)
+        job.SetJobEnvironmentKeyValue("SHOT", "{:04d}".format(idx))
+        job.SetJobPluginInfoKeyValue("Version", idx)
+        job.JobOutputDirectories = ["/mnt/render/{}".format(idx)]
+        job.getInternalData().id = "{:024x}".format(idx)
+        jobs.append(job)
+    # Removed indexed entries are missing from the documents.
+    jobs[0].JobExtraInfo0 = "shot"
+    jobs[1].JobExtraInfo0 = None
+    jobs[2].getInternalData().taskInfoExtraNameIndexed.pop(3)
+    return jobs
+
+
+def getSnapshotDocument(snapshotPath, idx):
+    with JobSnapshot(snapshotPath) as snapshot:
+        return snapshot.getDocument(idx)
+
+
+@pytest.fixture
+def snapshotPath(tmp_path):
+    return str(tmp_path / "jobs.snapshot")
+
+
+def test_roundTrip(snapshotPath):
+    jobs = createJobs()
+    assert JobSnapshot.write(jobs, snapshotPath) == len(jobs)
+    with JobSnapshot(snapshotPath) as snapshot:
+        assert len(snapshot) == len(jobs)
+        for job, loadedJob in zip(jobs, snapshot):
+            assert loadedJob.serializeWebAPIDocument() == job.serializeWebAPIDocument()
+            assert loadedJob.getInternalData().getChangeSet() == set()
+        assert snapshot[-1].JobName == "shot0004_render"
+        with pytest.raises(IndexError):
+            snapshot.getJob(len(jobs))
+    assert "Ex0" not in getSnapshotDocument(snapshotPath, 1)["Props"]
+    assert "TaskEx3" not in getSnapshotDocument(snapshotPath, 2)["Props"]
+    assert getSnapshotDocument(snapshotPath, 0)["Props"]["Ex0"] == "shot"
+
+
+def test_empty(snapshotPath):
+    assert JobSnapshot.write([], snapshotPath) == 0
+    with JobSnapshot(snapshotPath) as snapshot:
+        assert len(snapshot) == 0
+        assert list(snapshot) == []
+        assert snapshot.getWebAPIValues("status") == []
+
+
+def test_fieldsProjection(snapshotPath):
+    jobs = createJobs()
+    JobSnapshot.write(jobs, snapshotPath)
+    with JobSnapshot(snapshotPath) as snapshot:
+        document = snapshot.getDocument(3, fields=["name", "priority"])
+        assert document == {"Props": {"Name": "shot0003_render", "Pri": 30}}
+        job = snapshot.getJob(3, fields=["name", "environment"])
+        assert job.JobName == "shot0003_render"
+        assert job.GetJobEnvironmentKeyValue("SHOT") == "0003"
+        assert job.JobPriority == Job().JobPriority
+        assert job.getInternalData().getLoadedFields() == {"name", "environment"}
+        assert snapshot.getWebAPIValues("priority") == [0, 10, 20, 30, 40]
+        assert snapshot.getWebAPIValues("status") == [JobStatus.Active.value] * 5
+        with pytest.raises(ValueError):
+            snapshot.getDocument(0, fields=["unknownField"])
+
+
+def test_missingKeyPaths(snapshotPath, monkeypatch):
+    # Snapshots of other versions may lack key paths of this version.
+    jobs = createJobs()
+    keyPaths = Jobs._getSnapshotKeyPaths()
+    monkeypatch.setattr(
+        Jobs,
+        "_getSnapshotKeyPaths",
+        lambda: tuple(keyPath for keyPath in keyPaths if keyPath != ("Props", "Pri")),
+    )
+    JobSnapshot.write(jobs, snapshotPath)
+    monkeypatch.undo()
+    with JobSnapshot(snapshotPath) as snapshot:
+        job = snapshot.getJob(2)
+        assert job.JobName == "shot0002_render"
+        assert job.JobPriority == Job().JobPriority
+        assert snapshot.getWebAPIValues("priority") == [None] * 5
+
+
+def test_truncated(snapshotPath):
+    JobSnapshot.write(createJobs(), snapshotPath)
+    with open(snapshotPath, "rb") as fileObject:
+        data = fileObject.read()
+    for size in range(len(data)):
+        with open(snapshotPath, "wb") as fileObject:
+            fileObject.write(data[:size])
+        with pytest.raises(ValueError, match="truncated"):
+            JobSnapshot(snapshotPath)
+
+
+def test_invalid(snapshotPath):
+    with open(snapshotPath, "wb") as fileObject:
+        fileObject.write(b"\0" * 256)
+    with pytest.raises(ValueError, match="not a job snapshot"):
+        JobSnapshot(snapshotPath)
+
+
+def test_closed(snapshotPath):
+    JobSnapshot.write(createJobs(), snapshotPath)
+    snapshot = JobSnapshot(snapshotPath)
+    job = snapshot.getJob(0)
+    snapshot.close()
+    assert job.JobName == "shot0000_render"
+    with pytest.raises(ValueError, match="closed"):
+        snapshot.getJob(0)
@@ -0,0 +1,102 @@
+"""
+Tests of the deadlinecommand submission files of single jobs
+(Job.serializeSubmissionCommandlineFiles) and multi-job submissions
+(JobList.serializeSubmissionCommandlineFiles).
+"""
+
+import os
+import shutil
+
+from Deadline.Jobs import Job, JobList
+
+
+def createJobs():
+    jobs = []
+    for idx in range(3):
+        job = Job()
+        job.JobName = "shot{:03d}".format(idx)
+        job.JobPlugin = "HoudiniHusk"
+        job.SetJobPluginInfoKeyValue("Enabled", True)
+        job.SetJobPluginInfoKeyValue("Verbose", False)
+        job.SetJobPluginInfoKeyValue("SceneFile", "/mnt/shot{:03d}.usd".format(idx))
+        if idx == 1:
+            job.JobAuxiliarySubmissionFileNames = ["/mnt/aux/scene.usd"]
+        jobs.append(job)
+    return jobs
+
+
+def readLines(filePath):
+    with open(filePath, "r") as fileObject:
+        return fileObject.read().splitlines()
+
+
+def test_singleJobPluginInfoBools(tmp_path):
+    job = createJobs()[0]
+    jobFilePath, pluginFilePath, auxFilePaths = job.serializeSubmissionCommandlineFiles(
+        str(tmp_path / "job_info.job"), str(tmp_path / "plugin_info.job")
+    )
+    pluginLines = readLines(pluginFilePath)
+    assert "Enabled=true" in pluginLines
+    assert "Verbose=false" in pluginLines
+    assert "SceneFile=/mnt/shot000.usd" in pluginLines
+    assert auxFilePaths == []
+
+
+def test_batchPluginInfoBools(tmp_path):
+    argumentFilePath, arguments = JobList.serializeSubmissionCommandlineFiles(
+        createJobs(), directory=str(tmp_path)
+    )
+    for idx in range(3):
+        pluginLines = readLines(str(tmp_path / "job_{}_plugin_info.job".format(idx)))
+        assert "Enabled=true" in pluginLines
+        assert "Verbose=false" in pluginLines
+
+
+def test_batchArgumentFile(tmp_path):
+    argumentFilePath, arguments = JobList.serializeSubmissionCommandlineFiles(
+        createJobs(), directory=str(tmp_path), dependent=True
+    )
+    expected = ["-SubmitMultipleJobs", "-dependent"]
+    for idx in range(3):
+        expected.append("-job")
+        expected.append(str(tmp_path / "job_{}_info.job".format(idx)))
+        expected.append(str(tmp_path / "job_{}_plugin_info.job".format(idx)))
+        if idx == 1:
+            expected.append("/mnt/aux/scene.usd")
+    assert arguments == expected
+    assert readLines(argumentFilePath) == expected
+
+
+def test_batchArgumentFileIndependent(tmp_path):
+    argumentFilePath, arguments = JobList.serializeSubmissionCommandlineFiles(
+        createJobs(), directory=str(tmp_path)
+    )
+    assert arguments[:2] == ["-SubmitMultipleJobs", "-job"]
+    assert "-dependent" not in readLines(argumentFilePath)
+
+
+def test_batchFilesMatchSingleJobFiles(tmp_path):
+    jobs = createJobs()
+    batchDirectory = tmp_path / "batch"
+    batchDirectory.mkdir()
+    JobList.serializeSubmissionCommandlineFiles(jobs, directory=str(batchDirectory))
+    for idx, job in enumerate(jobs):
+        jobFilePath, pluginFilePath, _ = job.serializeSubmissionCommandlineFiles(
+            str(tmp_path / "job_info.job"), str(tmp_path / "plugin_info.job")
+        )
+        batchJobFile = batchDirectory / "job_{}_info.job".format(idx)
+        batchPluginFile = batchDirectory / "job_{}_plugin_info.job".format(idx)
+        with open(jobFilePath, "rb") as fileObject:
+            assert fileObject.read() == batchJobFile.read_bytes()
+        with open(pluginFilePath, "rb") as fileObject:
+            assert fileObject.read() == batchPluginFile.read_bytes()
+
+
+def test_batchDefaultsToTemporaryDirectory():
+    argumentFilePath, arguments = JobList.serializeSubmissionCommandlineFiles(
+        createJobs()
+    )
+    try:
+        assert readLines(argumentFilePath) == arguments
+    finally:
+        shutil.rmtree(os.path.dirname(argumentFilePath))
@@ -0,0 +1,53 @@
+"""
+Tests of the columnar JobTable.
+"""
+
+import pytest
+
+from Deadline.Jobs import DateTime, Job, JobTable
+
+np = pytest.importorskip("numpy")
+
+
+def createJobs():
+    jobs = []
+    for idx in range(6):
+        job = Job()
+        job.JobPool = "pool{}".format(idx % 2)
+        job.JobPriority = 40 + idx * 5
+        data = job.getInternalData()
+        data.statsTasksQueued = idx
+        data.statsJobSubmissionDateTime = DateTime(2024, 1, idx + 1)
+        jobs.append(job)
+    return jobs
+
+
+def test_groupBySum():
+    table = JobTable.fromJobs(createJobs())
+    result = table.groupBy("machinePool", {"statsTasksQueued": "sum"})
+    assert result["machinePool"].tolist() == ["pool0", "pool1"]
+    assert result["count"].tolist() == [3, 3]
+    assert result["statsTasksQueued"].tolist() == [0 + 2 + 4, 1 + 3 + 5]
+
+
+def test_filterRoundTrip():
+    jobs = createJobs()
+    table = JobTable.fromJobs(jobs)
+    selected = table.filter(table.getColumn("priority") > 50)
+    assert selected.getJobs() == jobs[3:]
+
+
+def test_groupByDateTimeMax():
+    table = JobTable.fromJobs(createJobs())
+    result = table.groupBy("machinePool", {"statsJobSubmissionDateTime": "max"})
+    assert result["statsJobSubmissionDateTime"].tolist() == [
+        np.datetime64("2024-01-05", "us").item(),
+        np.datetime64("2024-01-06", "us").item(),
+    ]
+
+
+@pytest.mark.parametrize("function", ["sum", "mean"])
+def test_groupByDateTimeSumIsRejected(function):
+    table = JobTable.fromJobs(createJobs())
+    with pytest.raises(ValueError, match="min or max"):
+        table.groupBy("machinePool", {"statsJobSubmissionDateTime": function})
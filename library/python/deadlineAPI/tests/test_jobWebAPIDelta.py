@@ -0,0 +1,88 @@
+"""
+Tests of Job.serializeWebAPIDelta, the minimal updates of existing jobs.
+"""
+
+import json
+
+from Deadline.Jobs import Job, JobList, JobSnapshot
+
+
+def createJobDocument():
+    """Create a loaded job with all fields serialized."""
+    job = Job()
+    job.getInternalData().id = "5f0000000000000000000001"
+    job.JobExtraInfo0 = "shot010"
+    job.JobExtraInfo1 = "lighting"
+    return job.serializeWebAPIDocument()
+
+
+def test_deserializeStartsClean():
+    job = Job().deserializeWebAPI(createJobDocument())
+    assert job.getInternalData().getChangeSet() == set()
+    assert job.serializeWebAPIDelta() == {
+        "_id": "5f0000000000000000000001",
+        "ConcurrencyToken": None,
+    }
+
+
+def test_deserializeTrackingChanges():
+    job = Job().deserializeWebAPI(createJobDocument(), trackChanges=True)
+    delta = job.serializeWebAPIDelta()
+    assert delta["Props"] == job.serializeWebAPI()["Props"]
+
+
+def test_loadersStartClean(tmp_path):
+    document = createJobDocument()
+    filePath = tmp_path / "jobs.json"
+    filePath.write_text(json.dumps([document, document]))
+    jsonLinesPath = tmp_path / "jobs.jsonl"
+    jobs = [Job().deserializeWebAPI(document)] * 2
+    JobList.writeJSONLines(jobs, str(jsonLinesPath))
+    snapshotPath = tmp_path / "jobs.snapshot"
+    JobSnapshot.write(jobs, str(snapshotPath))
+
+    loaded = [Job().deserializeJSON(json.dumps(document))]
+    loaded.extend(JobList.iterDeserializeWebAPI(str(filePath)))
+    loaded.extend(JobList.iterReadJSONLines(str(jsonLinesPath)))
+    with JobSnapshot(str(snapshotPath)) as snapshot:
+        loaded.extend(snapshot.getJob(idx) for idx in range(len(snapshot)))
+    assert len(loaded) == 7
+    for job in loaded:
+        job.JobPriority = 75
+        assert job.serializeWebAPIDelta()["Props"] == {"Pri": 75}
+
+
+def test_loadersTrackingChanges(tmp_path):
+    document = createJobDocument()
+    filePath = tmp_path / "jobs.json"
+    filePath.write_text(json.dumps([document]))
+    (job,) = JobList.iterDeserializeWebAPI(str(filePath), trackChanges=True)
+    assert "priority" in job.getInternalData().getChangeSet()
+
+
+def test_changedFieldsOnly():
+    job = Job().deserializeWebAPI(createJobDocument())
+    job.JobPriority = 75
+    job.SetJobEnvironmentKeyValue("RESUBMIT", "1")
+    delta = job.serializeWebAPIDelta()
+    assert delta["Props"] == {"Pri": 75, "Env": job.getInternalData().environment}
+
+
+def test_changedExtraInfo():
+    job = Job().deserializeWebAPI(createJobDocument())
+    job.JobExtraInfo1 = "comp"
+    assert job.serializeWebAPIDelta()["Props"] == {"Ex1": "comp"}
+
+
+def test_removedExtraInfoIsCleared():
+    job = Job().deserializeWebAPI(createJobDocument())
+    job.JobExtraInfo0 = None
+    job.getInternalData().taskInfoExtraNameIndexed.pop(3)
+    assert job.serializeWebAPIDelta()["Props"] == {"Ex0": "", "TaskEx3": ""}
+
+
+def test_resetChangeTracker():
+    job = Job().deserializeWebAPI(createJobDocument(), trackChanges=True)
+    job.getInternalData().resetChangeTracker()
+    job.JobExtraInfo0 = None
+    assert job.serializeWebAPIDelta()["Props"] == {"Ex0": ""}
@@ -0,0 +1,346 @@
+"""
+# -----------------------------------------------------------------------------
+#
+# Benchmark Utilities
+#
+# -----------------------------------------------------------------------------
+
+This provides the timing, memory and baseline helpers shared by the
+benchmarks as well as synthetic Deadline WebAPI job documents, so that
+the benchmarks can be run without Deadline.
+"""
+
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+_DEADLINE_API_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+    "deadlineAPI",
+)
+if _DEADLINE_API_ROOT not in sys.path:
+    sys.path.insert(0, _DEADLINE_API_ROOT)
+
+
+RESULTS = {}
+_SECTION = [""]
+
+
+def section(title):
+    """Start a new benchmark section, its title prefixes the result labels.
+    Args:
+        title (str): The section title.
+    """
+    _SECTION[0] = title
+    print(title)
+
+
+def benchmark(label, func, repeat=7, number=20, itemCount=1, memory=True):
+    """Time the given function, measure its peak memory and print the result.
+    The result is also stored under its label in RESULTS.
+    Args:
+        label (str): The benchmark label, unique within its section.
+        func (callable): The function to time.
+        repeat (int): The timing repeat count.
+        number (int): The function calls per timing.
+        itemCount (int): The items processed per function call.
+        memory (bool): Measure the peak memory of a single function call.
+    Returns:
+        dict: The best time per call in seconds, the items per second
+              and the peak memory in bytes.
+    """
+    seconds = min(timeit.repeat(func, repeat=repeat, number=number)) / number
+    peakMemory = 0
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            peakMemory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    result = {
+        "seconds": seconds,
+        "throughput": itemCount / seconds if seconds else 0.0,
+        "peakMemory": peakMemory,
+    }
+    RESULTS["{}: {}".format(_SECTION[0], label.strip())] = result
+    print(
+        "{:<60} {:>10.3f} ms {:>12.0f} /s {:>10.2f} MiB".format(
+            label, seconds * 1000, result["throughput"], peakMemory / 1024**2
+        )
+    )
+    return result
+
+
+def saveBaseline(filePath):
+    """Save the benchmark results as a baseline.
+    Args:
+        filePath (str): The baseline .json file path.
+    """
+    with open(filePath, "w") as baselineFile:
+        json.dump(RESULTS, baselineFile, indent=4, sort_keys=True)
+
+
+def compareBaseline(filePath, tolerance=0.25):
+    """Compare the benchmark results against a baseline and print the changes.
+    Args:
+        filePath (str): The baseline .json file path.
+        tolerance (float): The relative slowdown/memory growth that counts as a regression.
+    Returns:
+        list[str]: The labels of the regressed benchmarks.
+    """
+    with open(filePath, "r") as baselineFile:
+        baseline = json.load(baselineFile)
+    regressions = []
+    print("Baseline comparison ({})".format(filePath))
+    for label, result in RESULTS.items():
+        if label not in baseline:
+            continue
+        timeRatio = result["seconds"] / baseline[label]["seconds"]
+        memoryRatio = (
+            result["peakMemory"] / baseline[label]["peakMemory"]
+            if baseline[label]["peakMemory"]
+            else 1.0
+        )
+        regressed = timeRatio > 1.0 + tolerance or memoryRatio > 1.0 + tolerance
+        if regressed:
+            regressions.append(label)
+        print(
+            "  {:<58} time {:>6.2f}x memory {:>6.2f}x{}".format(
+                label, timeRatio, memoryRatio, "  REGRESSION" if regressed else ""
+            )
+        )
+    return regressions
+
+
+def createFrameString(itemCount, rangeLength=10):
+    """Create a frame string with the given amount of mixed items.
+    Frames wrap around before they exceed 4 digits, as the legacy
+    parser compares range bounds as strings.
+    Args:
+        itemCount (int): The item count.
+        rangeLength (int): The frame count of range items.
+    Returns:
+        str: The frame string.
+    """
+    frameItems = []
+    frame = 1001
+    for idx in range(itemCount):
+        if frame + 5 * rangeLength > 9999:
+            frame = 1001
+        kind = idx % 4
+        if kind == 0:
+            frameItems.append(str(frame))
+            frame += 3
+        elif kind == 1:
+            frameItems.append("{}-{}".format(frame, frame + rangeLength - 1))
+            frame += rangeLength + 2
+        elif kind == 2:
+            frameItems.append("{}-{}x2".format(frame, frame + 2 * rangeLength))
+            frame += 2 * rangeLength + 5
+        else:
+            frameItems.append("{}:{}:5".format(frame, frame + 5 * rangeLength))
+            frame += 5 * rangeLength + 5
+    return ",".join(frameItems)
+
+
+def createJobDocument(
+    idx=0,
+    frames="1001-1100",
+    environmentCount=10,
+    pluginInfoCount=10,
+    dependencyCount=2,
+    outputCount=2,
+):
+    """Create a synthetic Deadline WebAPI job document.
+    Args:
+        idx (int): The job index, used to vary the names and ids.
+        frames (str): The frame string.
+        environmentCount (int): The environment key count.
+        pluginInfoCount (int): The plugin info key count.
+        dependencyCount (int): The job dependency count.
+        outputCount (int): The output directory/file name count.
+    Returns:
+        dict: The job document.
+    """
+    props = {
+        "Name": "shot{:04d}_render".format(idx),
+        "Batch": "seq{:03d}".format(idx // 100),
+        "Pri": 50,
+        "Protect": False,
+        "User": "artist{}".format(idx % 7),
+        "Dept": "lighting",
+        "Cmmt": "",
+        "Frames": frames,
+        "Chunk": 5,
+        "Seq": False,
+        "Env": {
+            "KEY_{}".format(envIdx): "value_{}".format(envIdx)
+            for envIdx in range(environmentCount)
+        },
+        "EnvOnly": False,
+        "ExDic": {"Shot": "shot{:04d}".format(idx)},
+        "PathMap": [
+            {
+                "Path": "/mnt/projects",
+                "WindowsPath": "P:",
+                "LinuxPath": "/mnt/projects",
+                "MacPath": "/Volumes/projects",
+                "CaseSensitive": True,
+                "RegularExpression": False,
+                "Region": "",
+            }
+        ],
+        "AuxSync": False,
+        "Limits": ["houdini"],
+        "Pool": "pool{}".format(idx % 3),
+        "SecPool": "",
+        "Grp": "gpu",
+        "MachLmt": 0,
+        "MachLmtProg": 100.0,
+        "White": False,
+        "ListedSlaves": [],
+        "Conc": 1,
+        "ConcLimt": True,
+        "SndWarn": False,
+        "JobFailOvr": False,
+        "JobFailErr": 0,
+        "TskFailOvr": False,
+        "TskFailErr": 0,
+        "NoBad": False,
+        "Int": False,
+        "IntPer": 100,
+        "RemTmT": 0,
+        "StartTime": 0,
+        "InitializePluginTime": 0,
+        "MinTime": 0,
+        "MaxTime": 0,
+        "TimeScrpt": True,
+        "AutoTime": False,
+        "FrameTimeout": False,
+        "OnComp": 2,
+        "Timeout": 1,
+        "OvrTaskEINames": False,
+        "PlugInfo": {
+            "Key{}".format(infoIdx): "/mnt/projects/shot{:04d}/{}.usd".format(idx, infoIdx)
+            for infoIdx in range(pluginInfoCount)
+        },
+        "Reload": False,
+        "PlugDir": "",
+        "EventOI": [],
+        "NoEvnt": False,
+        "EventDir": "",
+        "PrJobScrp": "",
+        "PoJobScrp": "",
+        "PrTskScrp": "",
+        "PoTskScrp": "",
+        "DepComp": True,
+        "DepDel": False,
+        "DepFail": False,
+        "DepPer": -1,
+        "DepFrame": False,
+        "DepFrameStart": 0,
+        "DepFrameEnd": 0,
+        "Dep": [
+            {
+                "JobID": "{:024x}".format(depIdx),
+                "Notes": "",
+                "IgnoreFrameOffsets": False,
+                "OverrideFrameOffsets": False,
+                "StartOffset": 0,
+                "EndOffset": 0,
+                "OverrideResumeOn": False,
+                "ResumeOnComplete": True,
+                "ResumeOnDeleted": False,
+                "ResumeOnFailed": False,
+                "ResumeOnPercentageCompleted": False,
+                "ResumeOnPercentageValue": 100.0,
+            }
+            for depIdx in range(dependencyCount)
+        ],
+        "ReqAss": [],
+        "ScrDep": [],
+        "OverAutoClean": False,
+        "OverCleanType": 0,
+        "OverClean": False,
+        "OverCleanDays": 0,
+        "Tasks": 20,
+        "NotOvr": False,
+        "NotUser": ["artist{}".format(idx % 7)],
+        "SndPopup": False,
+        "SndEmail": False,
+        "NotEmail": [],
+        "NotNote": "",
+        "Schd": 0,
+        "SchdDays": 1,
+        "SchdDate": "0001-01-01T00:00:00Z",
+        "SchdStop": "0001-01-01T00:00:00Z",
+    }
+    for day in ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"):
+        props[day + "Start"] = "-10675199.02:48:05.4775808"
+        props[day + "Stop"] = "-10675199.02:48:05.4775808"
+    for extraIdx in range(10):
+        props["Ex{}".format(extraIdx)] = ""
+        props["TaskEx{}".format(extraIdx)] = ""
+    return {
+        "_id": "{:024x}".format(idx),
+        "Props": props,
+        "OutDir": ["/mnt/projects/render/{}".format(outIdx) for outIdx in range(outputCount)],
+        "OutFile": ["beauty{}.####.exr".format(outIdx) for outIdx in range(outputCount)],
+        "Aux": [],
+        "Stat": 1,
+        "Plug": "HoudiniHusk",
+        "Mach": "ws{:02d}".format(idx % 20),
+        "Date": "2023-05-01T10:00:00.123Z",
+        "DateStart": "0001-01-01T00:00:00Z",
+        "DateComp": "0001-01-01T00:00:00Z",
+        "Errs": 0,
+        "QueuedChunks": 20,
+        "RenderingChunks": 0,
+        "PendingChunks": 0,
+        "CompletedChunks": 0,
+        "SuspendedChunks": 0,
+        "FailedChunks": 0,
+        "Main": False,
+        "MainStart": 0,
+        "MainEnd": 0,
+        "Tile": False,
+        "TileFrame": 0,
+        "TileFile": [],
+        "TileCount": 0,
+        "TileX": 0,
+        "TileY": 0,
+    }
+
+
+def createRealisticJobDocuments(count=1000):
+    """Create job documents the size of a typical render submission.
+    Args:
+        count (int): The document count.
+    Returns:
+        list[dict]: The job documents.
+    """
+    return [createJobDocument(idx) for idx in range(count)]
+
+
+def createPathologicalJobDocuments(count=10):
+    """Create oversized job documents (huge frame strings,
+    environments, plugin infos and dependency lists).
+    Args:
+        count (int): The document count.
+    Returns:
+        list[dict]: The job documents.
+    """
+    return [
+        createJobDocument(
+            idx,
+            frames=createFrameString(5000),
+            environmentCount=2000,
+            pluginInfoCount=2000,
+            dependencyCount=500,
+            outputCount=50,
+        )
+        for idx in range(count)
+    ]
@@ -0,0 +1,206 @@
+"""
+# -----------------------------------------------------------------------------
+#
+# FrameList Benchmarks
+#
+# -----------------------------------------------------------------------------
+
+This compares the FrameList frame string parser/encoder against the previous
+implementations. It can be run directly without Deadline:
+    python frameList.py
+or as part of the benchmark suite via run.py.
+"""
+
+import copy
+import re
+
+from common import benchmark, createFrameString, section
+
+from Deadline.Jobs import FrameList
+
+
+def legacyConvertFrameStringToFrameList(frameStr):
+    """The previous FrameList.convertFrameStringToFrameList implementation."""
+    frameStr = frameStr.replace("step", "x")
+    frameStr = frameStr.replace("by", "x")
+    frameStr = frameStr.replace("every", "x")
+    frameItems = re.split(",| ", frameStr)
+    frameItems = [i for i in frameItems if i]
+    frameList = []
+    for frameItem in frameItems:
+        if frameItem.count(":") == 2:
+            frameStart, frameEnd, frameStep = frameItem.split(":")
+            frameList.extend(range(int(frameStart), int(frameEnd) + 1, int(frameStep)))
+        elif frameItem.count("-") == 1 and (
+            frameItem.count(":") == 1 or frameItem.count("x") == 1
+        ):
+            frameRange, frameStep = re.split(":|x", frameItem)
+            frameStart, frameEnd = frameRange.split("-")
+            if frameEnd < frameStart:
+                frameRange = reversed(
+                    range(int(frameEnd), int(frameStart) + 1, int(frameStep))
+                )
+            else:
+                frameRange = range(int(frameStart), int(frameEnd) + 1, int(frameStep))
+            frameList.extend(frameRange)
+        elif frameItem.count("-") == 1:
+            frameStart, frameEnd = frameItem.split("-")
+            if frameEnd < frameStart:
+                frameRange = reversed(range(int(frameEnd), int(frameStart) + 1))
+            else:
+                frameRange = range(int(frameStart), int(frameEnd) + 1)
+            frameList.extend(frameRange)
+        else:
+            frameList.append(int(frameItem))
+    return frameList
+
+
+def legacyConvertFrameListToFrameString(frameList):
+    """The previous FrameList.convertFrameListToFrameString implementation."""
+    frameList = list(copy.deepcopy(frameList))
+    if len(frameList) == 0:
+        return ""
+    elif len(frameList) == 1:
+        return str(frameList[0])
+    elif len(frameList) == 2:
+        return ",".join([str(f) for f in frameList])
+    frameString = []
+    frameStack = []
+    frameIntervals = set()
+    framePreviousInterval = -1
+    framePrevious = []
+    frameIter = 0
+    for frame in frameList:
+        frameIter += 1
+        if framePrevious:
+            frameIntervals.add(abs(frame - framePrevious[-1]))
+        framePrevious.append(frame)
+        frameStack.append(frame)
+        if frameIter == 1:
+            continue
+        if len(frameIntervals) == 1:
+            framePreviousInterval = list(frameIntervals)[0]
+            if frameIter != len(frameList):
+                continue
+        if framePreviousInterval != -1:
+            if framePreviousInterval != 1:
+                if len(frameStack) > 3:
+                    if frameIter != len(frameList):
+                        frameString.append(
+                            "{}-{}x{}".format(
+                                frameStack[0], frameStack[-2], framePreviousInterval
+                            )
+                        )
+                    else:
+                        frameString.append(
+                            "{}-{}x{}".format(
+                                frameStack[0], frameStack[-1], framePreviousInterval
+                            )
+                        )
+                else:
+                    frameString.extend([str(f) for f in frameStack[:-1]])
+                    frameString.append(str(frameStack[-1]))
+            else:
+                if frameIter != len(frameList):
+                    frameString.append("{}-{}".format(frameStack[0], frameStack[-2]))
+                else:
+                    frameString.append("{}-{}".format(frameStack[0], frameStack[-1]))
+        else:
+            frameString.extend([str(f) for f in frameStack[:-1]])
+        frameStack = frameStack[-1:]
+        frameIntervals.clear()
+        framePreviousInterval = -1
+    return ",".join(frameString)
+
+
+def benchmarkConvertFrameStringToFrameList(itemCount=10000, rangeLength=10):
+    frameStr = createFrameString(itemCount, rangeLength=rangeLength)
+    assert FrameList.convertFrameStringToFrameList(
+        frameStr
+    ) == legacyConvertFrameStringToFrameList(frameStr)
+    frameCount = len(legacyConvertFrameStringToFrameList(frameStr))
+    section(
+        "Parse frame string ({} items, {} frames per range)".format(
+            itemCount, rangeLength
+        )
+    )
+    legacy = benchmark(
+        "  legacy convertFrameStringToFrameList",
+        lambda: legacyConvertFrameStringToFrameList(frameStr),
+        repeat=3,
+        number=2,
+        itemCount=frameCount,
+    )
+    benchmark(
+        "  convertFrameStringToFrameList",
+        lambda: FrameList.convertFrameStringToFrameList(frameStr),
+        itemCount=frameCount,
+    )
+    current = benchmark(
+        "  convertFrameStringToFrameSet (uncached)",
+        lambda: FrameList.convertFrameStringToFrameSet(frameStr, cache=False),
+        itemCount=frameCount,
+    )
+    benchmark(
+        "  convertFrameStringToFrameSet (cached)",
+        lambda: FrameList.convertFrameStringToFrameSet(frameStr),
+        itemCount=frameCount,
+    )
+    print(
+        "  speedup (FrameSet vs legacy): {:.1f}x".format(
+            legacy["seconds"] / current["seconds"]
+        )
+    )
+
+
+def benchmarkConvertFrameListToFrameString(frameCount=1000000):
+    # A sim cache style frame list with a few holes and a stepped tail.
+    frameList = list(range(1, frameCount // 2))
+    frameList.extend(range(frameCount // 2 + 10, frameCount, 1))
+    frameList.extend(range(frameCount, frameCount * 2, 4))
+    assert FrameList.convertFrameStringToFrameList(
+        FrameList.convertFrameListToFrameString(frameList)
+    ) == frameList
+    section("Format frame list ({} frames)".format(len(frameList)))
+    legacy = benchmark(
+        "  legacy convertFrameListToFrameString",
+        lambda: legacyConvertFrameListToFrameString(frameList),
+        repeat=1,
+        number=1,
+        itemCount=len(frameList),
+        memory=False,
+    )
+    current = benchmark(
+        "  convertFrameListToFrameString (list)",
+        lambda: FrameList.convertFrameListToFrameString(frameList),
+        repeat=3,
+        number=1,
+        itemCount=len(frameList),
+    )
+    benchmark(
+        "  convertFrameListToFrameString (generator)",
+        lambda: FrameList.convertFrameListToFrameString(f for f in frameList),
+        repeat=3,
+        number=1,
+        itemCount=len(frameList),
+    )
+    benchmark(
+        "  convertFrameListToFrameString (range)",
+        lambda: FrameList.convertFrameListToFrameString(range(1, frameCount)),
+        itemCount=frameCount - 1,
+    )
+    print(
+        "  speedup (list vs legacy): {:.1f}x".format(
+            legacy["seconds"] / current["seconds"]
+        )
+    )
+
+
+def run():
+    benchmarkConvertFrameStringToFrameList(rangeLength=10)
+    benchmarkConvertFrameStringToFrameList(rangeLength=200)
+    benchmarkConvertFrameListToFrameString()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,315 @@
+"""
+# -----------------------------------------------------------------------------
+#
+# Job Benchmarks
+#
+# -----------------------------------------------------------------------------
+
+This times the Job construction and (de)serialization hot paths over
+synthetic job documents of realistic and pathological size.
+It can be run directly without Deadline:
+    python jobs.py
+or as part of the benchmark suite via run.py.
+"""
+
+import copy
+import json
+import os
+import tempfile
+
+from common import (
+    benchmark,
+    createPathologicalJobDocuments,
+    createRealisticJobDocuments,
+    section,
+)
+
+from Deadline.Jobs import Job, JobDiff, JobList, JobSnapshot, JobTable, np, orjson
+
+
+def benchmarkJobConstruction(jobCount=1000):
+    section("Job construction ({} jobs)".format(jobCount))
+    benchmark(
+        "  Job()",
+        lambda: [Job() for _ in range(jobCount)],
+        repeat=5,
+        number=1,
+        itemCount=jobCount,
+    )
+
+
+def benchmarkJobSerialization(label, jobDocuments, repeat=5):
+    """Time the serialization hot paths over the given job documents.
+    Args:
+        label (str): The job documents label.
+        jobDocuments (list[dict]): The job documents.
+        repeat (int): The timing repeat count.
+    """
+    jobCount = len(jobDocuments)
+    jobs = [Job().deserializeWebAPI(jobDocument) for jobDocument in jobDocuments]
+    modifiedJobs = []
+    for job in jobs:
+        modifiedJob = job.duplicateJob()
+        modifiedJob.getInternalData().resetChangeTracker()
+        modifiedJob.JobName = "{}_v002".format(job.JobName)
+        modifiedJob.JobPriority = 75
+        modifiedJob.SetJobEnvironmentKeyValue("RESUBMIT", "1")
+        modifiedJobs.append(modifiedJob)
+
+    section("{} ({} jobs)".format(label, jobCount))
+    benchmark(
+        "  deserializeWebAPI",
+        lambda: [Job().deserializeWebAPI(jobDocument) for jobDocument in jobDocuments],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    listingDocuments = [
+        {
+            "_id": jobDocument["_id"],
+            "Stat": jobDocument["Stat"],
+            "Props": {
+                key: jobDocument["Props"][key]
+                for key in ("Name", "Batch", "User", "Pool", "Grp", "Pri")
+            },
+        }
+        for jobDocument in jobDocuments
+    ]
+    benchmark(
+        "  deserializeWebAPI (partial, projected listing)",
+        lambda: [
+            Job().deserializeWebAPI(listingDocument, partial=True)
+            for listingDocument in listingDocuments
+        ],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    benchmark(
+        "  serializeWebAPI",
+        lambda: [job.serializeWebAPI() for job in jobs],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    benchmark(
+        "  serializeSubmissionCommandlineDictionaries",
+        lambda: [job.serializeSubmissionCommandlineDictionaries() for job in jobs],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    benchmark(
+        "  duplicateJob",
+        lambda: [job.duplicateJob() for job in jobs],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    benchmark(
+        "  copy.deepcopy (duplicateJob reference)",
+        lambda: [copy.deepcopy(job.getInternalData()) for job in jobs],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    defaultJob = Job()
+    benchmark(
+        "  JobDiff.diffMany (against the job defaults)",
+        lambda: JobDiff.diffMany(defaultJob, jobs),
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+    benchmark(
+        "  applyChangeSet",
+        lambda: [
+            job.applyChangeSet(modifiedJob)
+            for job, modifiedJob in zip(jobs, modifiedJobs)
+        ],
+        repeat=repeat,
+        number=1,
+        itemCount=jobCount,
+    )
+
+
+def benchmarkJobDumpLoading(label, jobDocuments, repeat=3):
+    """Time loading a Jobs.GetJobs() dump as a whole vs streaming it.
+    Args:
+        label (str): The job documents label.
+        jobDocuments (list[dict]): The job documents.
+        repeat (int): The timing repeat count.
+    """
+    jobCount = len(jobDocuments)
+    fileHandle, filePath = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fileHandle, "w") as dumpFile:
+            json.dump(jobDocuments, dumpFile)
+
+        def loadDump():
+            with open(filePath, "r") as dumpFile:
+                for jobDocument in json.load(dumpFile):
+                    Job().deserializeWebAPI(jobDocument)
+
+        def streamDump():
+            for _ in JobList.iterDeserializeWebAPI(filePath):
+                pass
+
+        def streamDumpFields():
+            for _ in JobList.iterDeserializeWebAPI(
+                filePath, fields=("id", "name", "status", "userName")
+            ):
+                pass
+
+        section("{} dump ({} jobs)".format(label, jobCount))
+        benchmark("  json.load + deserializeWebAPI", loadDump, repeat, 1, jobCount)
+        benchmark("  JobList.iterDeserializeWebAPI", streamDump, repeat, 1, jobCount)
+        benchmark(
+            "  JobList.iterDeserializeWebAPI (4 fields)",
+            streamDumpFields,
+            repeat,
+            1,
+            jobCount,
+        )
+    finally:
+        os.remove(filePath)
+
+
+def benchmarkJobJSONLines(label, jobDocuments, repeat=3):
+    """Time the JSON-lines export and import per available codec.
+    Args:
+        label (str): The job documents label.
+        jobDocuments (list[dict]): The job documents.
+        repeat (int): The timing repeat count.
+    """
+    jobCount = len(jobDocuments)
+    jobs = [Job().deserializeWebAPI(jobDocument) for jobDocument in jobDocuments]
+    fileHandle, filePath = tempfile.mkstemp(suffix=".jsonl")
+    os.close(fileHandle)
+    try:
+        section("{} JSON-lines ({} jobs)".format(label, jobCount))
+        for codec in ("json", "orjson") if orjson is not None else ("json",):
+            benchmark(
+                "  JobList.writeJSONLines ({})".format(codec),
+                lambda: JobList.writeJSONLines(jobs, filePath, codec=codec),
+                repeat,
+                1,
+                jobCount,
+            )
+            benchmark(
+                "  JobList.iterReadJSONLines ({})".format(codec),
+                lambda: list(JobList.iterReadJSONLines(filePath, codec=codec)),
+                repeat,
+                1,
+                jobCount,
+            )
+    finally:
+        os.remove(filePath)
+
+
+def benchmarkJobSnapshot(label, jobDocuments, repeat=3):
+    """Time writing, opening and reading a binary job snapshot.
+    Args:
+        label (str): The job documents label.
+        jobDocuments (list[dict]): The job documents.
+        repeat (int): The timing repeat count.
+    """
+    jobCount = len(jobDocuments)
+    jobs = [Job().deserializeWebAPI(jobDocument) for jobDocument in jobDocuments]
+    fileHandle, filePath = tempfile.mkstemp(suffix=".snap")
+    os.close(fileHandle)
+    try:
+        section("{} snapshot ({} jobs)".format(label, jobCount))
+        benchmark(
+            "  JobSnapshot.write",
+            lambda: JobSnapshot.write(jobs, filePath),
+            repeat,
+            1,
+            jobCount,
+        )
+
+        def openSnapshot():
+            with JobSnapshot(filePath) as snapshot:
+                snapshot.getJob(jobCount // 2)
+
+        def readStatuses():
+            with JobSnapshot(filePath) as snapshot:
+                snapshot.getWebAPIValues("status")
+
+        def readSnapshot():
+            with JobSnapshot(filePath) as snapshot:
+                for _ in snapshot:
+                    pass
+
+        benchmark("  JobSnapshot open + getJob", openSnapshot, repeat, 1, 1)
+        benchmark(
+            "  JobSnapshot open + getWebAPIValues (status)",
+            readStatuses,
+            repeat,
+            1,
+            jobCount,
+        )
+        benchmark("  JobSnapshot open + iterate", readSnapshot, repeat, 1, jobCount)
+    finally:
+        os.remove(filePath)
+
+
+def benchmarkJobTable(label, jobDocuments, repeat=3):
+    """Time the columnar job table against plain Python loops.
+    Args:
+        label (str): The job documents label.
+        jobDocuments (list[dict]): The job documents.
+        repeat (int): The timing repeat count.
+    """
+    jobCount = len(jobDocuments)
+    jobs = [Job().deserializeWebAPI(jobDocument) for jobDocument in jobDocuments]
+
+    def queuedTasksPerPool():
+        queuedTasks = {}
+        for job in jobs:
+            data = job.getInternalData()
+            queuedTasks[job.JobPool] = (
+                queuedTasks.get(job.JobPool, 0) + data.statsTasksQueued
+            )
+        return queuedTasks
+
+    section("{} table ({} jobs)".format(label, jobCount))
+    benchmark(
+        "  queued tasks per pool (Python loop)", queuedTasksPerPool, repeat, 1, jobCount
+    )
+    if np is None:
+        return
+    table = JobTable.fromJobs(jobs)
+    benchmark(
+        "  JobTable.fromJobs", lambda: JobTable.fromJobs(jobs), repeat, 1, jobCount
+    )
+    benchmark(
+        "  JobTable.groupBy (queued tasks per pool)",
+        lambda: table.groupBy("machinePool", {"statsTasksQueued": "sum"}),
+        repeat,
+        1,
+        jobCount,
+    )
+    benchmark(
+        "  JobTable.filter + groupBy (jobs per user over priority 50)",
+        lambda: table.filter(table.getColumn("priority") > 50).groupBy("userName"),
+        repeat,
+        1,
+        jobCount,
+    )
+
+
+def run():
+    benchmarkJobConstruction()
+    benchmarkJobSerialization("Realistic jobs", createRealisticJobDocuments(1000))
+    benchmarkJobSerialization(
+        "Pathological jobs", createPathologicalJobDocuments(10), repeat=3
+    )
+    benchmarkJobDumpLoading("Realistic jobs", createRealisticJobDocuments(1000))
+    benchmarkJobJSONLines("Realistic jobs", createRealisticJobDocuments(1000))
+    benchmarkJobSnapshot("Realistic jobs", createRealisticJobDocuments(10000))
+    benchmarkJobTable("Realistic jobs", createRealisticJobDocuments(10000))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,58 @@
+"""
+# -----------------------------------------------------------------------------
+#
+# Benchmark Suite
+#
+# -----------------------------------------------------------------------------
+
+This runs all benchmarks without Deadline and optionally saves the results
+as a baseline or compares them against a previously saved baseline:
+    python run.py --save baseline.json
+    python run.py --compare baseline.json
+The comparison exits with a non-zero exit code if a benchmark regressed.
+"""
+
+import argparse
+import sys
+
+import common
+import frameList
+import jobs
+
+SUITES = {
+    "frameList": frameList.run,
+    "jobs": jobs.run,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument(
+        "--suite",
+        choices=sorted(SUITES),
+        action="append",
+        help="The suite to run, all suites are run by default.",
+    )
+    parser.add_argument("--save", help="Save the results as a baseline .json file.")
+    parser.add_argument("--compare", help="Compare the results against a baseline .json file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="The relative slowdown/memory growth that counts as a regression.",
+    )
+    args = parser.parse_args()
+
+    for suite in args.suite or sorted(SUITES):
+        SUITES[suite]()
+    if args.save:
+        common.saveBaseline(args.save)
+    if args.compare:
+        regressions = common.compareBaseline(args.compare, tolerance=args.tolerance)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,8 +26,9 @@ def check_for_pending_review_release(job_id, task_ids=None):
         return job_release_state
     
     # Handle task dependencies
-    job_frames = job.JobFramesList
-    job_tasks = list(range(len(job_frames)))
+    # The task count honors the frames per task, the
+    # range avoids building a list for every task.
+    job_tasks = range(job.JobTaskCount)
     if job_release_state:
         return [str(t) for t in job_tasks]
 